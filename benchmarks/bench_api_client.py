@@ -0,0 +1,149 @@
+import argparse
+import gzip
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import asdict
+from datetime import UTC, datetime
+from pathlib import Path
+
+import httpx
+
+from saastesa.core.compression import ContentEncoding
+from saastesa.core.models import ThreatSignal
+from saastesa.core.serialization import dumps_json
+from saastesa.sdk.api_client import TESAApiClient
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Per-request cost of fresh vs pooled TESAApiClient sessions"
+    )
+    parser.add_argument("--agents", type=int, default=2000, help="Simulated agents")
+    parser.add_argument("--polls", type=int, default=3, help="Polls per agent")
+    parser.add_argument("--signals", type=int, default=50, help="Signals per poll")
+    parser.add_argument("--plain-http", action="store_true", help="Skip TLS")
+    return parser
+
+
+def make_signals(count: int) -> list[ThreatSignal]:
+    now = datetime.now(tz=UTC)
+    return [
+        ThreatSignal(
+            source="cspm",
+            signal_type=f"bench_transport_{index}",
+            severity=index % 5 + 1,
+            detected_at=now,
+            metadata={
+                "asset_id": f"asset-{index}",
+                "region": "eu-west-1",
+                "internet_exposed": True,
+            },
+        )
+        for index in range(count)
+    ]
+
+
+@contextmanager
+def api_server(workdir: Path, tls: bool) -> Iterator[tuple[str, str | bool]]:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    command = [
+        sys.executable, "-m", "uvicorn", "saastesa.api.main:create_app", "--factory",
+        "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning",
+        "--timeout-keep-alive", "75",
+    ]
+    verify: str | bool = False
+    if tls:
+        cert, key = workdir / "cert.pem", workdir / "key.pem"
+        subprocess.run(
+            ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+             "-subj", "/CN=127.0.0.1", "-addext", "subjectAltName=IP:127.0.0.1",
+             "-keyout", str(key), "-out", str(cert)],
+            check=True, capture_output=True,
+        )
+        command += ["--ssl-keyfile", str(key), "--ssl-certfile", str(cert)]
+        verify = str(cert)
+    env = {**os.environ, "TESA_DATABASE_URL": f"sqlite+pysqlite:///{workdir / 'bench.db'}"}
+    server = subprocess.Popen(command, env=env)
+    base_url = f"{'https' if tls else 'http'}://127.0.0.1:{port}"
+    try:
+        for _ in range(100):
+            try:
+                httpx.get(f"{base_url}/health", verify=verify, timeout=1)
+                break
+            except httpx.TransportError:
+                time.sleep(0.1)
+        yield base_url, verify
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def measure(label: str, requests: int, run: Callable[[list[float]], None]) -> None:
+    latencies: list[float] = []
+    cpu_started = time.process_time()
+    started = time.perf_counter()
+    run(latencies)
+    elapsed = time.perf_counter() - started
+    cpu = time.process_time() - cpu_started
+    quantiles = statistics.quantiles(latencies, n=20)
+    print(
+        f"{label:<30} p50 {statistics.median(latencies) * 1000:6.2f} ms  "
+        f"p95 {quantiles[-1] * 1000:6.2f} ms  client CPU {cpu / requests * 1000:6.2f} ms/req  "
+        f"wall {elapsed:6.1f} s"
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    signals = make_signals(args.signals)
+    requests = args.agents * args.polls
+    raw = dumps_json(
+        {"signals": [{**asdict(s), "detected_at": s.detected_at.isoformat()} for s in signals]}
+    )
+    print(
+        f"{args.agents} agents x {args.polls} polls, {args.signals} signals/poll: body "
+        f"{len(raw):,} B, gzip {len(gzip.compress(raw)):,} B"
+    )
+
+    with (
+        tempfile.TemporaryDirectory() as workdir,
+        api_server(Path(workdir), not args.plain_http) as (base_url, verify),
+    ):
+
+        def fresh_client_per_request(latencies: list[float]) -> None:
+            for _ in range(requests):
+                started = time.perf_counter()
+                with TESAApiClient(base_url, verify=verify) as client:
+                    client.send_signals(signals)
+                latencies.append(time.perf_counter() - started)
+
+        def pooled_client_per_agent(encoding: ContentEncoding) -> Callable[[list[float]], None]:
+            def run(latencies: list[float]) -> None:
+                for _ in range(args.agents):
+                    with TESAApiClient(base_url, verify=verify, compression=encoding) as client:
+                        for _ in range(args.polls):
+                            started = time.perf_counter()
+                            client.send_signals(signals)
+                            latencies.append(time.perf_counter() - started)
+
+            return run
+
+        measure("fresh client per request", requests, fresh_client_per_request)
+        identity = pooled_client_per_agent(ContentEncoding.IDENTITY)
+        measure("pooled client per agent", requests, identity)
+        gzipped = pooled_client_per_agent(ContentEncoding.GZIP)
+        measure("pooled client + gzip bodies", requests, gzipped)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
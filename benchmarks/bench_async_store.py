@@ -0,0 +1,87 @@
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from collections.abc import Sequence
+from pathlib import Path
+
+import httpx
+from bench_bulk_ingest import make_findings
+
+from saastesa.api.db import create_db_engine
+from saastesa.api.main import create_app
+from saastesa.api.repository import SQLAlchemyFindingStore
+
+_PATHS = (
+    "/api/v1/findings?limit=100",
+    "/api/v1/summary",
+    "/api/v1/analytics/counts?group_by=source",
+)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Compare sync and async store request concurrency")
+    parser.add_argument(
+        "--rows", type=int, default=20_000, help="Findings to load before measuring"
+    )
+    parser.add_argument(
+        "--concurrency", default="1,16,64,256", help="Comma separated in-flight request counts"
+    )
+    parser.add_argument("--requests", type=int, default=1024, help="Requests issued per run")
+    return parser
+
+
+async def drive(database_url: str, concurrency: int, total: int) -> tuple[float, float]:
+    app = create_app(database_url)
+    latencies: list[float] = []
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            queue: asyncio.Queue[str] = asyncio.Queue()
+            for index in range(total):
+                queue.put_nowait(_PATHS[index % len(_PATHS)])
+
+            async def worker() -> None:
+                while not queue.empty():
+                    path = queue.get_nowait()
+                    started = time.perf_counter()
+                    response = await client.get(path)
+                    response.raise_for_status()
+                    latencies.append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+            elapsed = time.perf_counter() - started
+    return total / elapsed, statistics.quantiles(latencies, n=20)[-1]
+
+
+def run(rows: int, levels: list[int], total: int) -> None:
+    with tempfile.TemporaryDirectory() as workdir:
+        path = Path(workdir) / "bench.db"
+        store = SQLAlchemyFindingStore(create_db_engine(f"sqlite+pysqlite:///{path}"))
+        store.init()
+        store.add(make_findings(rows, assets=500))
+        store.engine.dispose()
+
+        for label, url in (
+            ("sync store (threadpool)", f"sqlite+pysqlite:///{path}"),
+            ("async store (aiosqlite)", f"sqlite+aiosqlite:///{path}"),
+        ):
+            for concurrency in levels:
+                throughput, p95 = asyncio.run(drive(url, concurrency, total))
+                print(
+                    f"{label:<26} concurrency={concurrency:<4} "
+                    f"{throughput:8.1f} req/s  p95 {p95 * 1000:8.1f} ms"
+                )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    levels = [int(level) for level in args.concurrency.split(",") if level]
+    run(args.rows, levels, args.requests)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,77 @@
+import argparse
+import tempfile
+import time
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from saastesa.api.db import create_db_engine
+from saastesa.api.repository import SQLAlchemyFindingStore
+from saastesa.core.models import SecurityFinding, ThreatSignal
+from saastesa.core.risk_scoring import build_finding
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Measure SQLAlchemyFindingStore.add throughput")
+    parser.add_argument(
+        "--database-url", default="", help="Target database (defaults to a temp SQLite file)"
+    )
+    parser.add_argument("--sizes", default="1000,10000,100000", help="Comma separated batch sizes")
+    parser.add_argument("--assets", type=int, default=500, help="Distinct resources per batch")
+    return parser
+
+
+def make_findings(count: int, assets: int, offset: int = 0) -> list[SecurityFinding]:
+    start = datetime(2026, 1, 1, tzinfo=UTC)
+    return [
+        build_finding(
+            ThreatSignal(
+                source="cspm",
+                signal_type=f"bench_{offset + index}",
+                severity=index % 5 + 1,
+                detected_at=start + timedelta(seconds=index),
+                metadata={
+                    "asset_id": f"asset-{index % assets}",
+                    "internet_exposed": index % 2 == 0,
+                    "cve": [f"CVE-2026-{index % 997:04d}"],
+                    "mitre_attack": ["T1190"],
+                },
+            )
+        )
+        for index in range(count)
+    ]
+
+
+def run(database_url: str, sizes: Sequence[int], assets: int) -> None:
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as workdir:
+            url = database_url or f"sqlite+pysqlite:///{Path(workdir) / 'bench.db'}"
+            store = SQLAlchemyFindingStore(create_db_engine(url))
+            store.init()
+            findings = make_findings(size, assets, offset=size)
+
+            started = time.perf_counter()
+            store.add(findings)
+            insert_seconds = time.perf_counter() - started
+
+            started = time.perf_counter()
+            store.add(findings)
+            upsert_seconds = time.perf_counter() - started
+
+            print(
+                f"{size:>8} findings | insert {insert_seconds:7.2f}s "
+                f"({size / insert_seconds:9.0f}/s) | re-upsert {upsert_seconds:7.2f}s "
+                f"({size / upsert_seconds:9.0f}/s)"
+            )
+            store.engine.dispose()
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    run(args.database_url, sizes, args.assets)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,76 @@
+import argparse
+import json
+import statistics
+import tempfile
+import time
+from collections.abc import Callable, Sequence
+from pathlib import Path
+
+from bench_bulk_ingest import make_findings
+from pydantic import TypeAdapter
+
+from saastesa.api.db import create_db_engine
+from saastesa.api.main import _to_findings_out
+from saastesa.api.repository import SQLAlchemyFindingStore
+from saastesa.api.schemas import SecurityFindingOut
+from saastesa.core.serialization import JSON_ENCODER, dumps_json
+
+_RESPONSE_ADAPTER = TypeAdapter(list[SecurityFindingOut])
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Compare GET /api/v1/findings serialization paths")
+    parser.add_argument(
+        "--database-url", default="", help="Target database (defaults to a temp SQLite file)"
+    )
+    parser.add_argument(
+        "--rows", type=int, default=20_000, help="Findings to load before measuring"
+    )
+    parser.add_argument("--limit", type=int, default=1000, help="Page size to serialize")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed runs per path")
+    return parser
+
+
+def model_path(store: SQLAlchemyFindingStore, limit: int) -> bytes:
+    models = _to_findings_out(store.list_page(limit=limit).findings)
+    validated = _RESPONSE_ADAPTER.validate_python([model.model_dump() for model in models])
+    return json.dumps(_RESPONSE_ADAPTER.dump_python(validated, mode="json")).encode()
+
+
+def document_path(store: SQLAlchemyFindingStore, limit: int) -> bytes:
+    return dumps_json(store.list_documents_page(limit=limit).documents)
+
+
+def timed(label: str, repeat: int, call: Callable[[], bytes]) -> float:
+    samples: list[float] = []
+    size = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        size = len(call())
+        samples.append(time.perf_counter() - started)
+    median = statistics.median(samples)
+    print(f"{label:<34} median {median * 1000:8.1f} ms  body={size} bytes")
+    return median
+
+
+def run(database_url: str, rows: int, limit: int, repeat: int) -> None:
+    with tempfile.TemporaryDirectory() as workdir:
+        url = database_url or f"sqlite+pysqlite:///{Path(workdir) / 'bench.db'}"
+        store = SQLAlchemyFindingStore(create_db_engine(url))
+        store.init()
+        store.add(make_findings(rows, assets=500))
+
+        baseline = timed("ORM -> dataclass -> pydantic", repeat, lambda: model_path(store, limit))
+        fast = timed(f"rows -> dict -> {JSON_ENCODER}", repeat, lambda: document_path(store, limit))
+        print(f"speedup x{baseline / fast:.1f}")
+        store.engine.dispose()
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    run(args.database_url, args.rows, args.limit, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,77 @@
+import argparse
+import os
+import statistics
+import time
+from collections.abc import Sequence
+
+from bench_risk_scoring import make_signals
+
+from saastesa.core.models import ThreatSignal
+from saastesa.core.risk_scoring import build_findings, score_signals
+from saastesa.pipelines.analyze import AnalysisOptions, SignalAnalyzer
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Measure process-pool analysis speedup by worker count"
+    )
+    parser.add_argument("--signals", type=int, default=1_000_000, help="Signals per timed run")
+    parser.add_argument("--workers", default="1,2,4,8", help="Comma separated worker counts")
+    parser.add_argument("--chunk-size", type=int, default=20_000, help="Signals per worker task")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per worker count")
+    return parser
+
+
+def timed(signals: list[ThreatSignal], options: AnalysisOptions, repeat: int) -> float:
+    samples: list[float] = []
+    with SignalAnalyzer(options) as analyzer:
+        analyzer.start()
+        for _ in range(repeat):
+            started = time.perf_counter()
+            analyzer.analyze(signals)
+            samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def worker_share(signals: list[ThreatSignal], repeat: int) -> float:
+    scoring: list[float] = []
+    building: list[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        scores = score_signals(signals)
+        scoring.append(time.perf_counter() - started)
+        started = time.perf_counter()
+        build_findings(signals, scores=scores)
+        building.append(time.perf_counter() - started)
+    scored, built = statistics.median(scoring), statistics.median(building)
+    return scored / (scored + built)
+
+
+def run(count: int, levels: list[int], chunk_size: int, repeat: int) -> None:
+    signals = make_signals(count)
+    print(f"{count:,} signals, chunk size {chunk_size:,}, {os.cpu_count()} CPUs available")
+    share = worker_share(signals, repeat)
+    print(
+        f"workers take {share:.0%} of the serial cost; the parent still builds every finding, "
+        f"so no worker count beats x{1 / (1 - share):.2f}"
+    )
+    baseline: float | None = None
+    for workers in levels:
+        options = AnalysisOptions(workers=workers, chunk_size=chunk_size, parallel_threshold=0)
+        median = timed(signals, options, repeat)
+        baseline = median if baseline is None else baseline
+        print(
+            f"workers={workers:<3} median {median * 1000:9.1f} ms  "
+            f"{count / median:12,.0f} signals/s  speedup x{baseline / median:.2f}"
+        )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    levels = [int(level) for level in args.workers.split(",") if level]
+    run(args.signals, levels, args.chunk_size, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,100 @@
+import argparse
+import statistics
+import time
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from bench_risk_scoring import make_signals
+
+from saastesa.core.models import ThreatSignal
+from saastesa.core.policy import DEFAULT_POLICY, compile_policy
+from saastesa.core.risk_scoring import build_findings, compute_risk_score
+
+_RICH_POLICY: dict[str, Any] = {
+    "name": "bench-rich",
+    "severity_weights": {1: 1, 2: 2.5, 3: 4, 4: 6, 5: 8},
+    "factors": [
+        {"name": "exposed", "field": "internet_exposed", "multiply": 2},
+        {"name": "privileged", "field": "privileged_access", "multiply": 1.5},
+        {
+            "name": "crown",
+            "field": "asset_id",
+            "op": "in",
+            "value": ["asset-1", "asset-2"],
+            "add": 2,
+        },
+        {"name": "cve", "field": "cve", "op": "equals", "value": ["CVE-2026-0001"], "add": 1},
+        {"name": "cvss", "field": "cvss", "op": "gte", "value": 9, "add": 1},
+        {"name": "mfa", "field": "mfa_enabled", "op": "equals", "value": False, "add": 1},
+    ],
+    "domains": {"iam": "identity", "k8s": "container", "sast": "application"},
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Compare compiled risk policies with the hard-coded scorer"
+    )
+    parser.add_argument("--signals", type=int, default=200_000, help="Signals per timed run")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per path")
+    return parser
+
+
+def hard_coded_score(signal: ThreatSignal) -> int:
+    severity = max(1, min(signal.severity, 5))
+    exposure_factor = 2 if signal.metadata.get("internet_exposed") else 1
+    privileged_factor = 2 if signal.metadata.get("privileged_access") else 1
+    return min(severity * exposure_factor * privileged_factor, 10)
+
+
+def timed(label: str, repeat: int, call: Callable[[], object], baseline: float | None) -> float:
+    samples: list[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        call()
+        samples.append(time.perf_counter() - started)
+    median = statistics.median(samples)
+    ratio = f"  x{median / baseline:.2f} of baseline" if baseline else ""
+    print(f"{label:<36} median {median * 1000:8.1f} ms{ratio}")
+    return median
+
+
+def run(count: int, repeat: int) -> None:
+    signals = make_signals(count)
+    rich = compile_policy(_RICH_POLICY)
+    assert [hard_coded_score(s) for s in signals] == [compute_risk_score(s) for s in signals]
+
+    baseline = timed(
+        "score: hard-coded formula", repeat, lambda: [hard_coded_score(s) for s in signals], None
+    )
+    timed(
+        "score: default policy (2 factors)",
+        repeat,
+        lambda: [compute_risk_score(s, DEFAULT_POLICY) for s in signals],
+        baseline,
+    )
+    timed(
+        "score: rich policy (6 factors)",
+        repeat,
+        lambda: [compute_risk_score(s, rich) for s in signals],
+        baseline,
+    )
+    started = time.perf_counter()
+    for _ in range(100):
+        compile_policy(_RICH_POLICY)
+    print(f"compile rich policy                  {(time.perf_counter() - started) * 10:8.2f} ms")
+
+    findings = timed(
+        "build_findings: default policy", repeat, lambda: build_findings(signals), None
+    )
+    timed("build_findings: rich policy", repeat, lambda: build_findings(signals, rich), findings)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    run(args.signals, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
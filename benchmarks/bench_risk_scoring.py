@@ -0,0 +1,148 @@
+import argparse
+import random
+import statistics
+import time
+from collections.abc import Callable, Sequence
+from datetime import UTC, datetime, timedelta
+from uuid import NAMESPACE_URL, uuid5
+
+from saastesa.core.contracts import (
+    CURRENT_FINDING_SCHEMA_VERSION,
+    FindingActivity,
+    FindingClass,
+    FindingDomain,
+    FindingSeverity,
+    FindingStandard,
+    FindingStatus,
+)
+from saastesa.core.models import FindingReferences, FindingResource, SecurityFinding, ThreatSignal
+from saastesa.core.risk_scoring import build_findings
+
+_SOURCES = ("iam", "cspm", "sast", "k8s", "network", "edr")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Compare per-signal and batch risk scoring")
+    parser.add_argument("--signals", type=int, default=200_000, help="Signals per timed run")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per path")
+    return parser
+
+
+def make_signals(count: int) -> list[ThreatSignal]:
+    rng = random.Random(7)
+    start = datetime(2026, 1, 1, tzinfo=UTC)
+    return [
+        ThreatSignal(
+            source=rng.choice(_SOURCES),
+            signal_type=f"bench_{index % 500}",
+            severity=rng.randint(1, 5),
+            detected_at=start + timedelta(seconds=index),
+            metadata={
+                "asset_id": f"asset-{index % 1000}",
+                "internet_exposed": rng.random() < 0.3,
+                "privileged_access": rng.random() < 0.2,
+                "cve": [f"CVE-2026-{index % 997:04d}"],
+            },
+        )
+        for index in range(count)
+    ]
+
+
+# The per-signal scorer that build_findings replaced, kept as the timing and parity baseline.
+def per_signal_finding(signal: ThreatSignal) -> SecurityFinding:
+    metadata = signal.metadata
+    severity_id = max(1, min(signal.severity, 5))
+    exposure = 2 if metadata.get("internet_exposed") else 1
+    privileged = 2 if metadata.get("privileged_access") else 1
+    explicit_domain = str(metadata.get("domain", "")).strip().lower()
+    if explicit_domain:
+        try:
+            domain = FindingDomain(explicit_domain)
+        except ValueError:
+            domain = FindingDomain.OTHER
+    elif signal.source.lower() in {"sast", "dast", "sca", "cicd", "code"}:
+        domain = FindingDomain.APPLICATION
+    elif signal.source.lower() in {"iam", "cloud", "cspm", "k8s", "host", "network"}:
+        domain = FindingDomain.INFRASTRUCTURE
+    else:
+        domain = FindingDomain.OTHER
+    try:
+        status = FindingStatus(str(metadata.get("status", "open")).strip().lower())
+    except ValueError:
+        status = FindingStatus.OPEN
+    categories = {
+        FindingDomain.APPLICATION: "Application Security",
+        FindingDomain.INFRASTRUCTURE: "Infrastructure Security",
+        FindingDomain.IDENTITY: "Identity Security",
+        FindingDomain.CLOUD: "Cloud Security",
+        FindingDomain.CONTAINER: "Container Security",
+    }
+    labels = ["informational", "low", "medium", "high", "critical"]
+    detected = f"{signal.source}:{signal.signal_type}:{signal.detected_at.isoformat()}"
+    return SecurityFinding(
+        finding_uid=str(uuid5(NAMESPACE_URL, detected)),
+        standard=FindingStandard.OCSF,
+        schema_version=CURRENT_FINDING_SCHEMA_VERSION,
+        status=status,
+        severity_id=severity_id,
+        severity=FindingSeverity(labels[severity_id - 1]),
+        risk_score=min(severity_id * exposure * privileged, 10) * 10,
+        title=str(metadata.get("title", f"{signal.source}:{signal.signal_type}")),
+        description=str(
+            metadata.get(
+                "description",
+                "Derived finding from normalized threat signal and context risk factors.",
+            )
+        ),
+        category_name=categories.get(domain, "Security Operations"),
+        class_name=FindingClass.SECURITY_FINDING,
+        type_name=str(metadata.get("type_name", signal.signal_type.replace("_", " ").title())),
+        domain=domain,
+        activity_name=FindingActivity.CREATE,
+        time=signal.detected_at,
+        source=signal.source,
+        resource=FindingResource(
+            uid=str(metadata.get("asset_id", signal.source)),
+            name=str(metadata.get("asset_name", signal.source)),
+            type=str(metadata.get("asset_type", "service")),
+            platform=str(metadata.get("platform", "saas")),
+        ),
+        references=FindingReferences(
+            cve=tuple(metadata.get("cve", [])),
+            cwe=tuple(metadata.get("cwe", [])),
+            owasp=tuple(metadata.get("owasp", [])),
+            mitre_attack=tuple(metadata.get("mitre_attack", [])),
+        ),
+        raw_data=metadata,
+    )
+
+
+def timed(label: str, repeat: int, call: Callable[[], list[SecurityFinding]], count: int) -> float:
+    samples: list[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        call()
+        samples.append(time.perf_counter() - started)
+    median = statistics.median(samples)
+    print(f"{label:<28} median {median * 1000:8.1f} ms  {count / median:12,.0f} signals/s")
+    return median
+
+
+def run(count: int, repeat: int) -> None:
+    signals = make_signals(count)
+    assert build_findings(signals) == [per_signal_finding(signal) for signal in signals]
+    baseline = timed(
+        "per-signal scorer", repeat, lambda: [per_signal_finding(s) for s in signals], count
+    )
+    batch = timed("build_findings batch", repeat, lambda: build_findings(signals), count)
+    print(f"speedup x{baseline / batch:.2f}")
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    run(args.signals, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
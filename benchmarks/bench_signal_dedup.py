@@ -0,0 +1,85 @@
+import argparse
+import tempfile
+import time
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from saastesa.api.db import create_db_engine
+from saastesa.api.queries import AnalyticsDimension
+from saastesa.api.repository import SQLAlchemyFindingStore
+from saastesa.core.models import ThreatSignal
+from saastesa.pipelines.analyze import analyze_signals
+from saastesa.pipelines.dedup import SignalDeduplicator
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Measure write volume with and without signal dedup"
+    )
+    parser.add_argument("--assets", type=int, default=500, help="Assets re-reported on every poll")
+    parser.add_argument("--polls", type=int, default=120, help="Agent polls to replay")
+    parser.add_argument("--interval-seconds", type=int, default=30, help="Seconds between polls")
+    parser.add_argument("--window-seconds", type=float, default=3600.0, help="Dedup window")
+    parser.add_argument("--refresh-seconds", type=float, default=300.0, help="Count refresh period")
+    return parser
+
+
+def make_poll(assets: int, moment: datetime) -> list[ThreatSignal]:
+    return [
+        ThreatSignal(
+            source=("cspm", "iam", "k8s")[index % 3],
+            signal_type=f"bench_check_{index}",
+            severity=index % 5 + 1,
+            detected_at=moment,
+            metadata={"asset_id": f"asset-{index}", "internet_exposed": index % 4 == 0},
+        )
+        for index in range(assets)
+    ]
+
+
+def replay(args: argparse.Namespace, dedup: SignalDeduplicator | None) -> tuple[int, int, float]:
+    start = datetime(2026, 1, 1, tzinfo=UTC)
+    written = 0
+    with tempfile.TemporaryDirectory() as workdir:
+        database_url = f"sqlite+pysqlite:///{Path(workdir) / 'b.db'}"
+        store = SQLAlchemyFindingStore(create_db_engine(database_url))
+        store.init()
+        started = time.perf_counter()
+        for poll in range(args.polls):
+            polled_at = start + timedelta(seconds=poll * args.interval_seconds)
+            signals = make_poll(args.assets, polled_at)
+            if dedup is not None:
+                signals = dedup.collapse(signals)
+            findings = analyze_signals(signals)
+            store.add(findings)
+            written += len(findings)
+        elapsed = time.perf_counter() - started
+        rows = sum(count for _, count in store.count_by(AnalyticsDimension.SOURCE))
+        store.engine.dispose()
+    return written, rows, elapsed
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    received = args.assets * args.polls
+    print(
+        f"{received:,} signals: {args.assets} assets x {args.polls} polls "
+        f"every {args.interval_seconds}s"
+    )
+    baseline: float | None = None
+    for label, dedup in (
+        ("no dedup", None),
+        ("dedup", SignalDeduplicator(args.window_seconds, args.refresh_seconds)),
+    ):
+        written, rows, elapsed = replay(args, dedup)
+        baseline = elapsed if baseline is None else baseline
+        print(
+            f"{label:<9} findings written {written:9,}  rows stored {rows:9,}  "
+            f"{elapsed * 1000:9.1f} ms  x{baseline / elapsed:.2f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,59 @@
+import argparse
+import statistics
+import tempfile
+import time
+from collections.abc import Callable, Sequence
+from pathlib import Path
+
+from bench_bulk_ingest import make_findings
+
+from saastesa.api.db import create_db_engine
+from saastesa.api.repository import SQLAlchemyFindingStore
+from saastesa.core.risk_scoring import summarize_scores
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Measure /api/v1/summary latency by table size")
+    parser.add_argument(
+        "--database-url", default="", help="Target database (defaults to a temp SQLite file)"
+    )
+    parser.add_argument(
+        "--rows", type=int, default=1_000_000, help="Findings to load before measuring"
+    )
+    parser.add_argument("--batch-size", type=int, default=50_000, help="Findings per load batch")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per strategy")
+    return parser
+
+
+def timed(label: str, repeat: int, call: Callable[[], dict[str, int]]) -> None:
+    samples: list[float] = []
+    result: dict[str, int] = {}
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = call()
+        samples.append(time.perf_counter() - started)
+    median_ms = statistics.median(samples) * 1000
+    print(f"{label:<28} median {median_ms:9.1f} ms  total={sum(result.values())}")
+
+
+def run(database_url: str, rows: int, batch_size: int, repeat: int) -> None:
+    with tempfile.TemporaryDirectory() as workdir:
+        url = database_url or f"sqlite+pysqlite:///{Path(workdir) / 'bench.db'}"
+        store = SQLAlchemyFindingStore(create_db_engine(url))
+        store.init()
+        for offset in range(0, rows, batch_size):
+            store.add(make_findings(min(batch_size, rows - offset), assets=500, offset=offset))
+
+        timed("summary()", repeat, store.summary)
+        timed("list(100000)+summarize", 1, lambda: summarize_scores(store.list(limit=100000)))
+        store.engine.dispose()
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    run(args.database_url, args.rows, args.batch_size, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -6,13 +6,14 @@ import { useQuery } from "@tanstack/react-query";
 import { Analytics } from "@vercel/analytics/react";
 import { SpeedInsights } from "@vercel/speed-insights/react";
 
-import { API_BASE_URL, getFindings, getSummary } from "./api";
+import { API_BASE_URL, getCounts, getFindings, getHistogram, getSummary } from "./api";
 import { DomainChart } from "./components/DomainChart";
 import { FindingsChart } from "./components/FindingsChart";
 import { FindingsTable } from "./components/FindingsTable";
 import { SourceChart } from "./components/SourceChart";
 import { SummaryCards } from "./components/SummaryCards";
 import { TrendChart } from "./components/TrendChart";
+import { trendStart } from "./lib/insights";
 
 type Props = {
   mode: "light" | "dark";
@@ -36,6 +37,24 @@ export default function App({ mode, onToggleTheme }: Props) {
     error: findingsErrorDetails,
   } = useQuery({ queryKey: ["findings"], queryFn: () => getFindings(500), refetchInterval: 15000 });
 
+  const {
+    data: analytics,
+    isLoading: analyticsLoading,
+    isError: analyticsError,
+    error: analyticsErrorDetails,
+  } = useQuery({
+    queryKey: ["analytics"],
+    queryFn: async () => {
+      const [domains, sources, trend] = await Promise.all([
+        getCounts("domain"),
+        getCounts("source"),
+        getHistogram("day", trendStart(14)),
+      ]);
+      return { domains, sources, trend };
+    },
+    refetchInterval: 15000,
+  });
+
   useEffect(() => {
     const timer = window.setTimeout(() => setLoadingWarning(true), 10000);
     return () => window.clearTimeout(timer);
@@ -48,7 +67,7 @@ export default function App({ mode, onToggleTheme }: Props) {
     return "Unknown error";
   };
 
-  if (summaryLoading || findingsLoading) {
+  if (summaryLoading || findingsLoading || analyticsLoading) {
     return (
       <Container sx={{ py: 4 }}>
         <Box sx={{ minHeight: "30vh", display: "flex", alignItems: "center", justifyContent: "center" }}>
@@ -63,7 +82,7 @@ export default function App({ mode, onToggleTheme }: Props) {
     );
   }
 
-  if (summaryError || findingsError || !summary || !findings) {
+  if (summaryError || findingsError || analyticsError || !summary || !findings || !analytics) {
     return (
       <Container sx={{ py: 4 }}>
         <Alert severity="error" sx={{ mb: 2 }}>
@@ -75,6 +94,8 @@ export default function App({ mode, onToggleTheme }: Props) {
           Summary error: {getErrorMessage(summaryErrorDetails)}
           <br />
           Findings error: {getErrorMessage(findingsErrorDetails)}
+          <br />
+          Analytics error: {getErrorMessage(analyticsErrorDetails)}
         </Alert>
       </Container>
     );
@@ -115,19 +136,19 @@ export default function App({ mode, onToggleTheme }: Props) {
 
       <Grid container spacing={3}>
         <Grid size={12}>
-          <SummaryCards summary={summary} findings={findings} />
+          <SummaryCards summary={summary} findings={findings} domainCounts={analytics.domains} />
         </Grid>
         <Grid size={{ xs: 12, md: 6, lg: 4 }}>
           <FindingsChart summary={summary} />
         </Grid>
         <Grid size={{ xs: 12, md: 6, lg: 4 }}>
-          <DomainChart findings={findings} />
+          <DomainChart counts={analytics.domains} />
         </Grid>
         <Grid size={{ xs: 12, lg: 4 }}>
-          <SourceChart findings={findings} />
+          <SourceChart counts={analytics.sources} />
         </Grid>
         <Grid size={{ xs: 12, lg: 5 }}>
-          <TrendChart findings={findings} />
+          <TrendChart histogram={analytics.trend} />
         </Grid>
         <Grid size={{ xs: 12, lg: 7 }}>
           <FindingsTable findings={findings} />
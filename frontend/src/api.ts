@@ -1,4 +1,11 @@
-import { FindingsSummary, SecurityFinding } from "./types";
+import {
+  AnalyticsDimension,
+  CountBucket,
+  FindingsSummary,
+  SecurityFinding,
+  TimeBucket,
+  TimeBucketInterval,
+} from "./types";
 
 const REQUEST_TIMEOUT_MS = 12000;
 
@@ -30,19 +37,34 @@ function resolveApiBaseUrl(): string {
 
 export const API_BASE_URL = resolveApiBaseUrl();
 
+type Validated = { etag: string; body: unknown };
+
+const validatedResponses = new Map<string, Validated>();
+
 async function fetchJson<T>(path: string): Promise<T> {
   const controller = new AbortController();
   const timeoutId = window.setTimeout(() => controller.abort(), REQUEST_TIMEOUT_MS);
+  const cached = validatedResponses.get(path);
 
   try {
     const response = await fetch(`${API_BASE_URL}${path}`, {
       signal: controller.signal,
       mode: "cors",
+      cache: "no-store",
+      headers: cached ? { "If-None-Match": cached.etag } : undefined,
     });
+    if (response.status === 304 && cached) {
+      return cached.body as T;
+    }
     if (!response.ok) {
       throw new Error(`Request failed for ${path}: ${response.status}`);
     }
-    return response.json() as Promise<T>;
+    const body = (await response.json()) as T;
+    const etag = response.headers.get("ETag");
+    if (etag) {
+      validatedResponses.set(path, { etag, body });
+    }
+    return body;
   } catch (error) {
     if (error instanceof DOMException && error.name === "AbortError") {
       throw new Error(`Request timed out for ${path} after ${REQUEST_TIMEOUT_MS / 1000}s`);
@@ -60,3 +82,12 @@ export function getSummary(): Promise<FindingsSummary> {
 export function getFindings(limit = 200): Promise<SecurityFinding[]> {
   return fetchJson<SecurityFinding[]>(`/api/v1/findings?limit=${limit}`);
 }
+
+export function getCounts(groupBy: AnalyticsDimension): Promise<CountBucket[]> {
+  return fetchJson<CountBucket[]>(`/api/v1/analytics/counts?group_by=${groupBy}`);
+}
+
+export function getHistogram(interval: TimeBucketInterval, since: Date): Promise<TimeBucket[]> {
+  const params = new URLSearchParams({ interval, since: since.toISOString() });
+  return fetchJson<TimeBucket[]>(`/api/v1/analytics/histogram?${params.toString()}`);
+}
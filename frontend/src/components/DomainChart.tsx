@@ -2,16 +2,16 @@ import { Card, CardContent, CardHeader } from "@mui/material";
 import { useTheme } from "@mui/material/styles";
 import { Bar, BarChart, CartesianGrid, ResponsiveContainer, Tooltip, XAxis, YAxis } from "recharts";
 
-import { SecurityFinding } from "../types";
+import { CountBucket } from "../types";
 import { countByDomain } from "../lib/insights";
 
 type Props = {
-  findings: SecurityFinding[];
+  counts: CountBucket[];
 };
 
-export function DomainChart({ findings }: Props) {
+export function DomainChart({ counts }: Props) {
   const theme = useTheme();
-  const data = countByDomain(findings);
+  const data = countByDomain(counts);
 
   return (
     <Card elevation={0} variant="outlined">
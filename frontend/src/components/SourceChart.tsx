@@ -3,15 +3,15 @@ import { useTheme } from "@mui/material/styles";
 import { Bar, BarChart, CartesianGrid, ResponsiveContainer, Tooltip, XAxis, YAxis } from "recharts";
 
 import { countBySource } from "../lib/insights";
-import { SecurityFinding } from "../types";
+import { CountBucket } from "../types";
 
 type Props = {
-  findings: SecurityFinding[];
+  counts: CountBucket[];
 };
 
-export function SourceChart({ findings }: Props) {
+export function SourceChart({ counts }: Props) {
   const theme = useTheme();
-  const data = countBySource(findings);
+  const data = countBySource(counts);
 
   return (
     <Card elevation={0} variant="outlined">
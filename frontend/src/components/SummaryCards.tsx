@@ -2,16 +2,16 @@ import { Grid, Paper, Typography } from "@mui/material";
 import { alpha } from "@mui/material/styles";
 
 import { executiveMetrics } from "../lib/insights";
-import { SecurityFinding } from "../types";
-import { FindingsSummary } from "../types";
+import { CountBucket, FindingsSummary, SecurityFinding } from "../types";
 
 type Props = {
   summary: FindingsSummary;
   findings: SecurityFinding[];
+  domainCounts: CountBucket[];
 };
 
-export function SummaryCards({ summary, findings }: Props) {
-  const metrics = executiveMetrics(summary, findings);
+export function SummaryCards({ summary, findings, domainCounts }: Props) {
+  const metrics = executiveMetrics(summary, findings, domainCounts);
   const items = [
     { label: "Total Findings", value: metrics.totalFindings, tone: "primary" as const },
     { label: "Critical Ratio", value: metrics.criticalRatio, tone: "error" as const },
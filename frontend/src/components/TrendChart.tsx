@@ -3,15 +3,15 @@ import { alpha, useTheme } from "@mui/material/styles";
 import { Area, AreaChart, CartesianGrid, ResponsiveContainer, Tooltip, XAxis, YAxis } from "recharts";
 
 import { findingsTrend } from "../lib/insights";
-import { SecurityFinding } from "../types";
+import { TimeBucket } from "../types";
 
 type Props = {
-  findings: SecurityFinding[];
+  histogram: TimeBucket[];
 };
 
-export function TrendChart({ findings }: Props) {
+export function TrendChart({ histogram }: Props) {
   const theme = useTheme();
-  const data = findingsTrend(findings, 14);
+  const data = findingsTrend(histogram, 14);
 
   return (
     <Card elevation={0} variant="outlined">
@@ -1,70 +1,64 @@
-import { FindingsSummary, SecurityFinding } from "../types";
+import { CountBucket, FindingsSummary, SecurityFinding, TimeBucket } from "../types";
 
 export type TimeSeriesPoint = {
   date: string;
   count: number;
 };
 
-export function countByDomain(findings: SecurityFinding[]): Array<{ domain: string; count: number }> {
-  const totals = new Map<string, number>();
-  for (const finding of findings) {
-    const key = finding.domain || "other";
-    totals.set(key, (totals.get(key) ?? 0) + 1);
-  }
-  return [...totals.entries()]
-    .map(([domain, count]) => ({ domain, count }))
-    .sort((a, b) => b.count - a.count);
+export function countByDomain(counts: CountBucket[]): Array<{ domain: string; count: number }> {
+  return counts.map(({ key, count }) => ({ domain: key || "other", count }));
 }
 
-export function countBySource(findings: SecurityFinding[]): Array<{ source: string; count: number }> {
-  const totals = new Map<string, number>();
-  for (const finding of findings) {
-    const key = finding.source || "unknown";
-    totals.set(key, (totals.get(key) ?? 0) + 1);
-  }
-  return [...totals.entries()]
-    .map(([source, count]) => ({ source, count }))
-    .sort((a, b) => b.count - a.count)
-    .slice(0, 8);
+export function countBySource(counts: CountBucket[]): Array<{ source: string; count: number }> {
+  return counts.map(({ key, count }) => ({ source: key || "unknown", count })).slice(0, 8);
 }
 
-export function findingsTrend(findings: SecurityFinding[], days = 14): TimeSeriesPoint[] {
+export function trendStart(days = 14): Date {
   const start = new Date();
-  start.setHours(0, 0, 0, 0);
-  start.setDate(start.getDate() - (days - 1));
+  start.setUTCHours(0, 0, 0, 0);
+  start.setUTCDate(start.getUTCDate() - (days - 1));
+  return start;
+}
+
+export function findingsTrend(histogram: TimeBucket[], days = 14): TimeSeriesPoint[] {
+  const start = trendStart(days);
 
   const buckets = new Map<string, number>();
   for (let i = 0; i < days; i += 1) {
     const date = new Date(start);
-    date.setDate(start.getDate() + i);
+    date.setUTCDate(start.getUTCDate() + i);
     const key = date.toISOString().slice(0, 10);
     buckets.set(key, 0);
   }
 
-  for (const finding of findings) {
-    const key = new Date(finding.time).toISOString().slice(0, 10);
+  for (const bucket of histogram) {
+    const key = new Date(bucket.bucket_start).toISOString().slice(0, 10);
     if (buckets.has(key)) {
-      buckets.set(key, (buckets.get(key) ?? 0) + 1);
+      buckets.set(key, (buckets.get(key) ?? 0) + bucket.count);
     }
   }
 
   return [...buckets.entries()].map(([date, count]) => ({ date, count }));
 }
 
-export function executiveMetrics(summary: FindingsSummary, findings: SecurityFinding[]): {
+export function executiveMetrics(
+  summary: FindingsSummary,
+  findings: SecurityFinding[],
+  domainCounts: CountBucket[]
+): {
   totalFindings: number;
   criticalRatio: string;
   averageRisk: string;
   distinctDomains: number;
 } {
-  const totalFindings = findings.length;
+  const totalFindings = summary.low + summary.medium + summary.high + summary.critical;
   const criticalRatio =
     totalFindings === 0 ? "0.0%" : `${((summary.critical / totalFindings) * 100).toFixed(1)}%`;
   const averageRisk =
-    totalFindings === 0
+    findings.length === 0
       ? "0.0"
-      : (findings.reduce((acc, finding) => acc + finding.risk_score, 0) / totalFindings).toFixed(1);
-  const distinctDomains = new Set(findings.map((finding) => finding.domain)).size;
+      : (findings.reduce((acc, finding) => acc + finding.risk_score, 0) / findings.length).toFixed(1);
+  const distinctDomains = domainCounts.filter((bucket) => bucket.count > 0).length;
 
   return {
     totalFindings,
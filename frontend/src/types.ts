@@ -15,6 +15,19 @@ export type FindingActivity = "Create";
 export type JsonPrimitive = string | number | boolean | null;
 export type JsonValue = JsonPrimitive | { [key: string]: JsonValue } | JsonValue[];
 
+export type AnalyticsDimension = "domain" | "source" | "severity" | "status";
+export type TimeBucketInterval = "hour" | "day" | "week";
+
+export type CountBucket = {
+  key: string;
+  count: number;
+};
+
+export type TimeBucket = {
+  bucket_start: string;
+  count: number;
+};
+
 export type FindingsSummary = {
   low: number;
   medium: number;
@@ -1,39 +1,122 @@
 import argparse
+import asyncio
+import os
 from collections.abc import Sequence
-import time
+from pathlib import Path
 
-from saastesa.connectors.mock import MockThreatSignalProvider
+from saastesa.agent.runtime import AgentRuntime, parse_connector
+from saastesa.agent.spool import create_spool_sender
+from saastesa.core.compression import ContentEncoding
 from saastesa.sdk.api_client import TESAApiClient
 
 
 def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(prog="saastesa-agent", description="SaaS TESA distributed agent")
+    parser = argparse.ArgumentParser(
+        prog="saastesa-agent", description="SaaS TESA distributed agent"
+    )
     parser.add_argument("--api-url", default="http://localhost:8080", help="SaaS TESA API base URL")
     parser.add_argument("--interval-seconds", type=int, default=30, help="Polling interval")
     parser.add_argument("--once", action="store_true", help="Send one batch and exit")
+    add_connector_arguments(parser)
+    add_spool_arguments(parser)
+    add_transport_arguments(parser)
     return parser
 
 
-def _run_once(api_url: str) -> None:
-    provider = MockThreatSignalProvider()
-    client = TESAApiClient(base_url=api_url)
-    result = client.send_signals(provider.fetch_signals())
-    print(f"Agent pushed {result['ingested']} signals")
+def add_connector_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--connector",
+        dest="connectors",
+        action="append",
+        metavar="NAME[@SECONDS]",
+        help="Connector to poll, a built-in name or module:Class, optionally with its own "
+        "interval (repeatable; default TESA_AGENT_CONNECTORS or mock)",
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=int(os.getenv("TESA_AGENT_MAX_CONCURRENCY", "4")),
+        help="Connectors fetched at the same time",
+    )
+    parser.add_argument(
+        "--fetch-timeout-seconds",
+        type=float,
+        default=float(os.getenv("TESA_AGENT_FETCH_TIMEOUT_SECONDS", "60")),
+        help="Seconds a connector fetch may take before it is abandoned",
+    )
+
+
+def add_spool_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--spool-path",
+        default=os.getenv("TESA_AGENT_SPOOL_PATH", "saastesa-agent-spool.db"),
+        help="SQLite file signals are written to before they are sent",
+    )
+
+
+def add_transport_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--http2",
+        action="store_true",
+        default=os.getenv("TESA_AGENT_HTTP2", "").strip().lower() in {"1", "true", "yes", "on"},
+        help="Negotiate HTTP/2 with the API (needs the h2 package)",
+    )
+    parser.add_argument(
+        "--compression",
+        type=ContentEncoding,
+        choices=list(ContentEncoding),
+        default=ContentEncoding(os.getenv("TESA_AGENT_COMPRESSION", "identity").strip().lower()),
+        help="Content-Encoding for request bodies",
+    )
+    parser.add_argument(
+        "--keepalive-seconds",
+        type=float,
+        default=float(os.getenv("TESA_AGENT_KEEPALIVE_SECONDS", "60")),
+        help="Seconds an idle pooled connection is kept open",
+    )
+
+
+def create_client(args: argparse.Namespace) -> TESAApiClient:
+    return TESAApiClient(
+        base_url=args.api_url,
+        http2=args.http2,
+        compression=args.compression,
+        keepalive_expiry=args.keepalive_seconds,
+    )
+
+
+def connector_specs(args: argparse.Namespace) -> list[str]:
+    if args.connectors:
+        return list(args.connectors)
+    configured = os.getenv("TESA_AGENT_CONNECTORS", "mock")
+    return [spec.strip() for spec in configured.split(",") if spec.strip()]
 
 
 def main(argv: Sequence[str] | None = None) -> int:
     args = build_parser().parse_args(argv)
+    interval = max(args.interval_seconds, 1)
+    connectors = [
+        parse_connector(spec, interval, args.fetch_timeout_seconds)
+        for spec in connector_specs(args)
+    ]
 
-    if args.once:
-        _run_once(args.api_url)
-        return 0
-
-    try:
-        while True:
-            _run_once(args.api_url)
-            time.sleep(max(args.interval_seconds, 1))
-    except KeyboardInterrupt:
-        print("Agent stopped")
+    with create_client(args) as client:
+        sender = create_spool_sender(client, Path(args.spool_path))
+        runtime = AgentRuntime(connectors, sender, max_concurrency=args.max_concurrency)
+        try:
+            if args.once:
+                pending = asyncio.run(runtime.run_once())
+                print(f"Agent pushed {sender.stats().sent} signals")
+                if pending:
+                    print(f"Agent kept {pending} signals spooled for the next run")
+                    return 1
+                return 0
+            asyncio.run(runtime.run())
+        except KeyboardInterrupt:
+            print("Agent stopped")
+        finally:
+            runtime.close()
+            sender.spool.close()
     return 0
 
 
@@ -0,0 +1,267 @@
+import asyncio
+import importlib
+import inspect
+import logging
+import time
+from collections.abc import AsyncGenerator, Callable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import aclosing, suppress
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, TypeVar, cast
+
+from saastesa.agent.spool import SpoolSender
+from saastesa.connectors.base import Checkpoint, SignalItem, SignalProvider, is_incremental
+from saastesa.connectors.mock import MockThreatSignalProvider
+from saastesa.core.models import ThreatSignal
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_Slice = tuple[list[ThreatSignal], str | None]
+
+_BUILTIN_PROVIDERS: dict[str, Callable[[], SignalProvider]] = {
+    "mock": MockThreatSignalProvider,
+}
+
+
+@dataclass(frozen=True)
+class Connector:
+    name: str
+    provider: SignalProvider
+    interval_seconds: float
+    timeout_seconds: float = 60.0
+
+
+@dataclass(frozen=True)
+class ConnectorStats:
+    name: str
+    polls: int
+    failures: int
+    timeouts: int
+    skipped: int
+    signals: int
+    last_duration_seconds: float
+    last_error: str | None
+    checkpoint: str | None
+
+
+@dataclass
+class _ConnectorState:
+    polls: int = 0
+    failures: int = 0
+    timeouts: int = 0
+    skipped: int = 0
+    signals: int = 0
+    last_duration_seconds: float = 0.0
+    last_error: str | None = None
+    checkpoint: str | None = None
+    in_flight: Future[Any] | None = None
+
+
+class AgentRuntime:
+    def __init__(
+        self,
+        connectors: Sequence[Connector],
+        sender: SpoolSender,
+        max_concurrency: int = 4,
+        max_idle_seconds: float = 1.0,
+        flush_signals: int = 1000,
+        drain_batches: int = 10,
+    ) -> None:
+        names = [connector.name for connector in connectors]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Connector names must be unique: {names}")
+        self.connectors = tuple(connectors)
+        self.sender = sender
+        self.max_concurrency = max_concurrency
+        self.max_idle_seconds = max_idle_seconds
+        self.flush_signals = flush_signals
+        self.drain_batches = drain_batches
+        self._states = {name: _ConnectorState() for name in names}
+        self._fetchers = ThreadPoolExecutor(max_concurrency, thread_name_prefix="tesa-connector")
+        self._spool_writer = ThreadPoolExecutor(1, thread_name_prefix="tesa-spool")
+        self._uplink = ThreadPoolExecutor(1, thread_name_prefix="tesa-uplink")
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._spooled = asyncio.Event()
+
+    def close(self) -> None:
+        self._fetchers.shutdown(wait=False, cancel_futures=True)
+        self._spool_writer.shutdown(wait=True)
+        self._uplink.shutdown(wait=True)
+
+    async def run(self, stop: asyncio.Event | None = None) -> None:
+        stop = stop or asyncio.Event()
+        tasks = [
+            asyncio.create_task(self._poll_forever(connector), name=f"connector:{connector.name}")
+            for connector in self.connectors
+        ]
+        tasks.append(asyncio.create_task(self._drain_forever(), name="uplink"))
+        try:
+            await stop.wait()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def run_once(self) -> int:
+        await asyncio.gather(*(self.poll(connector) for connector in self.connectors))
+        await self._on_uplink(lambda: self.sender.drain(force=True))
+        return self.sender.spool.depth
+
+    async def poll(self, connector: Connector) -> int:
+        state = self._states[connector.name]
+        if state.in_flight is not None and not state.in_flight.done():
+            state.skipped += 1
+            logger.warning("Connector %s is still busy with its previous fetch", connector.name)
+            return 0
+        spooled = 0
+        async with self._slots:
+            started = time.monotonic()
+            try:
+                async with (
+                    asyncio.timeout(connector.timeout_seconds),
+                    aclosing(self._fetch(connector)) as slices,
+                ):
+                    async for signals, checkpoint in slices:
+                        spooled += await self._on_spool(
+                            partial(self.sender.spool.append, signals, connector.name, checkpoint)
+                        )
+                        if checkpoint is not None:
+                            state.checkpoint = checkpoint
+                        self._spooled.set()
+            except TimeoutError:
+                state.timeouts += 1
+                state.last_error = f"timed out after {connector.timeout_seconds:g}s"
+                logger.warning("Connector %s %s", connector.name, state.last_error)
+            except Exception as error:
+                state.failures += 1
+                state.last_error = str(error) or type(error).__name__
+                logger.warning("Connector %s failed: %s", connector.name, state.last_error)
+            else:
+                state.last_error = None
+            finally:
+                state.polls += 1
+                state.last_duration_seconds = time.monotonic() - started
+                state.signals += spooled
+
+        logger.info("Connector %s spooled %d signals", connector.name, spooled)
+        return spooled
+
+    def stats(self) -> list[ConnectorStats]:
+        return [
+            ConnectorStats(
+                name=name,
+                polls=state.polls,
+                failures=state.failures,
+                timeouts=state.timeouts,
+                skipped=state.skipped,
+                signals=state.signals,
+                last_duration_seconds=state.last_duration_seconds,
+                last_error=state.last_error,
+                checkpoint=state.checkpoint,
+            )
+            for name, state in self._states.items()
+        ]
+
+    async def _fetch(self, connector: Connector) -> AsyncGenerator[_Slice, None]:
+        fetch = cast(Callable[..., Any], connector.provider.fetch_signals)
+        arguments: tuple[str | None, ...] = ()
+        if is_incremental(connector.provider):
+            checkpoint = await self._on_spool(lambda: self.sender.spool.checkpoint(connector.name))
+            self._states[connector.name].checkpoint = checkpoint
+            arguments = (checkpoint,)
+
+        if inspect.isasyncgenfunction(fetch):
+            signals: list[ThreatSignal] = []
+            async for item in fetch(*arguments):
+                if isinstance(item, Checkpoint):
+                    yield signals, item.value
+                    signals = []
+                    continue
+                signals.append(item)
+                if len(signals) >= self.flush_signals:
+                    yield signals, None
+                    signals = []
+            if signals:
+                yield signals, None
+            return
+
+        if inspect.iscoroutinefunction(fetch):
+            items: Iterator[SignalItem] = iter(await fetch(*arguments))
+        else:
+            items = await self._on_fetcher(connector, lambda: iter(fetch(*arguments)))
+        while True:
+            signals, checkpoint, exhausted = await self._on_fetcher(
+                connector, partial(_take, items, self.flush_signals)
+            )
+            if signals or checkpoint is not None:
+                yield signals, checkpoint
+            if exhausted:
+                return
+
+    async def _poll_forever(self, connector: Connector) -> None:
+        while True:
+            started = time.monotonic()
+            await self.poll(connector)
+            await asyncio.sleep(max(connector.interval_seconds - (time.monotonic() - started), 0))
+
+    async def _drain_forever(self) -> None:
+        while True:
+            self._spooled.clear()
+            try:
+                sent = await self._on_uplink(
+                    partial(self.sender.drain, max_batches=self.drain_batches)
+                )
+            except Exception:
+                logger.exception("Draining the agent spool failed, retrying")
+                await asyncio.sleep(self.max_idle_seconds)
+                continue
+            if sent:
+                logger.info("Agent pushed %d signals", sent)
+            wait = await self._on_uplink(self.sender.seconds_until_ready)
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._spooled.wait(), min(wait, self.max_idle_seconds))
+
+    async def _on_fetcher(self, connector: Connector, call: Callable[[], T]) -> T:
+        # A timed-out poll cannot stop its thread, so remember it until the call returns.
+        future = self._fetchers.submit(call)
+        self._states[connector.name].in_flight = future
+        return await asyncio.wrap_future(future)
+
+    async def _on_spool(self, call: Callable[[], T]) -> T:
+        return await asyncio.get_running_loop().run_in_executor(self._spool_writer, call)
+
+    async def _on_uplink(self, call: Callable[[], T]) -> T:
+        return await asyncio.get_running_loop().run_in_executor(self._uplink, call)
+
+
+def _take(items: Iterator[SignalItem], limit: int) -> tuple[list[ThreatSignal], str | None, bool]:
+    signals: list[ThreatSignal] = []
+    for item in items:
+        if isinstance(item, Checkpoint):
+            return signals, item.value, False
+        signals.append(item)
+        if len(signals) >= limit:
+            return signals, None, False
+    return signals, None, True
+
+
+def parse_connector(spec: str, interval_seconds: float, timeout_seconds: float) -> Connector:
+    name, _, interval = spec.strip().partition("@")
+    if not name:
+        raise ValueError(f"Invalid connector spec: {spec!r}")
+    factory = _BUILTIN_PROVIDERS.get(name)
+    if factory is None:
+        module_name, _, attribute = name.partition(":")
+        if not attribute:
+            known = ", ".join(sorted(_BUILTIN_PROVIDERS))
+            raise ValueError(f"Unknown connector {name!r}; use one of {known} or module:Class")
+        factory = getattr(importlib.import_module(module_name), attribute)
+    return Connector(
+        name=name,
+        provider=factory(),
+        interval_seconds=float(interval) if interval else interval_seconds,
+        timeout_seconds=timeout_seconds,
+    )
@@ -0,0 +1,341 @@
+import logging
+import os
+import random
+import sqlite3
+import time
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from threading import Lock
+from typing import Protocol
+
+import httpx
+
+from saastesa.core.models import ThreatSignal
+from saastesa.core.serialization import dumps_json
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS spooled_signals (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        enqueued_at REAL NOT NULL,
+        payload BLOB NOT NULL,
+        connector TEXT
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS connector_checkpoints (
+        connector TEXT PRIMARY KEY,
+        checkpoint TEXT NOT NULL,
+        updated_at REAL NOT NULL
+    )
+    """,
+)
+_RETRYABLE_CLIENT_ERRORS = {408, 425, 429}
+
+
+class SignalSender(Protocol):
+    def send_serialized_signals(self, documents: Sequence[bytes]) -> object:
+        ...
+
+
+@dataclass(frozen=True)
+class SpoolBatch:
+    first_id: int
+    last_id: int
+    documents: tuple[bytes, ...]
+
+
+@dataclass(frozen=True)
+class SpoolStats:
+    depth: int
+    size_bytes: int
+    max_bytes: int
+    dropped: int
+    sent: int
+    rejected: int
+    failures: int
+    consecutive_failures: int
+    next_attempt_in_seconds: float
+
+
+class SignalSpool:
+    def __init__(
+        self, path: Path, max_bytes: int = 268_435_456, clock: Callable[[], float] = time.time
+    ) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._lock = Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=FULL")
+        for statement in _SCHEMA:
+            self._connection.execute(statement)
+        columns = {row[1] for row in self._connection.execute("PRAGMA table_info(spooled_signals)")}
+        if "connector" not in columns:
+            self._connection.execute("ALTER TABLE spooled_signals ADD COLUMN connector TEXT")
+        depth, size = self._connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(LENGTH(payload)), 0) FROM spooled_signals"
+        ).fetchone()
+        self._depth = int(depth)
+        self._size_bytes = int(size)
+        self.dropped = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    @property
+    def depth(self) -> int:
+        return self._depth
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size_bytes
+
+    def append(
+        self,
+        signals: Iterable[ThreatSignal],
+        connector: str | None = None,
+        checkpoint: str | None = None,
+    ) -> int:
+        now = self._clock()
+        rows = [(now, dumps_json(asdict(signal)), connector) for signal in signals]
+        if not rows and checkpoint is None:
+            return 0
+        with self._lock:
+            with self._connection:
+                self._connection.execute("BEGIN IMMEDIATE")
+                self._connection.executemany(
+                    "INSERT INTO spooled_signals (enqueued_at, payload, connector) "
+                    "VALUES (?, ?, ?)",
+                    rows,
+                )
+                if connector is not None and checkpoint is not None:
+                    self._connection.execute(
+                        "INSERT INTO connector_checkpoints (connector, checkpoint, updated_at) "
+                        "VALUES (?, ?, ?) ON CONFLICT (connector) DO UPDATE SET "
+                        "checkpoint = excluded.checkpoint, updated_at = excluded.updated_at",
+                        (connector, checkpoint, now),
+                    )
+            self._depth += len(rows)
+            self._size_bytes += sum(len(payload) for _, payload, _ in rows)
+            self._enforce_cap()
+        return len(rows)
+
+    def checkpoint(self, connector: str) -> str | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT checkpoint FROM connector_checkpoints WHERE connector = ?", (connector,)
+            ).fetchone()
+        return None if row is None else str(row[0])
+
+    def oldest_age_seconds(self) -> float | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT enqueued_at FROM spooled_signals ORDER BY id LIMIT 1"
+            ).fetchone()
+        return None if row is None else max(self._clock() - float(row[0]), 0.0)
+
+    def peek(self, max_signals: int, max_bytes: int) -> SpoolBatch | None:
+        documents: list[bytes] = []
+        first_id = last_id = 0
+        size = 0
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT id, payload FROM spooled_signals ORDER BY id LIMIT ?", (max_signals,)
+            ).fetchall()
+        for row_id, payload in rows:
+            if documents and size + len(payload) > max_bytes:
+                break
+            first_id = first_id or int(row_id)
+            last_id = int(row_id)
+            documents.append(bytes(payload))
+            size += len(payload)
+        if not documents:
+            return None
+        return SpoolBatch(first_id=first_id, last_id=last_id, documents=tuple(documents))
+
+    def ack(self, batch: SpoolBatch) -> None:
+        with self._lock:
+            self._delete("id BETWEEN ? AND ?", (batch.first_id, batch.last_id))
+
+    def discard(self, batch: SpoolBatch) -> None:
+        with self._lock:
+            self._warn_checkpointed("id BETWEEN ? AND ?", (batch.first_id, batch.last_id))
+            self._delete("id BETWEEN ? AND ?", (batch.first_id, batch.last_id))
+
+    def _enforce_cap(self) -> None:
+        excess = self._size_bytes - self.max_bytes
+        if excess <= 0:
+            return
+        freed = 0
+        last_id = 0
+        for row_id, size in self._connection.execute(
+            "SELECT id, LENGTH(payload) FROM spooled_signals ORDER BY id"
+        ):
+            freed += int(size)
+            last_id = int(row_id)
+            if freed >= excess:
+                break
+        self._warn_checkpointed("id <= ?", (last_id,))
+        dropped = self._delete("id <= ?", (last_id,))
+        self.dropped += dropped
+        logger.warning("Spool over %d bytes, dropped %d oldest signals", self.max_bytes, dropped)
+
+    def _warn_checkpointed(self, condition: str, parameters: tuple[int, ...]) -> None:
+        # The checkpoint already moved past these signals, so the source will not resend them.
+        rows = self._connection.execute(
+            "SELECT spooled.connector, COUNT(*), MIN(spooled.enqueued_at), checkpoints.checkpoint "
+            "FROM spooled_signals AS spooled JOIN connector_checkpoints AS checkpoints "
+            "ON checkpoints.connector = spooled.connector "
+            f"WHERE spooled.id IN (SELECT id FROM spooled_signals WHERE {condition}) "
+            "GROUP BY spooled.connector, checkpoints.checkpoint",
+            parameters,
+        ).fetchall()
+        for connector, count, enqueued_at, checkpoint in rows:
+            logger.warning(
+                "Dropping %d signals from connector %s spooled since %s; its checkpoint %r "
+                "is already past them, so they will not be fetched again",
+                count,
+                connector,
+                datetime.fromtimestamp(enqueued_at, tz=UTC).isoformat(),
+                checkpoint,
+            )
+
+    def _delete(self, condition: str, parameters: tuple[int, ...]) -> int:
+        with self._connection:
+            self._connection.execute("BEGIN IMMEDIATE")
+            deleted, size = self._connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(LENGTH(payload)), 0) FROM spooled_signals "
+                f"WHERE {condition}",
+                parameters,
+            ).fetchone()
+            self._connection.execute(f"DELETE FROM spooled_signals WHERE {condition}", parameters)
+        self._depth -= int(deleted)
+        self._size_bytes -= int(size)
+        return int(deleted)
+
+
+class SpoolSender:
+    def __init__(
+        self,
+        spool: SignalSpool,
+        client: SignalSender,
+        batch_signals: int = 500,
+        batch_bytes: int = 1_048_576,
+        max_wait_seconds: float = 10.0,
+        backoff_initial_seconds: float = 1.0,
+        backoff_max_seconds: float = 300.0,
+        clock: Callable[[], float] = time.time,
+        jitter: Callable[[float, float], float] = random.uniform,
+    ) -> None:
+        self.spool = spool
+        self.client = client
+        self.batch_signals = batch_signals
+        self.batch_bytes = batch_bytes
+        self.max_wait_seconds = max_wait_seconds
+        self.backoff_initial_seconds = backoff_initial_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+        self._clock = clock
+        self._jitter = jitter
+        self._next_attempt_at = 0.0
+        self._consecutive_failures = 0
+        self._sent = 0
+        self._rejected = 0
+        self._failures = 0
+
+    def seconds_until_ready(self) -> float:
+        backoff = max(self._next_attempt_at - self._clock(), 0.0)
+        if self.spool.depth >= self.batch_signals or self.spool.size_bytes >= self.batch_bytes:
+            return backoff
+        age = self.spool.oldest_age_seconds()
+        if age is None:
+            return max(backoff, self.max_wait_seconds)
+        return max(backoff, self.max_wait_seconds - age)
+
+    def drain(self, force: bool = False, max_batches: int | None = None) -> int:
+        sent_before = self._sent
+        batches = 0
+        while self.spool.depth and self._clock() >= self._next_attempt_at:
+            if max_batches is not None and batches >= max_batches:
+                break
+            if not force and self.seconds_until_ready() > 0:
+                break
+            batch = self.spool.peek(self.batch_signals, self.batch_bytes)
+            if batch is None or not self._send(batch):
+                break
+            batches += 1
+        return self._sent - sent_before
+
+    def stats(self) -> SpoolStats:
+        return SpoolStats(
+            depth=self.spool.depth,
+            size_bytes=self.spool.size_bytes,
+            max_bytes=self.spool.max_bytes,
+            dropped=self.spool.dropped,
+            sent=self._sent,
+            rejected=self._rejected,
+            failures=self._failures,
+            consecutive_failures=self._consecutive_failures,
+            next_attempt_in_seconds=max(self._next_attempt_at - self._clock(), 0.0),
+        )
+
+    def _send(self, batch: SpoolBatch) -> bool:
+        try:
+            self.client.send_serialized_signals(batch.documents)
+        except httpx.HTTPStatusError as error:
+            status = error.response.status_code
+            if 400 <= status < 500 and status not in _RETRYABLE_CLIENT_ERRORS:
+                logger.error(
+                    "API rejected %d spooled signals (%d), dropping them",
+                    len(batch.documents),
+                    status,
+                )
+                self.spool.discard(batch)
+                self._rejected += len(batch.documents)
+                return True
+            self._back_off(error)
+            return False
+        except (httpx.HTTPError, ValueError) as error:
+            self._back_off(error)
+            return False
+        self.spool.ack(batch)
+        self._sent += len(batch.documents)
+        self._consecutive_failures = 0
+        self._next_attempt_at = 0.0
+        return True
+
+    def _back_off(self, error: Exception) -> None:
+        self._failures += 1
+        self._consecutive_failures += 1
+        ceiling = min(
+            self.backoff_max_seconds,
+            self.backoff_initial_seconds * 2 ** (self._consecutive_failures - 1),
+        )
+        delay = self._jitter(0.0, ceiling)
+        self._next_attempt_at = self._clock() + delay
+        logger.warning(
+            "Sending %d spooled signals failed (%s), retrying in %.1fs",
+            self.spool.depth,
+            error,
+            delay,
+        )
+
+
+def create_spool_sender(client: SignalSender, path: Path) -> SpoolSender:
+    spool = SignalSpool(path, max_bytes=int(os.getenv("TESA_AGENT_SPOOL_MAX_BYTES", "268435456")))
+    return SpoolSender(
+        spool,
+        client,
+        batch_signals=int(os.getenv("TESA_AGENT_BATCH_SIGNALS", "500")),
+        batch_bytes=int(os.getenv("TESA_AGENT_BATCH_BYTES", "1048576")),
+        max_wait_seconds=float(os.getenv("TESA_AGENT_BATCH_WAIT_SECONDS", "10")),
+        backoff_initial_seconds=float(os.getenv("TESA_AGENT_BACKOFF_INITIAL_SECONDS", "1")),
+        backoff_max_seconds=float(os.getenv("TESA_AGENT_BACKOFF_MAX_SECONDS", "300")),
+    )
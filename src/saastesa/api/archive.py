@@ -0,0 +1,281 @@
+import gzip
+import logging
+import os
+import zlib
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from enum import StrEnum
+from functools import partial
+from pathlib import Path
+from threading import Event, Lock, Thread
+from typing import Protocol
+
+from pydantic import ValidationError
+
+from saastesa.api.export import finding_document
+from saastesa.api.schemas import SecurityFindingOut, security_findings_from_payload
+from saastesa.core.models import SecurityFinding
+from saastesa.core.serialization import dumps_json
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_SUFFIX = ".ndjson.gz"
+_STAGING_SUFFIX = ".tmp"
+_GZIP_WBITS = 31
+_READ_BYTES = 1_048_576
+
+
+class ArchiveRotation(StrEnum):
+    DAY = "day"
+    MONTH = "month"
+
+    def period(self, moment: datetime) -> str:
+        moment = moment.replace(tzinfo=UTC) if moment.tzinfo is None else moment.astimezone(UTC)
+        if self is ArchiveRotation.DAY:
+            return f"{moment:%Y-%m-%d}"
+        return f"{moment:%Y-%m}"
+
+
+class ArchiveStore(Protocol):
+    def archive_candidates(self, cutoff: datetime, limit: int) -> Sequence[SecurityFinding]:
+        ...
+
+    def delete_findings(
+        self,
+        finding_uids: Sequence[str],
+        cutoff: datetime,
+        before_commit: Callable[[Sequence[str]], None] | None = None,
+    ) -> Sequence[str]:
+        ...
+
+
+class RestoreStore(Protocol):
+    def add(self, findings: list[SecurityFinding]) -> None:
+        ...
+
+
+@dataclass(frozen=True)
+class ArchiveResult:
+    archived: int
+    files: tuple[Path, ...]
+
+
+@dataclass(frozen=True)
+class ArchiveJobStats:
+    runs: int
+    failures: int
+    findings_archived: int
+    last_run_at: datetime | None
+    last_error: str | None
+
+
+def archive_findings(
+    store: ArchiveStore,
+    cutoff: datetime,
+    directory: Path,
+    rotation: ArchiveRotation = ArchiveRotation.DAY,
+    batch_size: int = 1000,
+) -> ArchiveResult:
+    directory.mkdir(parents=True, exist_ok=True)
+    _recover_staged_parts(directory)
+    run = f"{datetime.now(tz=UTC):%Y%m%dT%H%M%S%fZ}"
+    parts: dict[str, _ArchivePart] = {}
+    files: list[Path] = []
+    archived = 0
+
+    def write(candidates: dict[str, SecurityFinding], deleted_uids: Sequence[str]) -> None:
+        documents: dict[str, list[bytes]] = {}
+        for finding_uid in deleted_uids:
+            finding = candidates[finding_uid]
+            period = rotation.period(finding.time)
+            documents.setdefault(period, []).append(dumps_json(finding_document(finding)))
+        for period, lines in documents.items():
+            part = parts.get(period)
+            if part is None:
+                path = directory / f"findings-{period}.{run}{ARCHIVE_SUFFIX}"
+                part = parts[period] = _ArchivePart(path)
+                files.append(path)
+            part.write(lines)
+
+    try:
+        while batch := store.archive_candidates(cutoff, batch_size):
+            candidates = {finding.finding_uid: finding for finding in batch}
+            # Only rows the delete actually removes are written, and they are synced to the
+            # staged part before it commits; rows refreshed past the cutoff stay live.
+            deleted = store.delete_findings(
+                list(candidates), cutoff, before_commit=partial(write, candidates)
+            )
+            archived += len(deleted)
+
+            current = rotation.period(batch[-1].time)
+            for period in [period for period in parts if period < current]:
+                parts.pop(period).publish()
+    finally:
+        for part in parts.values():
+            part.publish()
+    return ArchiveResult(archived=archived, files=tuple(files))
+
+
+def restore_archive(store: RestoreStore, paths: Iterable[Path], batch_size: int = 1000) -> int:
+    restored = 0
+    for path in paths:
+        pending: list[SecurityFindingOut] = []
+        for line_number, line in enumerate(_archived_lines(path), start=1):
+            if not line.strip():
+                continue
+            try:
+                pending.append(SecurityFindingOut.model_validate_json(line))
+            except ValidationError as error:
+                raise ValueError(f"{path}:{line_number}: invalid archived finding") from error
+            if len(pending) >= batch_size:
+                store.add(security_findings_from_payload(pending))
+                restored += len(pending)
+                pending = []
+        if pending:
+            store.add(security_findings_from_payload(pending))
+            restored += len(pending)
+    return restored
+
+
+class ArchiveJob:
+    def __init__(
+        self,
+        store: ArchiveStore,
+        directory: Path,
+        retain_days: int = 90,
+        rotation: ArchiveRotation = ArchiveRotation.DAY,
+        batch_size: int = 1000,
+        interval_seconds: float = 3600.0,
+    ) -> None:
+        self.store = store
+        self.directory = directory
+        self.retain_days = retain_days
+        self.rotation = rotation
+        self.batch_size = batch_size
+        self.interval_seconds = interval_seconds
+        self._stop = Event()
+        self._lock = Lock()
+        self._thread: Thread | None = None
+        self._runs = 0
+        self._failures = 0
+        self._findings_archived = 0
+        self._last_run_at: datetime | None = None
+        self._last_error: str | None = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = Thread(target=self._run, name="tesa-archive", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 30.0) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join(timeout)
+        self._thread = None
+
+    def run_once(self) -> ArchiveResult:
+        cutoff = datetime.now(tz=UTC) - timedelta(days=self.retain_days)
+        try:
+            result = archive_findings(
+                self.store, cutoff, self.directory, self.rotation, self.batch_size
+            )
+        except Exception as error:
+            with self._lock:
+                self._runs += 1
+                self._failures += 1
+                self._last_run_at = datetime.now(tz=UTC)
+                self._last_error = str(error)
+            raise
+        with self._lock:
+            self._runs += 1
+            self._findings_archived += result.archived
+            self._last_run_at = datetime.now(tz=UTC)
+            self._last_error = None
+        return result
+
+    def stats(self) -> ArchiveJobStats:
+        with self._lock:
+            return ArchiveJobStats(
+                runs=self._runs,
+                failures=self._failures,
+                findings_archived=self._findings_archived,
+                last_run_at=self._last_run_at,
+                last_error=self._last_error,
+            )
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            try:
+                result = self.run_once()
+            except Exception:
+                logger.exception("Archive run failed")
+                continue
+            if result.archived:
+                logger.info(
+                    "Archived %d findings into %d files", result.archived, len(result.files)
+                )
+
+
+class _ArchivePart:
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._staging = path.with_name(f".{path.name}{_STAGING_SUFFIX}")
+        self._handle = self._staging.open("xb")
+
+    def write(self, documents: Sequence[bytes]) -> None:
+        self._handle.write(gzip.compress(b"".join(document + b"\n" for document in documents)))
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+
+    def publish(self) -> None:
+        self._handle.close()
+        os.replace(self._staging, self.path)
+        _sync_directory(self.path.parent)
+
+
+def _recover_staged_parts(directory: Path) -> None:
+    # A staged part outlives its run only after a crash; its rows may already be deleted.
+    staged = list(directory.glob(f".findings-*{ARCHIVE_SUFFIX}{_STAGING_SUFFIX}"))
+    for staging in staged:
+        path = staging.with_name(staging.name[1 : -len(_STAGING_SUFFIX)])
+        logger.warning("Publishing archive part %s left behind by an interrupted run", path.name)
+        os.replace(staging, path)
+    if staged:
+        _sync_directory(directory)
+
+
+def _archived_lines(path: Path) -> Iterator[bytes]:
+    decompressor = zlib.decompressobj(wbits=_GZIP_WBITS)
+    in_member = False
+    pending = b""
+    with path.open("rb") as handle:
+        while chunk := handle.read(_READ_BYTES):
+            while chunk:
+                try:
+                    data = decompressor.decompress(chunk)
+                except zlib.error as error:
+                    raise ValueError(f"{path}: corrupt archive ({error})") from error
+                in_member = not decompressor.eof
+                lines = (pending + data).split(b"\n")
+                pending = lines.pop()
+                yield from lines
+                chunk = b""
+                if decompressor.eof:
+                    chunk = decompressor.unused_data
+                    decompressor = zlib.decompressobj(wbits=_GZIP_WBITS)
+    if in_member:
+        logger.warning("%s ends in a truncated gzip member, skipping its partial tail", path)
+    elif pending:
+        yield pending
+
+
+def _sync_directory(directory: Path) -> None:
+    descriptor = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
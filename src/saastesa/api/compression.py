@@ -0,0 +1,115 @@
+import zlib
+from typing import Any, Protocol
+
+from starlette.exceptions import HTTPException
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from saastesa.core.compression import ContentEncoding
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - zstandard is an optional codec
+    zstandard = None  # type: ignore[assignment]
+
+_ZSTD_MAX_WINDOW_BYTES = 8 * 1024 * 1024
+# A 4-byte RLE block regenerates at most 128 KiB.
+_ZSTD_MAX_EXPANSION = 32 * 1024
+
+
+class _Decompressor(Protocol):
+    @property
+    def eof(self) -> bool:
+        ...
+
+    def decompress(self, data: bytes, max_length: int) -> bytes:
+        ...
+
+
+class RequestDecompressionMiddleware:
+    def __init__(self, app: ASGIApp, max_body_bytes: int = 268_435_456) -> None:
+        self.app = app
+        self.max_body_bytes = max_body_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = _header(scope, b"content-encoding").strip().lower()
+        if encoding in {"", ContentEncoding.IDENTITY}:
+            await self.app(scope, receive, send)
+            return
+        decompressor = _decompressor(encoding)
+        if decompressor is None:
+            detail = f"Unsupported Content-Encoding: {encoding}"
+            await JSONResponse({"detail": detail}, status_code=415)(scope, receive, send)
+            return
+
+        inflated = 0
+
+        async def inflate() -> Message:
+            nonlocal inflated
+            message = await receive()
+            if message["type"] != "http.request":
+                return message
+            try:
+                body = decompressor.decompress(
+                    message.get("body", b""), self.max_body_bytes - inflated + 1
+                )
+            except Exception as error:
+                raise _invalid_body(encoding, str(error) or type(error).__name__) from error
+            inflated += len(body)
+            if inflated > self.max_body_bytes:
+                raise HTTPException(status_code=413, detail="Decompressed request body too large")
+            if not message.get("more_body", False) and not decompressor.eof:
+                raise _invalid_body(encoding, "truncated stream")
+            return {**message, "body": body}
+
+        inner_scope = {
+            **scope,
+            "headers": [
+                (name, value)
+                for name, value in scope["headers"]
+                if name not in {b"content-encoding", b"content-length"}
+            ],
+        }
+        await self.app(inner_scope, inflate, send)
+
+
+class _ZstdStream:
+    def __init__(self, decompressor: Any) -> None:
+        self._decompressor = decompressor
+
+    @property
+    def eof(self) -> bool:
+        return bool(self._decompressor.eof)
+
+    def decompress(self, data: bytes, max_length: int) -> bytes:
+        # zstd has no output limit, so feed slices that cannot inflate past the remaining budget.
+        output = bytearray()
+        view = memoryview(data)
+        while view and not self.eof and len(output) < max_length:
+            step = max((max_length - len(output)) // _ZSTD_MAX_EXPANSION, 1)
+            output += self._decompressor.decompress(view[:step])
+            view = view[step:]
+        return bytes(output)
+
+
+def _decompressor(encoding: str) -> _Decompressor | None:
+    if encoding in {ContentEncoding.GZIP, "x-gzip"}:
+        return zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+    if encoding == ContentEncoding.ZSTD and zstandard is not None:
+        decompressor = zstandard.ZstdDecompressor(max_window_size=_ZSTD_MAX_WINDOW_BYTES)
+        return _ZstdStream(decompressor.decompressobj())
+    return None
+
+
+def _invalid_body(encoding: str, reason: str) -> HTTPException:
+    return HTTPException(status_code=400, detail=f"Invalid {encoding} request body: {reason}")
+
+
+def _header(scope: Scope, name: bytes) -> str:
+    for key, value in scope["headers"]:
+        if key == name:
+            return str(value.decode("latin-1"))
+    return ""
@@ -0,0 +1,50 @@
+from email.utils import format_datetime, parsedate_to_datetime
+from hashlib import blake2b
+from urllib.parse import urlencode
+
+from fastapi import Request, Response
+
+from saastesa.api.repository import DataVersion
+
+
+def entity_tag(request: Request, version: DataVersion) -> str:
+    query = urlencode(sorted(request.query_params.multi_items()))
+    representation = blake2b(f"{request.url.path}?{query}".encode(), digest_size=8)
+    return f'W/"{version.version}-{representation.hexdigest()}"'
+
+
+def validator_headers(request: Request, version: DataVersion) -> dict[str, str]:
+    return {
+        "ETag": entity_tag(request, version),
+        "Last-Modified": format_datetime(version.updated_at, usegmt=True),
+        "Cache-Control": "no-cache",
+    }
+
+
+def is_not_modified(request: Request, version: DataVersion) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        current = _opaque_tag(entity_tag(request, version))
+        tags = {_opaque_tag(tag.strip()) for tag in if_none_match.split(",")}
+        return "*" in tags or current in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        return False
+    # Last-Modified has whole-second precision, so a write later in the same second
+    # would still compare equal; only a date past that second proves nothing changed.
+    return version.updated_at.replace(microsecond=0) < since
+
+
+def not_modified_response(request: Request, version: DataVersion) -> Response:
+    return Response(status_code=304, headers=validator_headers(request, version))
+
+
+def _opaque_tag(tag: str) -> str:
+    return tag[2:] if tag.startswith("W/") else tag
@@ -1,10 +1,84 @@
 import os
-from sqlalchemy import Engine, create_engine
-from sqlalchemy.pool import StaticPool
+import time
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any
+
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, QueuePool, StaticPool
 
 from saastesa.config import load_settings
 
 
+@dataclass(frozen=True)
+class PoolStats:
+    pool_class: str
+    size: int
+    checked_out: int
+    overflow: int
+    checkouts: int
+    timeouts: int
+    acquire_seconds_total: float
+    acquire_seconds_max: float
+
+
+class InstrumentedQueuePool(QueuePool):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._stats_lock = Lock()
+        self._checkouts = 0
+        self._timeouts = 0
+        self._acquire_seconds_total = 0.0
+        self._acquire_seconds_max = 0.0
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            entry = super()._do_get()
+        except PoolTimeoutError:
+            with self._stats_lock:
+                self._timeouts += 1
+            raise
+        elapsed = time.perf_counter() - started
+        with self._stats_lock:
+            self._checkouts += 1
+            self._acquire_seconds_total += elapsed
+            self._acquire_seconds_max = max(self._acquire_seconds_max, elapsed)
+        return entry
+
+    def stats(self) -> PoolStats:
+        with self._stats_lock:
+            return PoolStats(
+                pool_class=type(self).__name__,
+                size=self.size(),
+                checked_out=self.checkedout(),
+                overflow=max(self.overflow(), 0),
+                checkouts=self._checkouts,
+                timeouts=self._timeouts,
+                acquire_seconds_total=round(self._acquire_seconds_total, 6),
+                acquire_seconds_max=round(self._acquire_seconds_max, 6),
+            )
+
+
+class InstrumentedAsyncQueuePool(InstrumentedQueuePool, AsyncAdaptedQueuePool):
+    pass
+
+
+_ASYNC_DRIVERS = {
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql+psycopg": "postgresql+psycopg_async",
+}
+_ASYNC_SCHEMES = {"sqlite+aiosqlite", "postgresql+asyncpg", "postgresql+psycopg_async"}
+_SYNC_DRIVERS = {
+    "sqlite+aiosqlite": "sqlite+pysqlite",
+    "postgresql+asyncpg": "postgresql+psycopg",
+    "postgresql+psycopg_async": "postgresql+psycopg",
+}
+
+
 def resolve_database_url() -> str:
     configured_url = os.getenv("TESA_DATABASE_URL", "").strip()
     if configured_url:
@@ -35,8 +109,112 @@ def create_db_engine(database_url: str) -> Engine:
                 connect_args=connect_args,
                 poolclass=StaticPool,
             )
-        return create_engine(normalized_url, future=True, connect_args=connect_args)
-    return create_engine(normalized_url, future=True)
+        engine = create_engine(
+            normalized_url,
+            future=True,
+            connect_args=connect_args,
+            **_pool_options(pre_ping_default=False),
+        )
+        event.listen(engine, "connect", _apply_sqlite_pragmas)
+        return engine
+    return create_engine(normalized_url, future=True, **_pool_options(pre_ping_default=True))
+
+
+def create_async_db_engine(database_url: str) -> AsyncEngine:
+    normalized_url = _async_database_url(_normalize_database_url(database_url))
+
+    if normalized_url.startswith("sqlite"):
+        if normalized_url.endswith(":memory:"):
+            return create_async_engine(normalized_url, poolclass=StaticPool)
+        engine = create_async_engine(
+            normalized_url,
+            **_pool_options(pre_ping_default=False, poolclass=InstrumentedAsyncQueuePool),
+        )
+        event.listen(engine.sync_engine, "connect", _apply_sqlite_pragmas)
+        return engine
+    return create_async_engine(
+        normalized_url,
+        **_pool_options(pre_ping_default=True, poolclass=InstrumentedAsyncQueuePool),
+    )
+
+
+def use_async_engine(database_url: str) -> bool:
+    return _url_scheme(database_url) in _ASYNC_SCHEMES or _env_flag("TESA_DB_ASYNC", False)
+
+
+def sync_database_url(database_url: str) -> str:
+    scheme = _url_scheme(database_url)
+    sync_scheme = _SYNC_DRIVERS.get(scheme)
+    if sync_scheme is None:
+        return database_url
+    return f"{sync_scheme}{database_url[len(scheme):]}"
+
+
+def pool_stats(engine: Engine) -> PoolStats:
+    pool = engine.pool
+    if isinstance(pool, InstrumentedQueuePool):
+        return pool.stats()
+    return PoolStats(
+        pool_class=type(pool).__name__,
+        size=1,
+        checked_out=0,
+        overflow=0,
+        checkouts=0,
+        timeouts=0,
+        acquire_seconds_total=0.0,
+        acquire_seconds_max=0.0,
+    )
+
+
+def _pool_options(
+    pre_ping_default: bool, poolclass: type[QueuePool] = InstrumentedQueuePool
+) -> dict[str, Any]:
+    return {
+        "poolclass": poolclass,
+        "pool_size": int(os.getenv("TESA_DB_POOL_SIZE", "5")),
+        "max_overflow": int(os.getenv("TESA_DB_MAX_OVERFLOW", "10")),
+        "pool_timeout": float(os.getenv("TESA_DB_POOL_TIMEOUT", "30")),
+        "pool_recycle": int(os.getenv("TESA_DB_POOL_RECYCLE", "1800")),
+        "pool_pre_ping": _env_flag("TESA_DB_POOL_PRE_PING", pre_ping_default),
+    }
+
+
+def _apply_sqlite_pragmas(dbapi_connection: Any, _: ConnectionPoolEntry) -> None:
+    pragmas = {
+        "journal_mode": os.getenv("TESA_SQLITE_JOURNAL_MODE", "WAL"),
+        "synchronous": os.getenv("TESA_SQLITE_SYNCHRONOUS", "NORMAL"),
+        "busy_timeout": int(os.getenv("TESA_SQLITE_BUSY_TIMEOUT_MS", "5000")),
+        "cache_size": -int(os.getenv("TESA_SQLITE_CACHE_SIZE_KIB", "65536")),
+        "mmap_size": int(os.getenv("TESA_SQLITE_MMAP_SIZE_BYTES", "268435456")),
+    }
+    for name in ("journal_mode", "synchronous"):
+        if not str(pragmas[name]).isalpha():
+            raise ValueError(f"Invalid SQLite {name} setting: {pragmas[name]!r}")
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _async_database_url(database_url: str) -> str:
+    scheme = _url_scheme(database_url)
+    async_scheme = _ASYNC_DRIVERS.get(scheme)
+    if async_scheme is None:
+        return database_url
+    return f"{async_scheme}{database_url[len(scheme):]}"
+
+
+def _url_scheme(database_url: str) -> str:
+    return database_url.split("://", 1)[0].lower()
 
 
 def _normalize_database_url(database_url: str) -> str:
@@ -1,5 +1,7 @@
 from datetime import datetime
-from sqlalchemy import DateTime, Enum as SAEnum, ForeignKey, Integer, JSON, String, UniqueConstraint
+
+from sqlalchemy import JSON, BigInteger, DateTime, ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy import Enum as SAEnum
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 from saastesa.core.contracts import (
@@ -81,7 +83,9 @@ class SecurityFindingRecord(Base):
 class FindingReferenceItemRecord(Base):
     __tablename__ = "finding_reference_items"
     __table_args__ = (
-        UniqueConstraint("finding_id", "reference_type", "reference_value", name="uq_finding_reference_item"),
+        UniqueConstraint(
+            "finding_id", "reference_type", "reference_value", name="uq_finding_reference_item"
+        ),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -91,5 +95,27 @@ class FindingReferenceItemRecord(Base):
         index=True,
     )
     reference_value: Mapped[str] = mapped_column(String(256), index=True)
+    finding_time: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
     finding: Mapped[SecurityFindingRecord] = relationship(back_populates="reference_items")
+
+
+class FindingSummaryCounterRecord(Base):
+    __tablename__ = "finding_summary_counters"
+
+    risk_band: Mapped[str] = mapped_column(String(32), primary_key=True)
+    domain: Mapped[FindingDomain] = mapped_column(
+        SAEnum(FindingDomain, name="finding_domain", native_enum=False), primary_key=True
+    )
+    status: Mapped[FindingStatus] = mapped_column(
+        SAEnum(FindingStatus, name="finding_status", native_enum=False), primary_key=True
+    )
+    finding_count: Mapped[int] = mapped_column(Integer, default=0)
+
+
+class DataVersionRecord(Base):
+    __tablename__ = "data_version"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, default=0)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
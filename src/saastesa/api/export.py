@@ -0,0 +1,174 @@
+import csv
+import io
+import json
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable, Iterator, Sequence
+from enum import StrEnum
+from typing import Any
+
+from saastesa.core.models import SecurityFinding
+from saastesa.core.serialization import dumps_json
+
+CSV_COLUMNS = (
+    "finding_uid",
+    "standard",
+    "schema_version",
+    "status",
+    "severity_id",
+    "severity",
+    "risk_score",
+    "title",
+    "description",
+    "category_name",
+    "class_name",
+    "type_name",
+    "domain",
+    "activity_name",
+    "time",
+    "source",
+    "resource_uid",
+    "resource_name",
+    "resource_type",
+    "resource_platform",
+    "cve",
+    "cwe",
+    "owasp",
+    "mitre_attack",
+    "raw_data",
+)
+_FLUSH_BYTES = 64 * 1024
+
+
+class ExportFormat(StrEnum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+    @property
+    def media_type(self) -> str:
+        return "application/x-ndjson" if self is ExportFormat.NDJSON else "text/csv"
+
+
+def finding_document(finding: SecurityFinding) -> dict[str, Any]:
+    return {
+        "finding_uid": finding.finding_uid,
+        "standard": finding.standard.value,
+        "schema_version": finding.schema_version,
+        "status": finding.status.value,
+        "severity_id": finding.severity_id,
+        "severity": finding.severity.value,
+        "risk_score": finding.risk_score,
+        "title": finding.title,
+        "description": finding.description,
+        "category_name": finding.category_name,
+        "class_name": finding.class_name.value,
+        "type_name": finding.type_name,
+        "domain": finding.domain.value,
+        "activity_name": finding.activity_name.value,
+        "time": finding.time,
+        "source": finding.source,
+        "resource": {
+            "uid": finding.resource.uid,
+            "name": finding.resource.name,
+            "type": finding.resource.type,
+            "platform": finding.resource.platform,
+        },
+        "references": {
+            "cve": list(finding.references.cve),
+            "cwe": list(finding.references.cwe),
+            "owasp": list(finding.references.owasp),
+            "mitre_attack": list(finding.references.mitre_attack),
+        },
+        "raw_data": finding.raw_data,
+    }
+
+
+def iter_export(
+    findings: Iterable[SecurityFinding], export_format: ExportFormat
+) -> Iterator[bytes]:
+    header, encode = _encoder(export_format)
+    buffer = _ChunkBuffer(header)
+    for finding in findings:
+        chunk = buffer.push(encode(finding))
+        if chunk is not None:
+            yield chunk
+    if buffer.pending:
+        yield buffer.drain()
+
+
+async def aiter_export(
+    findings: AsyncIterable[SecurityFinding], export_format: ExportFormat
+) -> AsyncIterator[bytes]:
+    header, encode = _encoder(export_format)
+    buffer = _ChunkBuffer(header)
+    async for finding in findings:
+        chunk = buffer.push(encode(finding))
+        if chunk is not None:
+            yield chunk
+    if buffer.pending:
+        yield buffer.drain()
+
+
+class _ChunkBuffer:
+    def __init__(self, header: bytes) -> None:
+        self._parts = [header] if header else []
+        self._size = len(header)
+
+    @property
+    def pending(self) -> bool:
+        return bool(self._parts)
+
+    def push(self, line: bytes) -> bytes | None:
+        self._parts.append(line)
+        self._size += len(line)
+        return self.drain() if self._size >= _FLUSH_BYTES else None
+
+    def drain(self) -> bytes:
+        chunk = b"".join(self._parts)
+        self._parts.clear()
+        self._size = 0
+        return chunk
+
+
+def _encoder(export_format: ExportFormat) -> tuple[bytes, Callable[[SecurityFinding], bytes]]:
+    if export_format is ExportFormat.NDJSON:
+        return b"", _ndjson_line
+    return _csv_encode(CSV_COLUMNS), lambda finding: _csv_encode(_csv_row(finding))
+
+
+def _ndjson_line(finding: SecurityFinding) -> bytes:
+    return dumps_json(finding_document(finding)) + b"\n"
+
+
+def _csv_encode(row: Sequence[str | int]) -> bytes:
+    row_buffer = io.StringIO()
+    csv.writer(row_buffer).writerow(row)
+    return row_buffer.getvalue().encode()
+
+
+def _csv_row(finding: SecurityFinding) -> list[str | int]:
+    return [
+        finding.finding_uid,
+        finding.standard.value,
+        finding.schema_version,
+        finding.status.value,
+        finding.severity_id,
+        finding.severity.value,
+        finding.risk_score,
+        finding.title,
+        finding.description,
+        finding.category_name,
+        finding.class_name.value,
+        finding.type_name,
+        finding.domain.value,
+        finding.activity_name.value,
+        finding.time.isoformat(),
+        finding.source,
+        finding.resource.uid,
+        finding.resource.name,
+        finding.resource.type,
+        finding.resource.platform,
+        ";".join(finding.references.cve),
+        ";".join(finding.references.cwe),
+        ";".join(finding.references.owasp),
+        ";".join(finding.references.mitre_attack),
+        json.dumps(finding.raw_data, separators=(",", ":")),
+    ]
@@ -0,0 +1,231 @@
+import asyncio
+import logging
+import queue
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime
+from enum import StrEnum
+from threading import Lock, Thread
+from typing import Protocol
+from uuid import uuid4
+
+from saastesa.core.models import SecurityFinding, ThreatSignal
+from saastesa.pipelines.analyze import analyze_signals
+
+logger = logging.getLogger(__name__)
+
+Analyzer = Callable[[list[ThreatSignal]], list[SecurityFinding]]
+
+
+class FindingWriter(Protocol):
+    def add(self, findings: list[SecurityFinding]) -> None:
+        ...
+
+
+class AsyncFindingWriter(Protocol):
+    async def add(self, findings: list[SecurityFinding]) -> None:
+        ...
+
+
+class EventLoopWriter:
+    def __init__(self, store: AsyncFindingWriter) -> None:
+        self.store = store
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def bind(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+
+    def add(self, findings: list[SecurityFinding]) -> None:
+        if self._loop is None:
+            raise RuntimeError("EventLoopWriter is not bound to an event loop")
+        asyncio.run_coroutine_threadsafe(self.store.add(findings), self._loop).result()
+
+
+class IngestQueueFullError(RuntimeError):
+    pass
+
+
+class BatchState(StrEnum):
+    QUEUED = "queued"
+    COMMITTED = "committed"
+    FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class IngestBatchStatus:
+    batch_id: str
+    state: BatchState
+    accepted: int
+    enqueued_at: datetime
+    committed_at: datetime | None = None
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class IngestQueueStats:
+    depth: int
+    capacity: int
+    batches_committed: int
+    batches_failed: int
+    findings_committed: int
+    group_commits: int
+
+
+@dataclass(frozen=True)
+class _QueuedBatch:
+    batch_id: str
+    signals: list[ThreatSignal] | None = None
+    findings: list[SecurityFinding] | None = None
+
+    def resolve(self, analyze: Analyzer) -> list[SecurityFinding]:
+        if self.signals is not None:
+            return analyze(self.signals)
+        return list(self.findings or [])
+
+
+_STOP = _QueuedBatch(batch_id="")
+
+
+class WriteBehindIngestor:
+    def __init__(
+        self,
+        store: FindingWriter,
+        max_queued_batches: int = 1000,
+        max_group_findings: int = 5000,
+        max_group_wait_seconds: float = 0.05,
+        status_capacity: int = 10000,
+        analyze: Analyzer = analyze_signals,
+    ) -> None:
+        self.store = store
+        self.analyze = analyze
+        self.max_group_findings = max_group_findings
+        self.max_group_wait_seconds = max_group_wait_seconds
+        self._queue: queue.Queue[_QueuedBatch] = queue.Queue(maxsize=max_queued_batches)
+        self._capacity = max_queued_batches
+        self._status_capacity = status_capacity
+        self._statuses: OrderedDict[str, IngestBatchStatus] = OrderedDict()
+        self._lock = Lock()
+        self._thread: Thread | None = None
+        self._batches_committed = 0
+        self._batches_failed = 0
+        self._findings_committed = 0
+        self._group_commits = 0
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = Thread(target=self._run, name="tesa-write-behind", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 30.0) -> None:
+        if self._thread is None:
+            return
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def submit_signals(self, signals: list[ThreatSignal]) -> IngestBatchStatus:
+        return self._submit(_QueuedBatch(batch_id=str(uuid4()), signals=signals), len(signals))
+
+    def submit_findings(self, findings: list[SecurityFinding]) -> IngestBatchStatus:
+        return self._submit(_QueuedBatch(batch_id=str(uuid4()), findings=findings), len(findings))
+
+    def status(self, batch_id: str) -> IngestBatchStatus | None:
+        with self._lock:
+            return self._statuses.get(batch_id)
+
+    def stats(self) -> IngestQueueStats:
+        with self._lock:
+            return IngestQueueStats(
+                depth=self._queue.qsize(),
+                capacity=self._capacity,
+                batches_committed=self._batches_committed,
+                batches_failed=self._batches_failed,
+                findings_committed=self._findings_committed,
+                group_commits=self._group_commits,
+            )
+
+    def _submit(self, batch: _QueuedBatch, accepted: int) -> IngestBatchStatus:
+        status = IngestBatchStatus(
+            batch_id=batch.batch_id,
+            state=BatchState.QUEUED,
+            accepted=accepted,
+            enqueued_at=datetime.now(tz=UTC),
+        )
+        self._record(status)
+        try:
+            self._queue.put_nowait(batch)
+        except queue.Full as error:
+            with self._lock:
+                self._statuses.pop(batch.batch_id, None)
+            raise IngestQueueFullError("Ingest queue is full; retry later.") from error
+        return status
+
+    def _record(self, status: IngestBatchStatus) -> None:
+        with self._lock:
+            self._statuses[status.batch_id] = status
+            self._statuses.move_to_end(status.batch_id)
+            while len(self._statuses) > self._status_capacity:
+                self._statuses.popitem(last=False)
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            if first is _STOP:
+                break
+            group = [first]
+            pending = _estimated_size(first)
+            deadline = time.monotonic() + self.max_group_wait_seconds
+            while pending < self.max_group_findings:
+                try:
+                    item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                group.append(item)
+                pending += _estimated_size(item)
+            self._commit_group(group)
+
+    def _commit_group(self, group: list[_QueuedBatch]) -> None:
+        try:
+            resolved = [(batch, batch.resolve(self.analyze)) for batch in group]
+            self.store.add([finding for _, findings in resolved for finding in findings])
+        except Exception as error:
+            if len(group) == 1:
+                self._mark_failed(group[0], error)
+                return
+            logger.warning("Group commit of %d batches failed; retrying individually", len(group))
+            for batch in group:
+                self._commit_group([batch])
+            return
+
+        committed_at = datetime.now(tz=UTC)
+        for batch, findings in resolved:
+            self._mark_committed(batch, len(findings), committed_at)
+        with self._lock:
+            self._group_commits += 1
+
+    def _mark_committed(self, batch: _QueuedBatch, count: int, committed_at: datetime) -> None:
+        status = self.status(batch.batch_id)
+        if status is not None:
+            self._record(replace(status, state=BatchState.COMMITTED, committed_at=committed_at))
+        with self._lock:
+            self._batches_committed += 1
+            self._findings_committed += count
+
+    def _mark_failed(self, batch: _QueuedBatch, error: Exception) -> None:
+        logger.error("Write-behind batch %s failed: %s", batch.batch_id, error)
+        status = self.status(batch.batch_id)
+        if status is not None:
+            self._record(replace(status, state=BatchState.FAILED, error=str(error)))
+        with self._lock:
+            self._batches_failed += 1
+
+
+def _estimated_size(batch: _QueuedBatch) -> int:
+    return len(batch.signals if batch.signals is not None else batch.findings or [])
@@ -1,26 +1,70 @@
-from collections.abc import Iterable
+import asyncio
 import os
+from collections.abc import AsyncIterator, Callable, Iterable
+from contextlib import asynccontextmanager
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Annotated, Any
 from urllib.parse import urlsplit
-from typing import Any
 
-from fastapi import FastAPI, Query
-from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import ValidationError
 
-from saastesa.api.db import create_db_engine, resolve_database_url
+from saastesa.api.archive import ArchiveJob, ArchiveRotation
+from saastesa.api.compression import RequestDecompressionMiddleware
+from saastesa.api.conditional import is_not_modified, not_modified_response, validator_headers
+from saastesa.api.db import create_db_engine, resolve_database_url, sync_database_url
+from saastesa.api.export import ExportFormat
+from saastesa.api.ingest_queue import (
+    EventLoopWriter,
+    IngestBatchStatus,
+    IngestQueueFullError,
+    WriteBehindIngestor,
+)
+from saastesa.api.queries import (
+    AnalyticsDimension,
+    FindingFilters,
+    TimeBucket,
+    decode_cursor,
+    encode_cursor,
+)
 from saastesa.api.schemas import (
+    CountBucketOut,
     FindingReferencesOut,
     FindingResourceOut,
     FindingsSummaryOut,
+    IngestAcceptedResponse,
+    IngestBatchOut,
     IngestFindingsRequest,
     IngestFindingsResponse,
+    IngestNdjsonResponse,
     IngestSignalsRequest,
     IngestSignalsResponse,
+    NdjsonLineErrorOut,
     SecurityFindingOut,
+    TimeBucketOut,
+    security_findings_from_payload,
+)
+from saastesa.api.store import (
+    AsyncFindingStore,
+    SQLAlchemyFindingStore,
+    ThreadedFindingStore,
+    create_async_store,
 )
-from saastesa.api.store import SQLAlchemyFindingStore
-from saastesa.core.models import FindingReferences, FindingResource, SecurityFinding, ThreatSignal
-from saastesa.pipelines.analyze import analyze_signals
+from saastesa.core.contracts import FindingDomain, FindingSeverity, FindingStatus
+from saastesa.core.models import SecurityFinding, ThreatSignal
+from saastesa.core.serialization import dumps_json
+from saastesa.pipelines.analyze import SignalAnalyzer, load_analysis_options, policy_reloader
+from saastesa.pipelines.dedup import create_signal_deduplicator
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+_MAX_NDJSON_LINE_BYTES = 1_048_576
+_MAX_REPORTED_LINE_ERRORS = 100
 
 
 def _to_findings_out(findings: Iterable[SecurityFinding]) -> list[SecurityFindingOut]:
@@ -60,50 +104,44 @@ def _to_findings_out(findings: Iterable[SecurityFinding]) -> list[SecurityFindin
     ]
 
 
-def _from_findings_in(payload_findings: list[SecurityFindingOut]) -> list[SecurityFinding]:
-    return [
-        SecurityFinding(
-            finding_uid=finding.finding_uid,
-            standard=finding.standard,
-            schema_version=finding.schema_version,
-            status=finding.status,
-            severity_id=finding.severity_id,
-            severity=finding.severity,
-            risk_score=finding.risk_score,
-            title=finding.title,
-            description=finding.description,
-            category_name=finding.category_name,
-            class_name=finding.class_name,
-            type_name=finding.type_name,
-            domain=finding.domain,
-            activity_name=finding.activity_name,
-            time=finding.time,
-            source=finding.source,
-            resource=FindingResource(
-                uid=finding.resource.uid,
-                name=finding.resource.name,
-                type=finding.resource.type,
-                platform=finding.resource.platform,
-            ),
-            references=FindingReferences(
-                cve=tuple(finding.references.cve),
-                cwe=tuple(finding.references.cwe),
-                owasp=tuple(finding.references.owasp),
-                mitre_attack=tuple(finding.references.mitre_attack),
-            ),
-            raw_data=finding.raw_data,
-        )
-        for finding in payload_findings
-    ]
-
-
 def create_app(database_url: str | None = None) -> FastAPI:
-    app = FastAPI(title="SaaS TESA API", version="0.1.0")
     effective_database_url = database_url or resolve_database_url()
     if database_url is None and "PYTEST_CURRENT_TEST" in os.environ:
         effective_database_url = "sqlite+pysqlite:///:memory:"
-    store = SQLAlchemyFindingStore(create_db_engine(effective_database_url))
-    store.init()
+    store = create_async_store(
+        effective_database_url,
+        resource_cache_size=int(os.getenv("TESA_RESOURCE_CACHE_SIZE", "20000")),
+    )
+    if isinstance(store, ThreadedFindingStore):
+        store.store.init()
+    risk_policy = policy_reloader()
+    analyzer = SignalAnalyzer(
+        load_analysis_options(), None if risk_policy is None else risk_policy.current
+    )
+    ingestor = _create_ingestor(store, analyzer)
+    archive_job = _create_archive_job(store, effective_database_url)
+    deduplicator = create_signal_deduplicator()
+
+    @asynccontextmanager
+    async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+        if not isinstance(store, ThreadedFindingStore):
+            await store.init()
+        await run_in_threadpool(analyzer.start)
+        if ingestor is not None:
+            if isinstance(ingestor.store, EventLoopWriter):
+                ingestor.store.bind(asyncio.get_running_loop())
+            ingestor.start()
+        if archive_job is not None:
+            archive_job.start()
+        yield
+        if archive_job is not None:
+            await run_in_threadpool(archive_job.stop)
+        if ingestor is not None:
+            await run_in_threadpool(ingestor.stop)
+        await run_in_threadpool(analyzer.close)
+        await store.close()
+
+    app = FastAPI(title="SaaS TESA API", version="0.1.0", lifespan=lifespan)
 
     cors_origins = os.getenv(
         "TESA_CORS_ORIGINS",
@@ -120,16 +158,42 @@ def create_app(database_url: str | None = None) -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=[NEXT_CURSOR_HEADER, "ETag"],
+    )
+    app.add_middleware(
+        RequestDecompressionMiddleware,
+        max_body_bytes=int(os.getenv("TESA_MAX_DECOMPRESSED_BODY_BYTES", "268435456")),
     )
 
     db_engine = _database_engine_name(effective_database_url)
 
     @app.get("/health")
-    def health() -> dict[str, Any]:
+    async def health() -> dict[str, Any]:
         return {"status": "ok", "database_engine": db_engine}
 
-    @app.post("/api/v1/signals", response_model=IngestSignalsResponse)
-    def ingest_signals(request: IngestSignalsRequest) -> IngestSignalsResponse:
+    @app.get("/api/v1/metrics")
+    async def metrics() -> dict[str, Any]:
+        cache_stats = store.resource_cache_stats()
+        payload: dict[str, Any] = {
+            "resource_cache": {**asdict(cache_stats), "hit_ratio": round(cache_stats.hit_ratio, 4)},
+            "database_pool": asdict(store.pool_stats()),
+        }
+        if ingestor is not None:
+            payload["ingest_queue"] = asdict(ingestor.stats())
+        if archive_job is not None:
+            payload["archive"] = asdict(archive_job.stats())
+        if risk_policy is not None:
+            payload["risk_policy"] = asdict(risk_policy.stats())
+        if deduplicator is not None:
+            payload["signal_dedup"] = asdict(deduplicator.stats())
+        return payload
+
+    @app.post(
+        "/api/v1/signals",
+        response_model=IngestSignalsResponse,
+        responses={202: {"model": IngestAcceptedResponse}},
+    )
+    async def ingest_signals(request: IngestSignalsRequest) -> IngestSignalsResponse | Response:
         signals = [
             ThreatSignal(
                 source=signal.source,
@@ -140,27 +204,268 @@ def create_app(database_url: str | None = None) -> FastAPI:
             )
             for signal in request.signals
         ]
-        findings = analyze_signals(signals)
-        store.add(findings)
-        return IngestSignalsResponse(ingested=len(signals), findings=_to_findings_out(findings))
-
-    @app.post("/api/v1/findings", response_model=IngestFindingsResponse)
-    def ingest_findings(request: IngestFindingsRequest) -> IngestFindingsResponse:
-        findings = _from_findings_in(request.findings)
-        store.add(findings)
+        if deduplicator is not None:
+            signals = deduplicator.collapse(signals)
+        if ingestor is not None:
+            return _accepted(lambda: ingestor.submit_signals(signals))
+        findings = await run_in_threadpool(analyzer.analyze, signals)
+        await store.add(findings)
+        return IngestSignalsResponse(
+            ingested=len(request.signals), findings=_to_findings_out(findings)
+        )
+
+    @app.post(
+        "/api/v1/findings",
+        response_model=IngestFindingsResponse,
+        responses={202: {"model": IngestAcceptedResponse}},
+    )
+    async def ingest_findings(request: IngestFindingsRequest) -> IngestFindingsResponse | Response:
+        findings = security_findings_from_payload(request.findings)
+        if ingestor is not None:
+            return _accepted(lambda: ingestor.submit_findings(findings))
+        await store.add(findings)
         return IngestFindingsResponse(ingested=len(findings))
 
+    @app.post("/api/v1/findings/ndjson", response_model=IngestNdjsonResponse)
+    async def ingest_findings_ndjson(request: Request) -> IngestNdjsonResponse:
+        chunk_size = max(int(os.getenv("TESA_NDJSON_CHUNK_SIZE", "1000")), 1)
+        pending: list[SecurityFindingOut] = []
+        errors: list[NdjsonLineErrorOut] = []
+        ingested = 0
+        rejected = 0
+        async for line_number, line in _ndjson_lines(request.stream()):
+            problem: str | None = None
+            if line is None:
+                problem = f"line exceeds {_MAX_NDJSON_LINE_BYTES} bytes"
+            else:
+                try:
+                    pending.append(SecurityFindingOut.model_validate_json(line))
+                except ValidationError as error:
+                    problem = _validation_message(error)
+            if problem is not None:
+                rejected += 1
+                if len(errors) < _MAX_REPORTED_LINE_ERRORS:
+                    errors.append(NdjsonLineErrorOut(line=line_number, error=problem))
+                continue
+            if len(pending) >= chunk_size:
+                await store.add(security_findings_from_payload(pending))
+                ingested += len(pending)
+                pending = []
+        if pending:
+            await store.add(security_findings_from_payload(pending))
+            ingested += len(pending)
+        return IngestNdjsonResponse(ingested=ingested, rejected=rejected, errors=errors)
+
+    @app.get("/api/v1/ingest/batches/{batch_id}", response_model=IngestBatchOut)
+    async def ingest_batch_status(batch_id: str) -> IngestBatchOut:
+        status = ingestor.status(batch_id) if ingestor is not None else None
+        if status is None:
+            raise HTTPException(status_code=404, detail=f"Unknown ingest batch: {batch_id}")
+        return IngestBatchOut(
+            batch_id=status.batch_id,
+            status=status.state.value,
+            accepted=status.accepted,
+            enqueued_at=status.enqueued_at,
+            committed_at=status.committed_at,
+            error=status.error,
+        )
+
     @app.get("/api/v1/findings", response_model=list[SecurityFindingOut])
-    def list_findings(limit: int = Query(default=100, ge=1, le=1000)) -> list[SecurityFindingOut]:
-        return _to_findings_out(store.list(limit=limit))
+    async def list_findings(
+        request: Request,
+        limit: int = Query(default=100, ge=1, le=1000),
+        cursor: str | None = None,
+        domain: FindingDomain | None = None,
+        source: str | None = None,
+        severity: FindingSeverity | None = None,
+        status: FindingStatus | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> Response:
+        try:
+            page_cursor = decode_cursor(cursor) if cursor else None
+        except ValueError as error:
+            raise HTTPException(status_code=400, detail=str(error)) from error
+
+        version = await store.data_version()
+        if is_not_modified(request, version):
+            return not_modified_response(request, version)
+
+        filters = FindingFilters(
+            domain=domain, source=source, severity=severity, status=status, since=since, until=until
+        )
+        page = await store.list_documents_page(limit=limit, filters=filters, cursor=page_cursor)
+        headers = validator_headers(request, version)
+        if page.next_cursor is not None:
+            headers[NEXT_CURSOR_HEADER] = encode_cursor(page.next_cursor)
+        return Response(
+            content=dumps_json(page.documents), media_type="application/json", headers=headers
+        )
+
+    @app.get("/api/v1/findings/export", response_class=StreamingResponse)
+    async def export_findings(
+        export_format: Annotated[ExportFormat, Query(alias="format")] = ExportFormat.NDJSON,
+        domain: FindingDomain | None = None,
+        source: str | None = None,
+        severity: FindingSeverity | None = None,
+        status: FindingStatus | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> StreamingResponse:
+        filters = FindingFilters(
+            domain=domain, source=source, severity=severity, status=status, since=since, until=until
+        )
+        batch_size = int(os.getenv("TESA_EXPORT_BATCH_SIZE", "1000"))
+        return StreamingResponse(
+            store.export(filters, export_format, batch_size),
+            media_type=export_format.media_type,
+            headers={
+                "Content-Disposition": f'attachment; filename="findings.{export_format.value}"'
+            },
+        )
 
     @app.get("/api/v1/summary", response_model=FindingsSummaryOut)
-    def findings_summary() -> FindingsSummaryOut:
-        return FindingsSummaryOut(**store.summary())
+    async def findings_summary(
+        request: Request,
+        response: Response,
+        domain: FindingDomain | None = None,
+        status: FindingStatus | None = None,
+    ) -> FindingsSummaryOut | Response:
+        version = await store.data_version()
+        if is_not_modified(request, version):
+            return not_modified_response(request, version)
+        response.headers.update(validator_headers(request, version))
+        return FindingsSummaryOut(**await store.summary(domain=domain, status=status))
+
+    @app.get("/api/v1/analytics/counts", response_model=list[CountBucketOut])
+    async def analytics_counts(
+        request: Request,
+        response: Response,
+        group_by: AnalyticsDimension,
+        domain: FindingDomain | None = None,
+        source: str | None = None,
+        severity: FindingSeverity | None = None,
+        status: FindingStatus | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[CountBucketOut] | Response:
+        version = await store.data_version()
+        if is_not_modified(request, version):
+            return not_modified_response(request, version)
+        response.headers.update(validator_headers(request, version))
+        filters = FindingFilters(
+            domain=domain, source=source, severity=severity, status=status, since=since, until=until
+        )
+        counts = await store.count_by(group_by, filters)
+        return [CountBucketOut(key=key, count=count) for key, count in counts]
+
+    @app.get("/api/v1/analytics/histogram", response_model=list[TimeBucketOut])
+    async def analytics_histogram(
+        request: Request,
+        response: Response,
+        interval: TimeBucket = TimeBucket.DAY,
+        domain: FindingDomain | None = None,
+        source: str | None = None,
+        severity: FindingSeverity | None = None,
+        status: FindingStatus | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[TimeBucketOut] | Response:
+        version = await store.data_version()
+        if is_not_modified(request, version):
+            return not_modified_response(request, version)
+        response.headers.update(validator_headers(request, version))
+        filters = FindingFilters(
+            domain=domain, source=source, severity=severity, status=status, since=since, until=until
+        )
+        buckets = await store.histogram(interval, filters)
+        return [
+            TimeBucketOut(bucket_start=bucket_start, count=count) for bucket_start, count in buckets
+        ]
 
     return app
 
 
+def _create_ingestor(
+    store: AsyncFindingStore, analyzer: SignalAnalyzer
+) -> WriteBehindIngestor | None:
+    if os.getenv("TESA_INGEST_MODE", "sync").strip().lower() != "async":
+        return None
+    writer = store.store if isinstance(store, ThreadedFindingStore) else EventLoopWriter(store)
+    return WriteBehindIngestor(
+        writer,
+        max_queued_batches=int(os.getenv("TESA_INGEST_QUEUE_BATCHES", "1000")),
+        max_group_findings=int(os.getenv("TESA_INGEST_GROUP_FINDINGS", "5000")),
+        max_group_wait_seconds=int(os.getenv("TESA_INGEST_GROUP_WAIT_MS", "50")) / 1000,
+        analyze=analyzer.analyze,
+    )
+
+
+def _create_archive_job(store: AsyncFindingStore, database_url: str) -> ArchiveJob | None:
+    interval_seconds = float(os.getenv("TESA_ARCHIVE_INTERVAL_SECONDS", "0"))
+    if interval_seconds <= 0:
+        return None
+    if isinstance(store, ThreadedFindingStore):
+        archive_store = store.store
+    else:
+        archive_store = SQLAlchemyFindingStore(create_db_engine(sync_database_url(database_url)))
+    return ArchiveJob(
+        archive_store,
+        Path(os.getenv("TESA_ARCHIVE_DIR", "archive")),
+        retain_days=int(os.getenv("TESA_ARCHIVE_AFTER_DAYS", "90")),
+        rotation=ArchiveRotation(os.getenv("TESA_ARCHIVE_ROTATION", "day").strip().lower()),
+        batch_size=int(os.getenv("TESA_ARCHIVE_BATCH_SIZE", "1000")),
+        interval_seconds=interval_seconds,
+    )
+
+
+def _accepted(submit: Callable[[], IngestBatchStatus]) -> Response:
+    try:
+        status = submit()
+    except IngestQueueFullError as error:
+        raise HTTPException(
+            status_code=503, detail=str(error), headers={"Retry-After": "1"}
+        ) from error
+    accepted = IngestAcceptedResponse(
+        batch_id=status.batch_id, status=status.state.value, accepted=status.accepted
+    )
+    return JSONResponse(status_code=202, content=accepted.model_dump())
+
+
+async def _ndjson_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[tuple[int, bytes | None]]:
+    buffer = bytearray()
+    line_number = 0
+    overlong = False
+    async for chunk in chunks:
+        buffer += chunk
+        start = 0
+        while (end := buffer.find(b"\n", start)) != -1:
+            line_number += 1
+            if overlong or end - start > _MAX_NDJSON_LINE_BYTES:
+                overlong = False
+                yield line_number, None
+            elif line := bytes(buffer[start:end]).strip():
+                yield line_number, line
+            start = end + 1
+        del buffer[:start]
+        if len(buffer) > _MAX_NDJSON_LINE_BYTES:
+            overlong = True
+            buffer.clear()
+    if overlong:
+        yield line_number + 1, None
+    elif buffer.strip():
+        yield line_number + 1, bytes(buffer).strip()
+
+
+def _validation_message(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in detail['loc'])}: {detail['msg']}"
+        if detail["loc"]
+        else detail["msg"]
+        for detail in error.errors()
+    )
+
+
 def _database_engine_name(database_url: str) -> str:
     scheme = urlsplit(database_url).scheme.lower()
     if scheme.startswith("sqlite"):
@@ -176,7 +481,13 @@ app = create_app()
 def serve() -> None:
     host = os.getenv("TESA_API_HOST", "0.0.0.0")
     port = int(os.getenv("TESA_API_PORT", "8080"))
-    uvicorn.run("saastesa.api.main:app", host=host, port=port, reload=False)
+    uvicorn.run(
+        "saastesa.api.main:app",
+        host=host,
+        port=port,
+        reload=False,
+        timeout_keep_alive=int(os.getenv("TESA_API_KEEPALIVE_SECONDS", "75")),
+    )
 
 
 if __name__ == "__main__":
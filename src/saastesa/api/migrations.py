@@ -1,48 +1,349 @@
 import json
-from datetime import datetime
+import os
+import re
+from collections.abc import Iterable
+from datetime import UTC, date, datetime
 from typing import Any, cast
 
-from sqlalchemy import Engine, inspect, text
+from sqlalchemy import (
+    Column,
+    Connection,
+    Engine,
+    ForeignKeyConstraint,
+    Index,
+    MetaData,
+    PrimaryKeyConstraint,
+    Table,
+    UniqueConstraint,
+    delete,
+    func,
+    inspect,
+    select,
+    text,
+    update,
+)
 
 from saastesa.api.db_models import (
     Base,
+    DataVersionRecord,
     FindingReferenceItemRecord,
     FindingResourceRecord,
+    FindingSummaryCounterRecord,
     SecurityFindingRecord,
 )
+from saastesa.api.queries import risk_band_expression
 from saastesa.core.contracts import FindingReferenceType
 
 _LEGACY_REFERENCE_COLUMN = "references_json"
 _LEGACY_RESOURCE_COLUMNS = {"resource_uid", "resource_name", "resource_type", "resource_platform"}
+_PARTITION_NAME = re.compile(r"_p(\d{4})(\d{2})$")
+_STAGING_SUFFIX = "_staging"
+DATA_VERSION_ROW_ID = 1
+PARTITIONED_TABLES = (
+    SecurityFindingRecord.__tablename__,
+    FindingReferenceItemRecord.__tablename__,
+)
 
 
 def migrate_schema(engine: Engine) -> None:
     with engine.begin() as connection:
-        inspector = inspect(connection)
-        table_names = set(inspector.get_table_names())
-
-        if "security_findings" not in table_names:
-            Base.metadata.create_all(connection)
-            return
-
-        security_findings_columns = {
-            column_info["name"] for column_info in inspector.get_columns("security_findings")
-        }
-        if "resource_id" in security_findings_columns:
-            Base.metadata.create_all(connection)
-            return
-
-        if not _is_legacy_findings_table(security_findings_columns):
-            raise RuntimeError(
-                "Unsupported schema detected for security_findings; cannot migrate automatically."
-            )
+        migrate_connection(connection)
+
+
+def migrate_connection(connection: Connection) -> None:
+    inspector = inspect(connection)
+    table_names = set(inspector.get_table_names())
+
+    if "security_findings" not in table_names:
+        Base.metadata.create_all(connection)
+        _ensure_data_version_row(connection)
+        _apply_partitioning(connection)
+        return
 
+    security_findings_columns = {
+        column_info["name"] for column_info in inspector.get_columns("security_findings")
+    }
+    if "resource_id" in security_findings_columns:
+        Base.metadata.create_all(connection)
+        _add_reference_finding_time(connection)
+    elif _is_legacy_findings_table(security_findings_columns):
         _migrate_legacy_security_findings(connection)
-        _sync_identity_sequences(connection, engine.dialect.name)
+        _sync_identity_sequences(connection, connection.dialect.name)
+    else:
+        raise RuntimeError(
+            "Unsupported schema detected for security_findings; cannot migrate automatically."
+        )
+
+    if FindingSummaryCounterRecord.__tablename__ not in table_names:
+        rebuild_summary_counters(connection)
+    _ensure_data_version_row(connection)
+    _apply_partitioning(connection)
+
+
+def rebuild_summary_counters(connection: Connection) -> int:
+    risk_band = risk_band_expression(SecurityFindingRecord.risk_score)
+    aggregate = select(
+        risk_band,
+        SecurityFindingRecord.domain,
+        SecurityFindingRecord.status,
+        func.count(),
+    ).group_by(risk_band, SecurityFindingRecord.domain, SecurityFindingRecord.status)
+
+    connection.execute(delete(FindingSummaryCounterRecord))
+    connection.execute(
+        cast(Any, FindingSummaryCounterRecord.__table__).insert().from_select(
+            ["risk_band", "domain", "status", "finding_count"], aggregate
+        )
+    )
+    total = connection.scalar(select(func.sum(FindingSummaryCounterRecord.finding_count)))
+    return int(total or 0)
+
+
+def findings_partitioned(connection: Connection) -> bool:
+    if connection.dialect.name != "postgresql":
+        return False
+    partitioned = connection.scalar(
+        text(
+            "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table "
+            "WHERE partrelid = to_regclass(:table_name))"
+        ),
+        {"table_name": SecurityFindingRecord.__tablename__},
+    )
+    return bool(partitioned)
+
+
+def month_start(value: datetime) -> date:
+    moment = value.replace(tzinfo=UTC) if value.tzinfo is None else value.astimezone(UTC)
+    return date(moment.year, moment.month, 1)
+
+
+def ensure_month_partitions(connection: Connection, months: Iterable[date]) -> None:
+    wanted = set(months)
+    if not wanted:
+        return
+    for parent in PARTITIONED_TABLES:
+        for month in sorted(wanted - _partition_months(connection, parent).keys()):
+            _create_month_partition(connection, parent, parent, month)
+
+
+def drop_expired_partitions(connection: Connection, cutoff: datetime) -> list[date]:
+    findings_table, references_table = PARTITIONED_TABLES
+    partitions = _partition_months(connection, findings_table)
+    expired = _expired_months(partitions, cutoff)
+    reference_partitions = _partition_months(connection, references_table)
+    for month in expired:
+        for parent, partition in (
+            (references_table, reference_partitions.get(month)),
+            (findings_table, partitions[month]),
+        ):
+            if partition is None:
+                continue
+            connection.execute(text(f'ALTER TABLE "{parent}" DETACH PARTITION "{partition}"'))
+            connection.execute(text(f'DROP TABLE "{partition}"'))
+    return expired
+
+
+def _apply_partitioning(connection: Connection) -> None:
+    if connection.dialect.name != "postgresql" or not _partitioning_requested():
+        return
+    if not findings_partitioned(connection):
+        _partition_findings_tables(connection)
+    ensure_month_partitions(connection, _upcoming_months(datetime.now(tz=UTC)))
+
+
+def _partitioning_requested() -> bool:
+    layout = os.getenv("TESA_DB_PARTITIONING", "none").strip().lower()
+    if layout not in {"none", "monthly"}:
+        raise ValueError(f"Unsupported TESA_DB_PARTITIONING value: {layout!r}")
+    return layout == "monthly"
+
+
+def _upcoming_months(now: datetime) -> list[date]:
+    months = [month_start(now)]
+    for _ in range(int(os.getenv("TESA_DB_PARTITION_PREMAKE_MONTHS", "2"))):
+        months.append(_next_month(months[-1]))
+    return months
+
+
+def _next_month(month: date) -> date:
+    if month.month == 12:
+        return date(month.year + 1, 1, 1)
+    return date(month.year, month.month + 1, 1)
+
+
+def _expired_months(months: Iterable[date], cutoff: datetime) -> list[date]:
+    cutoff_utc = cutoff.replace(tzinfo=UTC) if cutoff.tzinfo is None else cutoff.astimezone(UTC)
+    return sorted(
+        month
+        for month in months
+        if datetime.combine(_next_month(month), datetime.min.time(), UTC) <= cutoff_utc
+    )
+
+
+def _partition_months(connection: Connection, parent: str) -> dict[date, str]:
+    names = connection.scalars(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = to_regclass(:parent)"
+        ),
+        {"parent": parent},
+    )
+    months: dict[date, str] = {}
+    for name in names:
+        match = _PARTITION_NAME.search(name)
+        if match is not None:
+            months[date(int(match[1]), int(match[2]), 1)] = name
+    return months
+
+
+def _create_month_partition(connection: Connection, parent: str, base: str, month: date) -> None:
+    connection.execute(
+        text(
+            f'CREATE TABLE IF NOT EXISTS "{base}_p{month:%Y%m}" PARTITION OF "{parent}" '
+            f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') "
+            f"TO ('{_next_month(month).isoformat()} 00:00:00+00')"
+        )
+    )
+
+
+def _partition_findings_tables(connection: Connection) -> None:
+    findings, references = _partitioned_tables(_STAGING_SUFFIX)
+    findings.create(connection)
+    references.create(connection)
+
+    months = connection.scalars(
+        select(
+            func.date_trunc("month", SecurityFindingRecord.time.op("AT TIME ZONE")("UTC"))
+        ).distinct()
+    )
+    for month in sorted({value.date() for value in months}):
+        for table, base in zip((findings, references), PARTITIONED_TABLES, strict=True):
+            _create_month_partition(connection, table.name, base, month)
+
+    findings_source = cast(Table, SecurityFindingRecord.__table__)
+    references_source = cast(Table, FindingReferenceItemRecord.__table__)
+    connection.execute(
+        findings.insert().from_select(
+            [column.name for column in findings_source.columns], select(findings_source)
+        )
+    )
+    connection.execute(
+        references.insert().from_select(
+            ["id", "finding_id", "reference_type", "reference_value", "finding_time"],
+            select(
+                references_source.c.id,
+                references_source.c.finding_id,
+                references_source.c.reference_type,
+                references_source.c.reference_value,
+                findings_source.c.time,
+            ).join(findings_source, findings_source.c.id == references_source.c.finding_id),
+        )
+    )
+    references_source.drop(connection)
+    findings_source.drop(connection)
+    for table, name in zip((findings, references), PARTITIONED_TABLES, strict=True):
+        connection.execute(text(f'ALTER TABLE "{table.name}" RENAME TO "{name}"'))
+    _sync_identity_sequences(connection, connection.dialect.name)
+
+
+def _partitioned_tables(suffix: str = "") -> tuple[Table, Table]:
+    metadata = MetaData()
+    cast(Table, FindingResourceRecord.__table__).to_metadata(metadata)
+    findings_source = cast(Table, SecurityFindingRecord.__table__)
+    references_source = cast(Table, FindingReferenceItemRecord.__table__)
+
+    findings = Table(
+        f"{findings_source.name}{suffix}",
+        metadata,
+        *_partition_columns(findings_source, {"id", "time"}),
+        PrimaryKeyConstraint("id", "time", name="pk_security_findings_part"),
+        UniqueConstraint("finding_uid", "time", name="uq_security_findings_part_uid_time"),
+        ForeignKeyConstraint(
+            ["resource_id"], ["finding_resources.id"], name="fk_security_findings_part_resource"
+        ),
+        *_partition_indexes(findings_source, "security_findings_part"),
+        postgresql_partition_by="RANGE (time)",
+    )
+    references = Table(
+        f"{references_source.name}{suffix}",
+        metadata,
+        *_partition_columns(references_source, {"id", "finding_time"}),
+        PrimaryKeyConstraint("id", "finding_time", name="pk_finding_reference_items_part"),
+        UniqueConstraint(
+            "finding_id",
+            "reference_type",
+            "reference_value",
+            "finding_time",
+            name="uq_finding_reference_items_part",
+        ),
+        ForeignKeyConstraint(
+            ["finding_id", "finding_time"],
+            [findings.c.id, findings.c.time],
+            name="fk_finding_reference_items_part_finding",
+            ondelete="CASCADE",
+        ),
+        *_partition_indexes(references_source, "finding_reference_items_part"),
+        postgresql_partition_by="RANGE (finding_time)",
+    )
+    return findings, references
+
+
+def _partition_columns(source: Table, key_columns: set[str]) -> list[Column[Any]]:
+    return [
+        Column(
+            column.name,
+            column.type,
+            nullable=column.nullable and column.name not in key_columns,
+            autoincrement=column.name == "id",
+        )
+        for column in source.columns
+    ]
+
+
+def _partition_indexes(source: Table, prefix: str) -> list[Index]:
+    return [
+        Index(f"ix_{prefix}_{column.name}", column.name)
+        for column in source.columns
+        if column.index or column.unique
+    ]
+
+
+def _add_reference_finding_time(connection: Connection) -> None:
+    columns = {
+        column_info["name"]
+        for column_info in inspect(connection).get_columns(FindingReferenceItemRecord.__tablename__)
+    }
+    if "finding_time" in columns:
+        return
+    connection.execute(
+        text("ALTER TABLE finding_reference_items ADD COLUMN finding_time TIMESTAMP WITH TIME ZONE")
+    )
+    connection.execute(
+        update(FindingReferenceItemRecord).values(
+            finding_time=select(SecurityFindingRecord.time)
+            .where(SecurityFindingRecord.id == FindingReferenceItemRecord.finding_id)
+            .scalar_subquery()
+        )
+    )
+
+
+def _ensure_data_version_row(connection: Connection) -> None:
+    existing = connection.scalar(
+        select(DataVersionRecord.id).where(DataVersionRecord.id == DATA_VERSION_ROW_ID)
+    )
+    if existing is None:
+        connection.execute(
+            cast(Any, DataVersionRecord.__table__).insert().values(
+                id=DATA_VERSION_ROW_ID, version=0, updated_at=datetime.now(tz=UTC)
+            )
+        )
 
 
 def _is_legacy_findings_table(column_names: set[str]) -> bool:
-    return _LEGACY_REFERENCE_COLUMN in column_names and _LEGACY_RESOURCE_COLUMNS.issubset(column_names)
+    return _LEGACY_REFERENCE_COLUMN in column_names and _LEGACY_RESOURCE_COLUMNS.issubset(
+        column_names
+    )
 
 
 def _migrate_legacy_security_findings(connection: Any) -> None:
@@ -50,7 +351,9 @@ def _migrate_legacy_security_findings(connection: Any) -> None:
     _drop_legacy_indexes(connection)
     Base.metadata.create_all(connection)
 
-    legacy_rows = connection.execute(text("SELECT * FROM security_findings_legacy")).mappings().all()
+    legacy_rows = (
+        connection.execute(text("SELECT * FROM security_findings_legacy")).mappings().all()
+    )
     if not legacy_rows:
         connection.execute(text("DROP TABLE security_findings_legacy"))
         return
@@ -102,13 +405,15 @@ def _migrate_legacy_security_findings(connection: Any) -> None:
         )
 
         reference_payload = _coerce_json_object(row[_LEGACY_REFERENCE_COLUMN])
-        for reference_type, reference_values in _extract_reference_values(reference_payload).items():
+        reference_items = _extract_reference_values(reference_payload).items()
+        for reference_type, reference_values in reference_items:
             for reference_value in reference_values:
                 connection.execute(
                     cast(Any, FindingReferenceItemRecord.__table__).insert().values(
                         finding_id=row["id"],
                         reference_type=reference_type,
                         reference_value=reference_value,
+                        finding_time=_coerce_datetime(row["time"]),
                     )
                 )
 
@@ -168,9 +473,12 @@ def _sync_identity_sequences(connection: Any, dialect_name: str) -> None:
         return
 
     sequence_sync_sql = [
-        "SELECT setval(pg_get_serial_sequence('finding_resources','id'), COALESCE((SELECT MAX(id) FROM finding_resources), 1), true)",
-        "SELECT setval(pg_get_serial_sequence('security_findings','id'), COALESCE((SELECT MAX(id) FROM security_findings), 1), true)",
-        "SELECT setval(pg_get_serial_sequence('finding_reference_items','id'), COALESCE((SELECT MAX(id) FROM finding_reference_items), 1), true)",
+        "SELECT setval(pg_get_serial_sequence('finding_resources','id'), "
+        "COALESCE((SELECT MAX(id) FROM finding_resources), 1), true)",
+        "SELECT setval(pg_get_serial_sequence('security_findings','id'), "
+        "COALESCE((SELECT MAX(id) FROM security_findings), 1), true)",
+        "SELECT setval(pg_get_serial_sequence('finding_reference_items','id'), "
+        "COALESCE((SELECT MAX(id) FROM finding_reference_items), 1), true)",
     ]
     for sql in sequence_sync_sql:
         connection.execute(text(sql))
\ No newline at end of file
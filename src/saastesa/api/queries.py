@@ -0,0 +1,115 @@
+import base64
+import binascii
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from enum import StrEnum
+from typing import Any
+
+from sqlalchemy import ColumnElement, SQLColumnExpression, and_, case, func, or_
+
+from saastesa.api.db_models import SecurityFindingRecord
+from saastesa.core.contracts import FindingDomain, FindingSeverity, FindingStatus
+from saastesa.core.risk_scoring import CRITICAL_RISK_BAND, RISK_BAND_UPPER_BOUNDS
+
+
+class AnalyticsDimension(StrEnum):
+    DOMAIN = "domain"
+    SOURCE = "source"
+    SEVERITY = "severity"
+    STATUS = "status"
+
+
+class TimeBucket(StrEnum):
+    HOUR = "hour"
+    DAY = "day"
+    WEEK = "week"
+
+
+@dataclass(frozen=True)
+class FindingFilters:
+    domain: FindingDomain | None = None
+    source: str | None = None
+    severity: FindingSeverity | None = None
+    status: FindingStatus | None = None
+    since: datetime | None = None
+    until: datetime | None = None
+
+
+@dataclass(frozen=True)
+class FindingCursor:
+    time: datetime
+    id: int
+
+
+def risk_band_expression(risk_score: SQLColumnExpression[int]) -> ColumnElement[str]:
+    return case(
+        *[(risk_score <= upper_bound, band) for band, upper_bound in RISK_BAND_UPPER_BOUNDS],
+        else_=CRITICAL_RISK_BAND,
+    )
+
+
+def finding_filter_clauses(filters: FindingFilters) -> list[ColumnElement[bool]]:
+    clauses: list[ColumnElement[bool]] = []
+    if filters.domain is not None:
+        clauses.append(SecurityFindingRecord.domain == filters.domain)
+    if filters.source is not None:
+        clauses.append(SecurityFindingRecord.source == filters.source)
+    if filters.severity is not None:
+        clauses.append(SecurityFindingRecord.severity == filters.severity)
+    if filters.status is not None:
+        clauses.append(SecurityFindingRecord.status == filters.status)
+    if filters.since is not None:
+        clauses.append(SecurityFindingRecord.time >= _as_utc(filters.since))
+    if filters.until is not None:
+        clauses.append(SecurityFindingRecord.time < _as_utc(filters.until))
+    return clauses
+
+
+def dimension_column(dimension: AnalyticsDimension) -> SQLColumnExpression[Any]:
+    columns: dict[AnalyticsDimension, SQLColumnExpression[Any]] = {
+        AnalyticsDimension.DOMAIN: SecurityFindingRecord.domain,
+        AnalyticsDimension.SOURCE: SecurityFindingRecord.source,
+        AnalyticsDimension.SEVERITY: SecurityFindingRecord.severity,
+        AnalyticsDimension.STATUS: SecurityFindingRecord.status,
+    }
+    return columns[dimension]
+
+
+def time_bucket_expression(dialect_name: str, bucket: TimeBucket) -> ColumnElement[Any]:
+    if dialect_name == "postgresql":
+        return func.date_trunc(bucket.value, SecurityFindingRecord.time)
+    if dialect_name == "sqlite":
+        modifiers = {
+            TimeBucket.HOUR: ("%Y-%m-%d %H:00:00",),
+            TimeBucket.DAY: ("%Y-%m-%d 00:00:00",),
+            TimeBucket.WEEK: ("%Y-%m-%d 00:00:00", "weekday 0", "-6 days"),
+        }[bucket]
+        return func.strftime(modifiers[0], SecurityFindingRecord.time, *modifiers[1:])
+    raise RuntimeError(f"Time bucketing is not supported for the {dialect_name!r} dialect.")
+
+
+def older_than_cursor_clause(cursor: FindingCursor) -> ColumnElement[bool]:
+    return or_(
+        SecurityFindingRecord.time < cursor.time,
+        and_(SecurityFindingRecord.time == cursor.time, SecurityFindingRecord.id < cursor.id),
+    )
+
+
+def encode_cursor(cursor: FindingCursor) -> str:
+    raw = f"{cursor.time.isoformat()}|{cursor.id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(value: str) -> FindingCursor:
+    try:
+        raw = base64.urlsafe_b64decode(value + "=" * (-len(value) % 4)).decode()
+        time_part, id_part = raw.rsplit("|", 1)
+        return FindingCursor(time=datetime.fromisoformat(time_part), id=int(id_part))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as error:
+        raise ValueError(f"Invalid findings cursor: {value!r}") from error
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(UTC)
@@ -1,26 +1,129 @@
-from collections.abc import Iterable
-from datetime import datetime
+from collections import Counter
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from datetime import UTC, date, datetime
+from hashlib import blake2b
 from threading import Lock
-from typing import cast
+from typing import Any, TypeAlias, TypeVar, cast
 
-from sqlalchemy import Engine, select
+from sqlalchemy import (
+    ColumnElement,
+    Connection,
+    Engine,
+    RowMapping,
+    Select,
+    Table,
+    delete,
+    func,
+    select,
+    text,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 from sqlalchemy.orm import Session, selectinload
 
+from saastesa.api.db import PoolStats, pool_stats
 from saastesa.api.db_models import (
-    Base,
+    DataVersionRecord,
     FindingReferenceItemRecord,
     FindingResourceRecord,
+    FindingSummaryCounterRecord,
     SecurityFindingRecord,
 )
-from saastesa.api.migrations import migrate_schema
+from saastesa.api.export import ExportFormat, aiter_export
+from saastesa.api.migrations import (
+    DATA_VERSION_ROW_ID,
+    drop_expired_partitions,
+    ensure_month_partitions,
+    findings_partitioned,
+    migrate_connection,
+    month_start,
+    rebuild_summary_counters,
+)
+from saastesa.api.queries import (
+    AnalyticsDimension,
+    FindingCursor,
+    FindingFilters,
+    TimeBucket,
+    dimension_column,
+    finding_filter_clauses,
+    older_than_cursor_clause,
+    time_bucket_expression,
+)
+from saastesa.api.resource_cache import ResourceCacheStats, ResourceIdCache, ResourceKey
 from saastesa.core.contracts import (
     CURRENT_FINDING_SCHEMA_VERSION,
+    FindingDomain,
     FindingReferenceType,
     FindingSchemaVersion,
+    FindingStatus,
     JSONValue,
 )
 from saastesa.core.models import FindingReferences, FindingResource, SecurityFinding
-from saastesa.core.risk_scoring import summarize_scores
+from saastesa.core.risk_scoring import RISK_BANDS, risk_band, summarize_scores
+
+CounterKey: TypeAlias = tuple[str, FindingDomain, FindingStatus]
+ReferenceItemKey: TypeAlias = tuple[int, FindingReferenceType, str]
+ReferenceValues: TypeAlias = dict[str, list[str]]
+_T = TypeVar("_T")
+
+_WRITE_CHUNK_SIZE = 500
+_LOOKUP_CHUNK_SIZE = 500
+_FINDINGS_TABLE = cast(Table, SecurityFindingRecord.__table__)
+_RESOURCES_TABLE = cast(Table, FindingResourceRecord.__table__)
+_REFERENCE_ITEMS_TABLE = cast(Table, FindingReferenceItemRecord.__table__)
+_COUNTERS_TABLE = cast(Table, FindingSummaryCounterRecord.__table__)
+_FINDING_UPDATE_COLUMNS = [
+    column.name for column in _FINDINGS_TABLE.columns if column.name not in {"id", "finding_uid"}
+]
+_DOCUMENT_COLUMNS = (
+    SecurityFindingRecord.id,
+    SecurityFindingRecord.finding_uid,
+    SecurityFindingRecord.standard,
+    SecurityFindingRecord.status,
+    SecurityFindingRecord.severity_id,
+    SecurityFindingRecord.severity,
+    SecurityFindingRecord.risk_score,
+    SecurityFindingRecord.title,
+    SecurityFindingRecord.description,
+    SecurityFindingRecord.category_name,
+    SecurityFindingRecord.class_name,
+    SecurityFindingRecord.type_name,
+    SecurityFindingRecord.domain,
+    SecurityFindingRecord.activity_name,
+    SecurityFindingRecord.time,
+    SecurityFindingRecord.source,
+    SecurityFindingRecord.raw_data,
+    FindingResourceRecord.uid.label("resource_uid"),
+    FindingResourceRecord.name.label("resource_name"),
+    FindingResourceRecord.type.label("resource_type"),
+    FindingResourceRecord.platform.label("resource_platform"),
+)
+_EMPTY_REFERENCES: ReferenceValues = {reference: [] for reference in FindingReferenceType}
+_ADVISORY_LOCK_STATEMENT = text(
+    "SELECT pg_advisory_xact_lock(lock_key) "
+    "FROM unnest(CAST(:keys AS bigint[])) AS lock_key ORDER BY lock_key"
+)
+
+
+@dataclass(frozen=True)
+class FindingPage:
+    findings: list[SecurityFinding]
+    next_cursor: FindingCursor | None
+
+
+@dataclass(frozen=True)
+class DataVersion:
+    version: int
+    updated_at: datetime
+
+
+@dataclass(frozen=True)
+class FindingDocumentPage:
+    documents: list[dict[str, Any]]
+    next_cursor: FindingCursor | None
 
 
 class InMemoryFindingStore:
@@ -38,106 +141,466 @@ class InMemoryFindingStore:
                 return []
             return self._findings[-limit:]
 
-    def summary(self) -> dict[str, int]:
+    def summary(
+        self, domain: FindingDomain | None = None, status: FindingStatus | None = None
+    ) -> dict[str, int]:
         with self._lock:
-            return summarize_scores(self._findings)
+            return summarize_scores(
+                finding
+                for finding in self._findings
+                if (domain is None or finding.domain == domain)
+                and (status is None or finding.status == status)
+            )
 
 
 class SQLAlchemyFindingStore:
-    def __init__(self, engine: Engine) -> None:
+    def __init__(self, engine: Engine, resource_cache_size: int = 20_000) -> None:
         self.engine = engine
+        self._resource_cache = ResourceIdCache(resource_cache_size)
+        self._partitioned = False
 
     def init(self) -> None:
-        migrate_schema(self.engine)
+        with self.engine.begin() as connection:
+            self._migrate(connection)
 
     def add(self, findings: list[SecurityFinding]) -> None:
         if not findings:
             return
 
+        batch = _latest_by_uid(findings)
+        try:
+            with Session(self.engine) as session:
+                resource_ids = self._write_batch(session, batch)
+                session.commit()
+        except Exception:
+            self._resource_cache.discard_many(_resource_key(finding.resource) for finding in batch)
+            raise
+        self._resource_cache.put_many(resource_ids)
+
+    def list(
+        self,
+        limit: int = 100,
+        filters: FindingFilters | None = None,
+        cursor: FindingCursor | None = None,
+    ) -> list[SecurityFinding]:
+        return self.list_page(limit=limit, filters=filters, cursor=cursor).findings
+
+    def list_page(
+        self,
+        limit: int = 100,
+        filters: FindingFilters | None = None,
+        cursor: FindingCursor | None = None,
+    ) -> FindingPage:
+        with Session(self.engine) as session:
+            return self._list_page(session, limit, filters, cursor)
+
+    def list_documents_page(
+        self,
+        limit: int = 100,
+        filters: FindingFilters | None = None,
+        cursor: FindingCursor | None = None,
+    ) -> FindingDocumentPage:
+        with Session(self.engine) as session:
+            return self._list_documents_page(session, limit, filters, cursor)
+
+    def iter_findings(
+        self, filters: FindingFilters | None = None, batch_size: int = 1000
+    ) -> Iterator[SecurityFinding]:
+        with Session(self.engine) as session:
+            for record in session.scalars(_export_statement(filters, batch_size)):
+                yield self._from_record(record)
+
+    def summary(
+        self, domain: FindingDomain | None = None, status: FindingStatus | None = None
+    ) -> dict[str, int]:
+        with Session(self.engine) as session:
+            return self._summary(session, domain, status)
+
+    def count_by(
+        self, dimension: AnalyticsDimension, filters: FindingFilters | None = None
+    ) -> Sequence[tuple[str, int]]:
         with Session(self.engine) as session:
-            for finding in findings:
-                resource = self._get_or_create_resource(session, finding.resource)
-                existing = session.scalar(
-                    select(SecurityFindingRecord).where(SecurityFindingRecord.finding_uid == finding.finding_uid)
+            return self._count_by(session, dimension, filters)
+
+    def histogram(
+        self, bucket: TimeBucket, filters: FindingFilters | None = None
+    ) -> Sequence[tuple[datetime, int]]:
+        with Session(self.engine) as session:
+            return self._histogram(session, bucket, filters)
+
+    def resource_cache_stats(self) -> ResourceCacheStats:
+        return self._resource_cache.stats()
+
+    def pool_stats(self) -> PoolStats:
+        return pool_stats(self.engine)
+
+    def rebuild_summary_counters(self) -> int:
+        with self.engine.begin() as connection:
+            return self._rebuild_summary_counters(connection)
+
+    def data_version(self) -> DataVersion:
+        with Session(self.engine) as session:
+            return self._data_version(session)
+
+    def drop_expired_partitions(self, cutoff: datetime) -> Sequence[date]:
+        with self.engine.begin() as connection:
+            return self._drop_expired_partitions(connection, cutoff)
+
+    def archive_candidates(self, cutoff: datetime, limit: int) -> Sequence[SecurityFinding]:
+        statement = _export_statement(FindingFilters(until=cutoff), limit).limit(limit)
+        with Session(self.engine) as session:
+            return [self._from_record(record) for record in session.scalars(statement)]
+
+    def delete_findings(
+        self,
+        finding_uids: Sequence[str],
+        cutoff: datetime,
+        before_commit: Callable[[Sequence[str]], None] | None = None,
+    ) -> Sequence[str]:
+        if not finding_uids:
+            return []
+        expired = finding_filter_clauses(FindingFilters(until=cutoff))
+        with Session(self.engine) as session:
+            self._lock_findings(session, finding_uids)
+            previous = self._expired_findings(session, finding_uids, expired)
+            finding_ids = sorted(previous)
+            for id_chunk in _chunks(finding_ids, _LOOKUP_CHUNK_SIZE):
+                deleted = FindingReferenceItemRecord.finding_id.in_(id_chunk)
+                session.execute(delete(FindingReferenceItemRecord).where(deleted))
+                session.execute(
+                    delete(SecurityFindingRecord).where(
+                        SecurityFindingRecord.id.in_(id_chunk), *expired
+                    )
                 )
-                if existing is None:
-                    record = self._to_record(finding, resource)
-                    self._set_reference_items(record, finding.references)
-                    session.add(record)
-                else:
-                    self._update_record(existing, finding, resource)
+            deltas: Counter[CounterKey] = Counter()
+            for _, key in previous.values():
+                deltas[key] -= 1
+            self._write_counter_deltas(session, deltas)
+            _bump_data_version(session)
+            removed = {finding_uid for finding_uid, _ in previous.values()}
+            deleted_uids = [finding_uid for finding_uid in finding_uids if finding_uid in removed]
+            if before_commit is not None:
+                before_commit(deleted_uids)
             session.commit()
+        return deleted_uids
 
-    def list(self, limit: int = 100) -> list[SecurityFinding]:
+    def _migrate(self, connection: Connection) -> None:
+        migrate_connection(connection)
+        self._partitioned = findings_partitioned(connection)
+
+    def _drop_expired_partitions(self, connection: Connection, cutoff: datetime) -> Sequence[date]:
+        if not self._partitioned:
+            raise RuntimeError(
+                "Partition retention needs the monthly partitioned PostgreSQL layout "
+                "(TESA_DB_PARTITIONING=monthly)."
+            )
+        dropped = drop_expired_partitions(connection, cutoff)
+        if dropped:
+            self._rebuild_summary_counters(connection)
+        return dropped
+
+    def _list_page(
+        self,
+        session: Session,
+        limit: int,
+        filters: FindingFilters | None,
+        cursor: FindingCursor | None,
+    ) -> FindingPage:
         if limit <= 0:
-            return []
+            return FindingPage(findings=[], next_cursor=None)
 
-        with Session(self.engine) as session:
-            rows = session.scalars(
-                select(SecurityFindingRecord)
-                .options(
-                    selectinload(SecurityFindingRecord.resource),
-                    selectinload(SecurityFindingRecord.reference_items),
-                )
-                .order_by(SecurityFindingRecord.time.desc(), SecurityFindingRecord.id.desc())
-                .limit(limit)
-            ).all()
+        statement = (
+            select(SecurityFindingRecord)
+            .options(
+                selectinload(SecurityFindingRecord.resource),
+                selectinload(SecurityFindingRecord.reference_items),
+            )
+            .where(*finding_filter_clauses(filters or FindingFilters()))
+            .order_by(SecurityFindingRecord.time.desc(), SecurityFindingRecord.id.desc())
+            .limit(limit + 1)
+        )
+        if cursor is not None:
+            statement = statement.where(older_than_cursor_clause(cursor))
+        rows = session.scalars(statement).all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = FindingCursor(time=rows[-1].time, id=rows[-1].id)
 
         findings = [self._from_record(row) for row in rows]
         findings.reverse()
-        return findings
-
-    def summary(self) -> dict[str, int]:
-        return summarize_scores(self.list(limit=100000))
-
-    def _to_record(
-        self, finding: SecurityFinding, resource: FindingResourceRecord
-    ) -> SecurityFindingRecord:
-        return SecurityFindingRecord(
-            finding_uid=finding.finding_uid,
-            standard=finding.standard,
-            schema_version=finding.schema_version,
-            status=finding.status,
-            severity_id=finding.severity_id,
-            severity=finding.severity,
-            risk_score=finding.risk_score,
-            title=finding.title,
-            description=finding.description,
-            category_name=finding.category_name,
-            class_name=finding.class_name,
-            type_name=finding.type_name,
-            domain=finding.domain,
-            activity_name=finding.activity_name,
-            time=finding.time,
-            source=finding.source,
-            resource=resource,
-            raw_data=cast(dict[str, object], finding.raw_data),
+        return FindingPage(findings=findings, next_cursor=next_cursor)
+
+    def _list_documents_page(
+        self,
+        session: Session,
+        limit: int,
+        filters: FindingFilters | None,
+        cursor: FindingCursor | None,
+    ) -> FindingDocumentPage:
+        if limit <= 0:
+            return FindingDocumentPage(documents=[], next_cursor=None)
+
+        statement = (
+            select(*_DOCUMENT_COLUMNS)
+            .join(SecurityFindingRecord.resource)
+            .where(*finding_filter_clauses(filters or FindingFilters()))
+            .order_by(SecurityFindingRecord.time.desc(), SecurityFindingRecord.id.desc())
+            .limit(limit + 1)
+        )
+        if cursor is not None:
+            statement = statement.where(older_than_cursor_clause(cursor))
+        rows = session.execute(statement).all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = FindingCursor(time=rows[-1].time, id=rows[-1].id)
+        references = self._references_by_finding(session, [row.id for row in rows])
+
+        documents = [
+            _finding_document(row._mapping, references.get(row.id, _EMPTY_REFERENCES))
+            for row in reversed(rows)
+        ]
+        return FindingDocumentPage(documents=documents, next_cursor=next_cursor)
+
+    def _summary(
+        self, session: Session, domain: FindingDomain | None, status: FindingStatus | None
+    ) -> dict[str, int]:
+        statement = select(
+            FindingSummaryCounterRecord.risk_band,
+            func.sum(FindingSummaryCounterRecord.finding_count),
+        ).group_by(FindingSummaryCounterRecord.risk_band)
+        if domain is not None:
+            statement = statement.where(FindingSummaryCounterRecord.domain == domain)
+        if status is not None:
+            statement = statement.where(FindingSummaryCounterRecord.status == status)
+        rows = session.execute(statement).all()
+
+        buckets = dict.fromkeys(RISK_BANDS, 0)
+        for band, count in rows:
+            buckets[band] = int(count or 0)
+        return buckets
+
+    def _count_by(
+        self, session: Session, dimension: AnalyticsDimension, filters: FindingFilters | None
+    ) -> Sequence[tuple[str, int]]:
+        column = dimension_column(dimension)
+        count = func.count().label("finding_count")
+        statement = (
+            select(column, count)
+            .where(*finding_filter_clauses(filters or FindingFilters()))
+            .group_by(column)
+            .order_by(count.desc(), column)
+        )
+        rows = session.execute(statement).all()
+        return [(str(key), int(value)) for key, value in rows]
+
+    def _histogram(
+        self, session: Session, bucket: TimeBucket, filters: FindingFilters | None
+    ) -> Sequence[tuple[datetime, int]]:
+        bucket_start = time_bucket_expression(session.get_bind().dialect.name, bucket).label(
+            "bucket_start"
+        )
+        statement = (
+            select(bucket_start, func.count())
+            .where(*finding_filter_clauses(filters or FindingFilters()))
+            .group_by(bucket_start)
+            .order_by(bucket_start)
+        )
+        rows = session.execute(statement).all()
+        return [(_bucket_datetime(start), int(value)) for start, value in rows]
+
+    def _rebuild_summary_counters(self, connection: Connection) -> int:
+        total = rebuild_summary_counters(connection)
+        _bump_data_version(connection)
+        return total
+
+    def _data_version(self, session: Session) -> DataVersion:
+        statement = select(DataVersionRecord.version, DataVersionRecord.updated_at).where(
+            DataVersionRecord.id == DATA_VERSION_ROW_ID
+        )
+        row = session.execute(statement).one()
+        return DataVersion(version=int(row.version), updated_at=_as_utc(row.updated_at))
+
+    def _write_batch(
+        self, session: Session, batch: Sequence[SecurityFinding]
+    ) -> dict[ResourceKey, int]:
+        resource_ids = self._resolve_resource_ids(session, [finding.resource for finding in batch])
+        finding_uids = [finding.finding_uid for finding in batch]
+        self._lock_findings(session, finding_uids)
+        previous_keys = self._current_counter_keys(session, finding_uids)
+        if self._partitioned:
+            ensure_month_partitions(
+                session.connection(), {month_start(finding.time) for finding in batch}
+            )
+            self._evict_moved_findings(session, batch)
+        self._upsert_findings(session, batch, resource_ids)
+        self._apply_counter_deltas(session, batch, previous_keys)
+        finding_ids = self._finding_ids(session, finding_uids)
+        self._sync_reference_items(session, batch, finding_ids, previous_keys)
+        _bump_data_version(session)
+        return resource_ids
+
+    def _upsert_findings(
+        self,
+        session: Session,
+        findings: Sequence[SecurityFinding],
+        resource_ids: dict[ResourceKey, int],
+    ) -> None:
+        insert = _dialect_insert(session)
+        rows = [
+            self._to_row(finding, resource_ids[_resource_key(finding.resource)])
+            for finding in findings
+        ]
+        conflict_columns = [_FINDINGS_TABLE.c.finding_uid]
+        if self._partitioned:
+            conflict_columns.append(_FINDINGS_TABLE.c.time)
+        statement = insert(_FINDINGS_TABLE)
+        statement = statement.on_conflict_do_update(
+            index_elements=conflict_columns,
+            set_={column: statement.excluded[column] for column in _FINDING_UPDATE_COLUMNS},
+        )
+        for chunk in _chunks(rows, _WRITE_CHUNK_SIZE):
+            session.execute(statement, chunk)
+
+    def _evict_moved_findings(self, session: Session, findings: Sequence[SecurityFinding]) -> None:
+        times = {finding.finding_uid: _as_utc(finding.time) for finding in findings}
+        moved_ids: list[int] = []
+        for chunk in _chunks(list(times), _LOOKUP_CHUNK_SIZE):
+            rows = session.execute(
+                select(
+                    SecurityFindingRecord.id,
+                    SecurityFindingRecord.finding_uid,
+                    SecurityFindingRecord.time,
+                ).where(SecurityFindingRecord.finding_uid.in_(chunk))
+            )
+            moved_ids.extend(
+                finding_id
+                for finding_id, finding_uid, stored_time in rows
+                if _as_utc(stored_time) != times[finding_uid]
+            )
+        for id_chunk in _chunks(moved_ids, _LOOKUP_CHUNK_SIZE):
+            moved = FindingReferenceItemRecord.finding_id.in_(id_chunk)
+            session.execute(delete(FindingReferenceItemRecord).where(moved))
+            session.execute(
+                delete(SecurityFindingRecord).where(SecurityFindingRecord.id.in_(id_chunk))
+            )
+
+    def _lock_findings(self, session: Session, finding_uids: Sequence[str]) -> None:
+        if session.get_bind().dialect.name == "postgresql":
+            keys = sorted({_advisory_lock_key(finding_uid) for finding_uid in finding_uids})
+            for chunk in _chunks(keys, _LOOKUP_CHUNK_SIZE):
+                session.execute(_ADVISORY_LOCK_STATEMENT, {"keys": list(chunk)})
+            return
+        # SQLite has a single writer: take its lock before reading the rows the batch replaces.
+        session.execute(
+            update(DataVersionRecord)
+            .where(DataVersionRecord.id == DATA_VERSION_ROW_ID)
+            .values(version=DataVersionRecord.version)
         )
 
-    def _update_record(
+    def _current_counter_keys(
+        self, session: Session, finding_uids: Sequence[str]
+    ) -> dict[str, CounterKey]:
+        keys: dict[str, CounterKey] = {}
+        for chunk in _chunks(finding_uids, _LOOKUP_CHUNK_SIZE):
+            rows = session.execute(
+                select(
+                    SecurityFindingRecord.finding_uid,
+                    SecurityFindingRecord.risk_score,
+                    SecurityFindingRecord.domain,
+                    SecurityFindingRecord.status,
+                )
+                .where(SecurityFindingRecord.finding_uid.in_(chunk))
+                .with_for_update()
+            )
+            for finding_uid, risk_score, domain, status in rows:
+                keys[finding_uid] = (risk_band(risk_score), domain, status)
+        return keys
+
+    def _expired_findings(
         self,
-        record: SecurityFindingRecord,
-        finding: SecurityFinding,
-        resource: FindingResourceRecord,
+        session: Session,
+        finding_uids: Sequence[str],
+        expired: Sequence[ColumnElement[bool]],
+    ) -> dict[int, tuple[str, CounterKey]]:
+        found: dict[int, tuple[str, CounterKey]] = {}
+        for chunk in _chunks(finding_uids, _LOOKUP_CHUNK_SIZE):
+            rows = session.execute(
+                select(
+                    SecurityFindingRecord.id,
+                    SecurityFindingRecord.finding_uid,
+                    SecurityFindingRecord.risk_score,
+                    SecurityFindingRecord.domain,
+                    SecurityFindingRecord.status,
+                )
+                .where(SecurityFindingRecord.finding_uid.in_(chunk), *expired)
+                .with_for_update()
+            )
+            for finding_id, finding_uid, risk_score, domain, status in rows:
+                found[finding_id] = (finding_uid, (risk_band(risk_score), domain, status))
+        return found
+
+    def _apply_counter_deltas(
+        self,
+        session: Session,
+        findings: Sequence[SecurityFinding],
+        previous_keys: dict[str, CounterKey],
     ) -> None:
-        record.standard = finding.standard
-        record.schema_version = finding.schema_version
-        record.status = finding.status
-        record.severity_id = finding.severity_id
-        record.severity = finding.severity
-        record.risk_score = finding.risk_score
-        record.title = finding.title
-        record.description = finding.description
-        record.category_name = finding.category_name
-        record.class_name = finding.class_name
-        record.type_name = finding.type_name
-        record.domain = finding.domain
-        record.activity_name = finding.activity_name
-        record.time = finding.time
-        record.source = finding.source
-        record.resource = resource
-        self._set_reference_items(record, finding.references)
-        record.raw_data = cast(dict[str, object], finding.raw_data)
+        deltas: Counter[CounterKey] = Counter()
+        for finding in findings:
+            deltas[_counter_key(finding)] += 1
+            previous = previous_keys.get(finding.finding_uid)
+            if previous is not None:
+                deltas[previous] -= 1
+        self._write_counter_deltas(session, deltas)
+
+    def _write_counter_deltas(self, session: Session, deltas: Counter[CounterKey]) -> None:
+        rows = [
+            {"risk_band": band, "domain": domain, "status": status, "finding_count": delta}
+            for (band, domain, status), delta in sorted(deltas.items())
+            if delta != 0
+        ]
+        if not rows:
+            return
+
+        statement = _dialect_insert(session)(_COUNTERS_TABLE)
+        statement = statement.on_conflict_do_update(
+            index_elements=[
+                _COUNTERS_TABLE.c.risk_band,
+                _COUNTERS_TABLE.c.domain,
+                _COUNTERS_TABLE.c.status,
+            ],
+            set_={
+                "finding_count": _COUNTERS_TABLE.c.finding_count
+                + statement.excluded.finding_count
+            },
+        )
+        session.execute(statement, rows)
+
+    def _to_row(self, finding: SecurityFinding, resource_id: int) -> dict[str, Any]:
+        return {
+            "finding_uid": finding.finding_uid,
+            "standard": finding.standard,
+            "schema_version": finding.schema_version,
+            "status": finding.status,
+            "severity_id": finding.severity_id,
+            "severity": finding.severity,
+            "risk_score": finding.risk_score,
+            "title": finding.title,
+            "description": finding.description,
+            "category_name": finding.category_name,
+            "class_name": finding.class_name,
+            "type_name": finding.type_name,
+            "domain": finding.domain,
+            "activity_name": finding.activity_name,
+            "time": finding.time,
+            "source": finding.source,
+            "resource_id": resource_id,
+            "raw_data": cast(dict[str, object], finding.raw_data),
+        }
 
     def _from_record(self, record: SecurityFindingRecord) -> SecurityFinding:
         references_by_type: dict[FindingReferenceType, list[str]] = {
@@ -182,44 +645,353 @@ class SQLAlchemyFindingStore:
             raw_data=cast(dict[str, JSONValue], dict(record.raw_data or {})),
         )
 
-    def _get_or_create_resource(
-        self, session: Session, resource: FindingResource
-    ) -> FindingResourceRecord:
-        existing = session.scalar(
-            select(FindingResourceRecord).where(
-                FindingResourceRecord.uid == resource.uid,
-                FindingResourceRecord.name == resource.name,
-                FindingResourceRecord.type == resource.type,
-                FindingResourceRecord.platform == resource.platform,
-            )
+    def _resolve_resource_ids(
+        self, session: Session, resources: Sequence[FindingResource]
+    ) -> dict[ResourceKey, int]:
+        keys = sorted({_resource_key(resource) for resource in resources})
+        resolved = self._resource_cache.get_many(keys)
+        uncached = [key for key in keys if key not in resolved]
+        resolved.update(self._select_resource_ids(session, uncached))
+        missing = [key for key in uncached if key not in resolved]
+        if not missing:
+            return resolved
+
+        statement = _dialect_insert(session)(_RESOURCES_TABLE).on_conflict_do_nothing(
+            index_elements=[
+                _RESOURCES_TABLE.c.uid,
+                _RESOURCES_TABLE.c.name,
+                _RESOURCES_TABLE.c.type,
+                _RESOURCES_TABLE.c.platform,
+            ]
         )
-        if existing is not None:
-            return existing
-
-        created = FindingResourceRecord(
-            uid=resource.uid,
-            name=resource.name,
-            type=resource.type,
-            platform=resource.platform,
+        rows = [
+            {"uid": uid, "name": name, "type": type_, "platform": platform}
+            for uid, name, type_, platform in missing
+        ]
+        for chunk in _chunks(rows, _WRITE_CHUNK_SIZE):
+            session.execute(statement, chunk)
+        resolved.update(self._select_resource_ids(session, missing))
+        return resolved
+
+    def _select_resource_ids(
+        self, session: Session, keys: Sequence[ResourceKey]
+    ) -> dict[ResourceKey, int]:
+        identity = tuple_(
+            FindingResourceRecord.uid,
+            FindingResourceRecord.name,
+            FindingResourceRecord.type,
+            FindingResourceRecord.platform,
         )
-        session.add(created)
-        session.flush()
-        return created
+        resolved: dict[ResourceKey, int] = {}
+        for chunk in _chunks(keys, _LOOKUP_CHUNK_SIZE):
+            rows = session.execute(
+                select(
+                    FindingResourceRecord.id,
+                    FindingResourceRecord.uid,
+                    FindingResourceRecord.name,
+                    FindingResourceRecord.type,
+                    FindingResourceRecord.platform,
+                ).where(identity.in_(chunk))
+            )
+            for resource_id, uid, name, type_, platform in rows:
+                resolved[(uid, name, type_, platform)] = resource_id
+        return resolved
+
+    def _finding_ids(self, session: Session, finding_uids: Sequence[str]) -> dict[str, int]:
+        finding_ids: dict[str, int] = {}
+        for chunk in _chunks(finding_uids, _LOOKUP_CHUNK_SIZE):
+            rows = session.execute(
+                select(SecurityFindingRecord.finding_uid, SecurityFindingRecord.id).where(
+                    SecurityFindingRecord.finding_uid.in_(chunk)
+                )
+            )
+            finding_ids.update({finding_uid: finding_id for finding_uid, finding_id in rows})
+        return finding_ids
 
-    def _set_reference_items(
-        self, record: SecurityFindingRecord, references: FindingReferences
+    def _sync_reference_items(
+        self,
+        session: Session,
+        findings: Sequence[SecurityFinding],
+        finding_ids: dict[str, int],
+        existing_uids: Iterable[str],
     ) -> None:
-        items_by_type = {
-            FindingReferenceType.CVE: references.cve,
-            FindingReferenceType.CWE: references.cwe,
-            FindingReferenceType.OWASP: references.owasp,
-            FindingReferenceType.MITRE_ATTACK: references.mitre_attack,
+        desired: set[ReferenceItemKey] = {
+            (finding_ids[finding.finding_uid], reference_type, value)
+            for finding in findings
+            for reference_type, value in _reference_items(finding.references)
         }
-        record.reference_items = [
-            FindingReferenceItemRecord(reference_type=reference_type, reference_value=value)
-            for reference_type, values in items_by_type.items()
-            for value in sorted(set(values))
+        current = self._current_reference_items(
+            session, [finding_ids[finding_uid] for finding_uid in existing_uids]
+        )
+
+        stale_ids = sorted(item_id for key, item_id in current.items() if key not in desired)
+        for id_chunk in _chunks(stale_ids, _LOOKUP_CHUNK_SIZE):
+            stale = FindingReferenceItemRecord.id.in_(id_chunk)
+            session.execute(delete(FindingReferenceItemRecord).where(stale))
+
+        finding_times = {finding_ids[finding.finding_uid]: finding.time for finding in findings}
+        rows = [
+            {
+                "finding_id": finding_id,
+                "reference_type": reference_type,
+                "reference_value": value,
+                "finding_time": finding_times[finding_id],
+            }
+            for finding_id, reference_type, value in sorted(desired - current.keys())
         ]
+        for chunk in _chunks(rows, _WRITE_CHUNK_SIZE):
+            session.execute(_REFERENCE_ITEMS_TABLE.insert(), chunk)
+
+    def _references_by_finding(
+        self, session: Session, finding_ids: Sequence[int]
+    ) -> dict[int, ReferenceValues]:
+        references: dict[int, ReferenceValues] = {}
+        for chunk in _chunks(finding_ids, _LOOKUP_CHUNK_SIZE):
+            statement = (
+                select(
+                    FindingReferenceItemRecord.finding_id,
+                    FindingReferenceItemRecord.reference_type,
+                    FindingReferenceItemRecord.reference_value,
+                )
+                .where(FindingReferenceItemRecord.finding_id.in_(chunk))
+                .order_by(FindingReferenceItemRecord.id)
+            )
+            for finding_id, reference_type, value in session.execute(statement):
+                by_type = references.get(finding_id)
+                if by_type is None:
+                    by_type = references[finding_id] = {
+                        reference: [] for reference in FindingReferenceType
+                    }
+                by_type[reference_type].append(value)
+        return references
+
+    def _current_reference_items(
+        self, session: Session, finding_ids: Sequence[int]
+    ) -> dict[ReferenceItemKey, int]:
+        current: dict[ReferenceItemKey, int] = {}
+        for chunk in _chunks(finding_ids, _LOOKUP_CHUNK_SIZE):
+            rows = session.execute(
+                select(
+                    FindingReferenceItemRecord.id,
+                    FindingReferenceItemRecord.finding_id,
+                    FindingReferenceItemRecord.reference_type,
+                    FindingReferenceItemRecord.reference_value,
+                ).where(FindingReferenceItemRecord.finding_id.in_(chunk))
+            )
+            for item_id, finding_id, reference_type, reference_value in rows:
+                current[(finding_id, reference_type, reference_value)] = item_id
+        return current
+
+
+class AsyncSQLAlchemyFindingStore:
+    def __init__(self, engine: AsyncEngine, resource_cache_size: int = 20_000) -> None:
+        self.engine = engine
+        self._store = SQLAlchemyFindingStore(engine.sync_engine, resource_cache_size)
+
+    async def init(self) -> None:
+        async with self.engine.begin() as connection:
+            await connection.run_sync(self._store._migrate)
+
+    async def close(self) -> None:
+        await self.engine.dispose()
+
+    async def add(self, findings: list[SecurityFinding]) -> None:
+        if not findings:
+            return
+
+        batch = _latest_by_uid(findings)
+        cache = self._store._resource_cache
+        try:
+            async with AsyncSession(self.engine) as session:
+                resource_ids = await session.run_sync(self._store._write_batch, batch)
+                await session.commit()
+        except Exception:
+            cache.discard_many(_resource_key(finding.resource) for finding in batch)
+            raise
+        cache.put_many(resource_ids)
+
+    async def list(
+        self,
+        limit: int = 100,
+        filters: FindingFilters | None = None,
+        cursor: FindingCursor | None = None,
+    ) -> list[SecurityFinding]:
+        return (await self.list_page(limit=limit, filters=filters, cursor=cursor)).findings
+
+    async def list_page(
+        self,
+        limit: int = 100,
+        filters: FindingFilters | None = None,
+        cursor: FindingCursor | None = None,
+    ) -> FindingPage:
+        return await self._run(self._store._list_page, limit, filters, cursor)
+
+    async def list_documents_page(
+        self,
+        limit: int = 100,
+        filters: FindingFilters | None = None,
+        cursor: FindingCursor | None = None,
+    ) -> FindingDocumentPage:
+        return await self._run(self._store._list_documents_page, limit, filters, cursor)
+
+    async def iter_findings(
+        self, filters: FindingFilters | None = None, batch_size: int = 1000
+    ) -> AsyncIterator[SecurityFinding]:
+        async with AsyncSession(self.engine) as session:
+            records = await session.stream_scalars(_export_statement(filters, batch_size))
+            async for record in records:
+                yield self._store._from_record(record)
+
+    def export(
+        self, filters: FindingFilters, export_format: ExportFormat, batch_size: int
+    ) -> AsyncIterator[bytes]:
+        return aiter_export(self.iter_findings(filters, batch_size=batch_size), export_format)
+
+    async def summary(
+        self, domain: FindingDomain | None = None, status: FindingStatus | None = None
+    ) -> dict[str, int]:
+        return await self._run(self._store._summary, domain, status)
+
+    async def count_by(
+        self, dimension: AnalyticsDimension, filters: FindingFilters | None = None
+    ) -> Sequence[tuple[str, int]]:
+        return await self._run(self._store._count_by, dimension, filters)
+
+    async def histogram(
+        self, bucket: TimeBucket, filters: FindingFilters | None = None
+    ) -> Sequence[tuple[datetime, int]]:
+        return await self._run(self._store._histogram, bucket, filters)
+
+    async def data_version(self) -> DataVersion:
+        return await self._run(self._store._data_version)
+
+    async def rebuild_summary_counters(self) -> int:
+        async with self.engine.begin() as connection:
+            return await connection.run_sync(self._store._rebuild_summary_counters)
+
+    async def drop_expired_partitions(self, cutoff: datetime) -> Sequence[date]:
+        async with self.engine.begin() as connection:
+            return await connection.run_sync(self._store._drop_expired_partitions, cutoff)
+
+    def resource_cache_stats(self) -> ResourceCacheStats:
+        return self._store.resource_cache_stats()
+
+    def pool_stats(self) -> PoolStats:
+        return pool_stats(self.engine.sync_engine)
+
+    async def _run(self, operation: Callable[..., _T], *args: Any) -> _T:
+        async with AsyncSession(self.engine) as session:
+            return await session.run_sync(operation, *args)
+
+
+def _dialect_insert(session: Session) -> Callable[[Table], Any]:
+    dialect_name = session.get_bind().dialect.name
+    if dialect_name == "postgresql":
+        return postgresql.insert
+    if dialect_name == "sqlite":
+        return sqlite.insert
+    raise RuntimeError(f"Bulk upsert is not supported for the {dialect_name!r} database dialect.")
+
+
+def _latest_by_uid(findings: Sequence[SecurityFinding]) -> list[SecurityFinding]:
+    latest = {finding.finding_uid: finding for finding in findings}
+    return [latest[finding_uid] for finding_uid in sorted(latest)]
+
+
+def _counter_key(finding: SecurityFinding) -> CounterKey:
+    return (risk_band(finding.risk_score), finding.domain, finding.status)
+
+
+def _resource_key(resource: FindingResource) -> ResourceKey:
+    return (resource.uid, resource.name, resource.type, resource.platform)
+
+
+def _reference_items(references: FindingReferences) -> Iterator[tuple[FindingReferenceType, str]]:
+    items_by_type = {
+        FindingReferenceType.CVE: references.cve,
+        FindingReferenceType.CWE: references.cwe,
+        FindingReferenceType.OWASP: references.owasp,
+        FindingReferenceType.MITRE_ATTACK: references.mitre_attack,
+    }
+    for reference_type, values in items_by_type.items():
+        for value in sorted(set(values)):
+            yield reference_type, value
+
+
+def _chunks(items: Sequence[_T], size: int) -> Iterator[Sequence[_T]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _bucket_datetime(value: datetime | str) -> datetime:
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value
+
+
+def _finding_document(row: RowMapping, references: ReferenceValues) -> dict[str, Any]:
+    return {
+        "finding_uid": row["finding_uid"],
+        "standard": row["standard"],
+        "schema_version": CURRENT_FINDING_SCHEMA_VERSION,
+        "status": row["status"],
+        "severity_id": row["severity_id"],
+        "severity": row["severity"],
+        "risk_score": row["risk_score"],
+        "title": row["title"],
+        "description": row["description"],
+        "category_name": row["category_name"],
+        "class_name": row["class_name"],
+        "type_name": row["type_name"],
+        "domain": row["domain"],
+        "activity_name": row["activity_name"],
+        "time": _ensure_datetime(row["time"]),
+        "source": row["source"],
+        "resource": {
+            "uid": row["resource_uid"],
+            "name": row["resource_name"],
+            "type": row["resource_type"],
+            "platform": row["resource_platform"],
+        },
+        "references": {
+            "cve": references[FindingReferenceType.CVE],
+            "cwe": references[FindingReferenceType.CWE],
+            "owasp": references[FindingReferenceType.OWASP],
+            "mitre_attack": references[FindingReferenceType.MITRE_ATTACK],
+        },
+        "raw_data": row["raw_data"] or {},
+    }
+
+
+def _export_statement(filters: FindingFilters | None, batch_size: int) -> Select[Any]:
+    return (
+        select(SecurityFindingRecord)
+        .options(
+            selectinload(SecurityFindingRecord.resource),
+            selectinload(SecurityFindingRecord.reference_items),
+        )
+        .where(*finding_filter_clauses(filters or FindingFilters()))
+        .order_by(SecurityFindingRecord.time, SecurityFindingRecord.id)
+        .execution_options(yield_per=batch_size)
+    )
+
+
+def _bump_data_version(executor: Session | Connection) -> None:
+    executor.execute(
+        update(DataVersionRecord)
+        .where(DataVersionRecord.id == DATA_VERSION_ROW_ID)
+        .values(version=DataVersionRecord.version + 1, updated_at=datetime.now(tz=UTC))
+    )
+
+
+def _advisory_lock_key(finding_uid: str) -> int:
+    return int.from_bytes(blake2b(finding_uid.encode(), digest_size=8).digest(), signed=True)
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value.astimezone(UTC)
 
 
 def _ensure_datetime(value: datetime) -> datetime:
@@ -0,0 +1,74 @@
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from threading import Lock
+from typing import TypeAlias
+
+ResourceKey: TypeAlias = tuple[str, str, str, str]
+
+
+@dataclass(frozen=True)
+class ResourceCacheStats:
+    capacity: int
+    size: int
+    hits: int
+    misses: int
+    evictions: int
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResourceIdCache:
+    def __init__(self, capacity: int) -> None:
+        self.capacity = max(capacity, 0)
+        self._lock = Lock()
+        self._entries: OrderedDict[ResourceKey, int] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get_many(self, keys: Iterable[ResourceKey]) -> dict[ResourceKey, int]:
+        found: dict[ResourceKey, int] = {}
+        with self._lock:
+            for key in keys:
+                resource_id = self._entries.get(key)
+                if resource_id is None:
+                    self._misses += 1
+                    continue
+                self._entries.move_to_end(key)
+                found[key] = resource_id
+                self._hits += 1
+        return found
+
+    def put_many(self, entries: Mapping[ResourceKey, int]) -> None:
+        if self.capacity == 0:
+            return
+        with self._lock:
+            for key, resource_id in entries.items():
+                self._entries[key] = resource_id
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def discard_many(self, keys: Iterable[ResourceKey]) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> ResourceCacheStats:
+        with self._lock:
+            return ResourceCacheStats(
+                capacity=self.capacity,
+                size=len(self._entries),
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+            )
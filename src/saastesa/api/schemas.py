@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from datetime import datetime
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -12,6 +13,7 @@ from saastesa.core.contracts import (
     FindingStatus,
     JSONValue,
 )
+from saastesa.core.models import FindingReferences, FindingResource, SecurityFinding
 
 
 class ThreatSignalIn(BaseModel):
@@ -91,6 +93,21 @@ class IngestFindingsResponse(BaseModel):
     ingested: int
 
 
+class NdjsonLineErrorOut(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    line: int
+    error: str
+
+
+class IngestNdjsonResponse(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    ingested: int
+    rejected: int
+    errors: list[NdjsonLineErrorOut]
+
+
 class FindingsSummaryOut(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
@@ -98,3 +115,75 @@ class FindingsSummaryOut(BaseModel):
     medium: int
     high: int
     critical: int
+
+
+class CountBucketOut(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    key: str
+    count: int
+
+
+class TimeBucketOut(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    bucket_start: datetime
+    count: int
+
+
+class IngestAcceptedResponse(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    batch_id: str
+    status: str
+    accepted: int
+
+
+class IngestBatchOut(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    batch_id: str
+    status: str
+    accepted: int
+    enqueued_at: datetime
+    committed_at: datetime | None = None
+    error: str | None = None
+
+
+def security_findings_from_payload(
+    payload_findings: Sequence[SecurityFindingOut],
+) -> list[SecurityFinding]:
+    return [
+        SecurityFinding(
+            finding_uid=finding.finding_uid,
+            standard=finding.standard,
+            schema_version=finding.schema_version,
+            status=finding.status,
+            severity_id=finding.severity_id,
+            severity=finding.severity,
+            risk_score=finding.risk_score,
+            title=finding.title,
+            description=finding.description,
+            category_name=finding.category_name,
+            class_name=finding.class_name,
+            type_name=finding.type_name,
+            domain=finding.domain,
+            activity_name=finding.activity_name,
+            time=finding.time,
+            source=finding.source,
+            resource=FindingResource(
+                uid=finding.resource.uid,
+                name=finding.resource.name,
+                type=finding.resource.type,
+                platform=finding.resource.platform,
+            ),
+            references=FindingReferences(
+                cve=tuple(finding.references.cve),
+                cwe=tuple(finding.references.cwe),
+                owasp=tuple(finding.references.owasp),
+                mitre_attack=tuple(finding.references.mitre_attack),
+            ),
+            raw_data=finding.raw_data,
+        )
+        for finding in payload_findings
+    ]
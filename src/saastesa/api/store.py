@@ -1,3 +1,138 @@
-from saastesa.api.repository import InMemoryFindingStore, SQLAlchemyFindingStore
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
+from typing import Protocol
 
-__all__ = ["InMemoryFindingStore", "SQLAlchemyFindingStore"]
+from starlette.concurrency import iterate_in_threadpool, run_in_threadpool
+
+from saastesa.api.db import PoolStats, create_async_db_engine, create_db_engine, use_async_engine
+from saastesa.api.export import ExportFormat, iter_export
+from saastesa.api.queries import AnalyticsDimension, FindingCursor, FindingFilters, TimeBucket
+from saastesa.api.repository import (
+    AsyncSQLAlchemyFindingStore,
+    DataVersion,
+    FindingDocumentPage,
+    InMemoryFindingStore,
+    SQLAlchemyFindingStore,
+)
+from saastesa.api.resource_cache import ResourceCacheStats
+from saastesa.core.contracts import FindingDomain, FindingStatus
+from saastesa.core.models import SecurityFinding
+
+__all__ = [
+    "AsyncFindingStore",
+    "AsyncSQLAlchemyFindingStore",
+    "InMemoryFindingStore",
+    "SQLAlchemyFindingStore",
+    "ThreadedFindingStore",
+    "create_async_store",
+]
+
+
+class AsyncFindingStore(Protocol):
+    async def init(self) -> None:
+        ...
+
+    async def close(self) -> None:
+        ...
+
+    async def add(self, findings: list[SecurityFinding]) -> None:
+        ...
+
+    async def list_documents_page(
+        self,
+        limit: int = 100,
+        filters: FindingFilters | None = None,
+        cursor: FindingCursor | None = None,
+    ) -> FindingDocumentPage:
+        ...
+
+    async def summary(
+        self, domain: FindingDomain | None = None, status: FindingStatus | None = None
+    ) -> dict[str, int]:
+        ...
+
+    async def count_by(
+        self, dimension: AnalyticsDimension, filters: FindingFilters | None = None
+    ) -> Sequence[tuple[str, int]]:
+        ...
+
+    async def histogram(
+        self, bucket: TimeBucket, filters: FindingFilters | None = None
+    ) -> Sequence[tuple[datetime, int]]:
+        ...
+
+    async def data_version(self) -> DataVersion:
+        ...
+
+    def export(
+        self, filters: FindingFilters, export_format: ExportFormat, batch_size: int
+    ) -> AsyncIterator[bytes]:
+        ...
+
+    def resource_cache_stats(self) -> ResourceCacheStats:
+        ...
+
+    def pool_stats(self) -> PoolStats:
+        ...
+
+
+class ThreadedFindingStore:
+    def __init__(self, store: SQLAlchemyFindingStore) -> None:
+        self.store = store
+
+    async def init(self) -> None:
+        await run_in_threadpool(self.store.init)
+
+    async def close(self) -> None:
+        await run_in_threadpool(self.store.engine.dispose)
+
+    async def add(self, findings: list[SecurityFinding]) -> None:
+        await run_in_threadpool(self.store.add, findings)
+
+    async def list_documents_page(
+        self,
+        limit: int = 100,
+        filters: FindingFilters | None = None,
+        cursor: FindingCursor | None = None,
+    ) -> FindingDocumentPage:
+        return await run_in_threadpool(self.store.list_documents_page, limit, filters, cursor)
+
+    async def summary(
+        self, domain: FindingDomain | None = None, status: FindingStatus | None = None
+    ) -> dict[str, int]:
+        return await run_in_threadpool(self.store.summary, domain, status)
+
+    async def count_by(
+        self, dimension: AnalyticsDimension, filters: FindingFilters | None = None
+    ) -> Sequence[tuple[str, int]]:
+        return await run_in_threadpool(self.store.count_by, dimension, filters)
+
+    async def histogram(
+        self, bucket: TimeBucket, filters: FindingFilters | None = None
+    ) -> Sequence[tuple[datetime, int]]:
+        return await run_in_threadpool(self.store.histogram, bucket, filters)
+
+    async def data_version(self) -> DataVersion:
+        return await run_in_threadpool(self.store.data_version)
+
+    def export(
+        self, filters: FindingFilters, export_format: ExportFormat, batch_size: int
+    ) -> AsyncIterator[bytes]:
+        findings = self.store.iter_findings(filters, batch_size=batch_size)
+        return iterate_in_threadpool(iter_export(findings, export_format))
+
+    def resource_cache_stats(self) -> ResourceCacheStats:
+        return self.store.resource_cache_stats()
+
+    def pool_stats(self) -> PoolStats:
+        return self.store.pool_stats()
+
+
+def create_async_store(database_url: str, resource_cache_size: int) -> AsyncFindingStore:
+    if use_async_engine(database_url):
+        return AsyncSQLAlchemyFindingStore(
+            create_async_db_engine(database_url), resource_cache_size
+        )
+    return ThreadedFindingStore(
+        SQLAlchemyFindingStore(create_db_engine(database_url), resource_cache_size)
+    )
@@ -1,14 +1,30 @@
 import argparse
+import os
+import sys
 from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
 
+from saastesa.agent.runner import (
+    add_connector_arguments,
+    add_spool_arguments,
+    add_transport_arguments,
+    connector_specs,
+    create_client,
+)
 from saastesa.agent.runner import main as agent_main
+from saastesa.api.archive import ArchiveRotation, archive_findings, restore_archive
+from saastesa.api.db import create_db_engine, resolve_database_url
+from saastesa.api.export import ExportFormat, iter_export
 from saastesa.api.main import serve
+from saastesa.api.queries import FindingFilters
+from saastesa.api.store import SQLAlchemyFindingStore
 from saastesa.config import load_settings
 from saastesa.connectors.mock import MockThreatSignalProvider
+from saastesa.core.contracts import FindingDomain, FindingSeverity, FindingStatus
 from saastesa.core.risk_scoring import summarize_scores
-from saastesa.demo.seed import generate_demo_findings
+from saastesa.demo.seed import iter_demo_findings
 from saastesa.logging import configure_logging
-from saastesa.sdk.api_client import TESAApiClient
 from saastesa.services.tesa_service import TESAService
 
 
@@ -36,6 +52,80 @@ def _run(mock: bool) -> int:
     return 0
 
 
+def _rebuild_counters() -> int:
+    store = SQLAlchemyFindingStore(create_db_engine(resolve_database_url()))
+    store.init()
+    total = store.rebuild_summary_counters()
+    print(f"Rebuilt summary counters from {total} findings")
+    return 0
+
+
+def _retention(older_than_days: int) -> int:
+    store = SQLAlchemyFindingStore(create_db_engine(resolve_database_url()))
+    store.init()
+    cutoff = datetime.now(tz=UTC) - timedelta(days=older_than_days)
+    try:
+        dropped = store.drop_expired_partitions(cutoff)
+    except RuntimeError as error:
+        print(error, file=sys.stderr)
+        return 1
+    for month in dropped:
+        print(f"Dropped partitions for {month:%Y-%m}")
+    print(f"Dropped {len(dropped)} monthly partitions older than {cutoff:%Y-%m-%d}")
+    return 0
+
+
+def _archive(args: argparse.Namespace) -> int:
+    store = SQLAlchemyFindingStore(create_db_engine(resolve_database_url()))
+    store.init()
+    cutoff = datetime.now(tz=UTC) - timedelta(days=args.older_than_days)
+    result = archive_findings(
+        store, cutoff, Path(args.output_dir), rotation=args.rotate, batch_size=args.batch_size
+    )
+    for path in result.files:
+        print(f"Wrote {path}")
+    print(f"Archived {result.archived} findings older than {cutoff:%Y-%m-%d}")
+    return 0
+
+
+def _restore(args: argparse.Namespace) -> int:
+    store = SQLAlchemyFindingStore(create_db_engine(resolve_database_url()))
+    store.init()
+    try:
+        restored = restore_archive(
+            store, [Path(path) for path in args.paths], batch_size=args.batch_size
+        )
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        return 1
+    print(f"Restored {restored} findings")
+    return 0
+
+
+def _export(args: argparse.Namespace) -> int:
+    store = SQLAlchemyFindingStore(create_db_engine(resolve_database_url()))
+    store.init()
+    filters = FindingFilters(
+        domain=args.domain,
+        source=args.source,
+        severity=args.severity,
+        status=args.status,
+        since=args.since,
+        until=args.until,
+    )
+    chunks = iter_export(store.iter_findings(filters, batch_size=args.batch_size), args.format)
+    if args.output == "-":
+        for chunk in chunks:
+            sys.stdout.buffer.write(chunk)
+        sys.stdout.buffer.flush()
+        return 0
+    with open(args.output, "wb") as handle:
+        for chunk in chunks:
+            handle.write(chunk)
+    print(f"Exported findings to {args.output}", file=sys.stderr)
+    return 0
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(prog="saastesa", description="SaaS TESA CLI")
     subparsers = parser.add_subparsers(dest="command", required=True)
@@ -47,11 +137,65 @@ def build_parser() -> argparse.ArgumentParser:
     agent_parser.add_argument("--api-url", default="http://localhost:8080")
     agent_parser.add_argument("--interval-seconds", type=int, default=30)
     agent_parser.add_argument("--once", action="store_true")
+    add_connector_arguments(agent_parser)
+    add_spool_arguments(agent_parser)
+    add_transport_arguments(agent_parser)
 
-    seed_parser = subparsers.add_parser("seed-demo", help="Seed demo findings for dashboard presentations")
+    seed_parser = subparsers.add_parser(
+        "seed-demo", help="Seed demo findings for dashboard presentations"
+    )
     seed_parser.add_argument("--api-url", default="http://localhost:8080")
     seed_parser.add_argument("--count", type=int, default=250)
     seed_parser.add_argument("--days", type=int, default=30)
+    seed_parser.add_argument("--chunk-size", type=int, default=5000, help="Findings per request")
+    seed_parser.add_argument(
+        "--max-in-flight", type=int, default=4, help="Requests uploading at the same time"
+    )
+    add_transport_arguments(seed_parser)
+
+    subparsers.add_parser(
+        "rebuild-counters", help="Rebuild summary counters from the security_findings table"
+    )
+
+    retention_parser = subparsers.add_parser(
+        "retention", help="Drop monthly findings partitions entirely past the retention age"
+    )
+    retention_parser.add_argument(
+        "--older-than-days", type=int, default=int(os.getenv("TESA_RETENTION_DAYS", "365"))
+    )
+
+    archive_parser = subparsers.add_parser(
+        "archive", help="Move findings older than a cutoff into compressed NDJSON archive files"
+    )
+    archive_parser.add_argument(
+        "--older-than-days", type=int, default=int(os.getenv("TESA_ARCHIVE_AFTER_DAYS", "90"))
+    )
+    archive_parser.add_argument("--output-dir", default=os.getenv("TESA_ARCHIVE_DIR", "archive"))
+    archive_parser.add_argument(
+        "--rotate", type=ArchiveRotation, choices=list(ArchiveRotation), default=ArchiveRotation.DAY
+    )
+    archive_parser.add_argument("--batch-size", type=int, default=1000)
+
+    restore_parser = subparsers.add_parser(
+        "restore", help="Re-ingest archived findings through the bulk write path"
+    )
+    restore_parser.add_argument("paths", nargs="+", help="Archive files (*.ndjson.gz)")
+    restore_parser.add_argument("--batch-size", type=int, default=1000)
+
+    export_parser = subparsers.add_parser(
+        "export", help="Stream findings from the database as NDJSON or CSV"
+    )
+    export_parser.add_argument(
+        "--format", type=ExportFormat, choices=list(ExportFormat), default=ExportFormat.NDJSON
+    )
+    export_parser.add_argument("--output", default="-", help="File path, or - for stdout")
+    export_parser.add_argument("--batch-size", type=int, default=1000)
+    export_parser.add_argument("--domain", type=FindingDomain, choices=list(FindingDomain))
+    export_parser.add_argument("--source")
+    export_parser.add_argument("--severity", type=FindingSeverity, choices=list(FindingSeverity))
+    export_parser.add_argument("--status", type=FindingStatus, choices=list(FindingStatus))
+    export_parser.add_argument("--since", type=datetime.fromisoformat)
+    export_parser.add_argument("--until", type=datetime.fromisoformat)
     return parser
 
 
@@ -65,15 +209,56 @@ def main(argv: Sequence[str] | None = None) -> int:
         serve()
         return 0
     if args.command == "run-agent":
-        agent_args = ["--api-url", args.api_url, "--interval-seconds", str(args.interval_seconds)]
+        agent_args = [
+            "--api-url",
+            args.api_url,
+            "--interval-seconds",
+            str(args.interval_seconds),
+            "--max-concurrency",
+            str(args.max_concurrency),
+            "--fetch-timeout-seconds",
+            str(args.fetch_timeout_seconds),
+            "--spool-path",
+            args.spool_path,
+            "--compression",
+            args.compression.value,
+            "--keepalive-seconds",
+            str(args.keepalive_seconds),
+        ]
+        for spec in connector_specs(args):
+            agent_args.extend(["--connector", spec])
         if args.once:
             agent_args.append("--once")
+        if args.http2:
+            agent_args.append("--http2")
         return agent_main(agent_args)
     if args.command == "seed-demo":
-        findings = generate_demo_findings(count=args.count, days=args.days)
-        result = TESAApiClient(base_url=args.api_url).send_findings(findings)
-        print(f"Seeded {result['ingested']} findings to {args.api_url}")
-        return 0
+        findings = iter_demo_findings(count=args.count, days=args.days)
+        with create_client(args) as client:
+            result = client.send_findings_chunked(
+                findings, chunk_size=args.chunk_size, max_in_flight=args.max_in_flight
+            )
+        for error in result.errors:
+            print(
+                f"Chunk {error.chunk} ({error.size} findings from #{error.offset}) "
+                f"failed: {error.error}"
+            )
+        print(
+            f"Seeded {result.ingested + result.accepted} findings to {args.api_url} in "
+            f"{result.chunks} requests, {result.elapsed_seconds:.1f}s "
+            f"({result.per_second:,.0f} findings/s)"
+        )
+        return 1 if result.errors else 0
+    if args.command == "rebuild-counters":
+        return _rebuild_counters()
+    if args.command == "retention":
+        return _retention(args.older_than_days)
+    if args.command == "archive":
+        return _archive(args)
+    if args.command == "restore":
+        return _restore(args)
+    if args.command == "export":
+        return _export(args)
     parser.error("Unknown command")
     return 2
 
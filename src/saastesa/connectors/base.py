@@ -1,9 +1,49 @@
-from collections.abc import Iterable
-from typing import Protocol
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass
+from typing import ClassVar, Literal, Protocol, TypeAlias
 
 from saastesa.core.models import ThreatSignal
 
 
+@dataclass(frozen=True)
+class Checkpoint:
+    value: str
+
+
+SignalItem: TypeAlias = ThreatSignal | Checkpoint
+
+
 class ThreatSignalProvider(Protocol):
     def fetch_signals(self) -> Iterable[ThreatSignal]:
         ...
+
+
+class AsyncThreatSignalProvider(Protocol):
+    async def fetch_signals(self) -> Iterable[ThreatSignal]:
+        ...
+
+
+class IncrementalThreatSignalProvider(Protocol):
+    incremental: ClassVar[Literal[True]]
+
+    def fetch_signals(self, checkpoint: str | None) -> Iterable[SignalItem]:
+        ...
+
+
+class AsyncIncrementalThreatSignalProvider(Protocol):
+    incremental: ClassVar[Literal[True]]
+
+    def fetch_signals(self, checkpoint: str | None) -> AsyncIterator[SignalItem]:
+        ...
+
+
+SignalProvider: TypeAlias = (
+    ThreatSignalProvider
+    | AsyncThreatSignalProvider
+    | IncrementalThreatSignalProvider
+    | AsyncIncrementalThreatSignalProvider
+)
+
+
+def is_incremental(provider: SignalProvider) -> bool:
+    return getattr(provider, "incremental", False) is True
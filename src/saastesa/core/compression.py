@@ -0,0 +1,29 @@
+import gzip
+from enum import StrEnum
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - zstandard is an optional codec
+    zstandard = None  # type: ignore[assignment]
+
+
+class ContentEncoding(StrEnum):
+    IDENTITY = "identity"
+    GZIP = "gzip"
+    ZSTD = "zstd"
+
+
+def supported_encodings() -> tuple[ContentEncoding, ...]:
+    if zstandard is None:
+        return ContentEncoding.IDENTITY, ContentEncoding.GZIP
+    return tuple(ContentEncoding)
+
+
+def compress_body(body: bytes, encoding: ContentEncoding) -> bytes:
+    if encoding is ContentEncoding.GZIP:
+        return gzip.compress(body, compresslevel=6, mtime=0)
+    if encoding is ContentEncoding.ZSTD:
+        if zstandard is None:
+            raise RuntimeError("zstd request bodies need zstandard (pip install saastesa[zstd])")
+        return zstandard.ZstdCompressor(level=3).compress(body)
+    return body
@@ -0,0 +1,288 @@
+import json
+import logging
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from hashlib import sha256
+from pathlib import Path
+from threading import Lock
+from typing import Any, Literal
+
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, model_validator
+
+from saastesa.core.contracts import FindingDomain, JSONValue
+
+try:
+    import yaml
+except ImportError:  # pragma: no cover - PyYAML is only needed for YAML policy files
+    yaml = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+MAX_POLICY_FACTORS = 12
+
+DEFAULT_POLICY_DOCUMENT: dict[str, Any] = {
+    "name": "default",
+    "floor": 1,
+    "cap": 10,
+    "factors": [
+        {"name": "internet_exposed", "field": "internet_exposed", "multiply": 2},
+        {"name": "privileged_access", "field": "privileged_access", "multiply": 2},
+    ],
+    "domains": {
+        **dict.fromkeys(("sast", "dast", "sca", "cicd", "code"), "application"),
+        **dict.fromkeys(("iam", "cloud", "cspm", "k8s", "host", "network"), "infrastructure"),
+    },
+    "default_domain": "other",
+    "categories": {
+        "application": "Application Security",
+        "infrastructure": "Infrastructure Security",
+        "identity": "Identity Security",
+        "cloud": "Cloud Security",
+        "container": "Container Security",
+    },
+    "default_category": "Security Operations",
+}
+
+Predicate = Callable[[Mapping[str, JSONValue]], bool]
+
+
+class PolicyError(ValueError):
+    pass
+
+
+@dataclass(frozen=True, eq=False)
+class RiskPolicy:
+    name: str
+    digest: str
+    document: dict[str, Any]
+    score: Callable[[int, Mapping[str, JSONValue]], int]
+    source_domain: Callable[[str], FindingDomain]
+    category_name: Callable[[FindingDomain], str]
+
+    def __reduce__(self) -> tuple[Callable[[Mapping[str, Any]], "RiskPolicy"], tuple[Any, ...]]:
+        return compile_policy, (self.document,)
+
+
+@dataclass(frozen=True)
+class PolicyReloadStats:
+    path: str
+    policy_name: str
+    policy_digest: str
+    reloads: int
+    failures: int
+    last_error: str | None
+
+
+class _Factor(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    name: str
+    field: str
+    op: Literal["truthy", "equals", "in", "gte", "lte"] = "truthy"
+    value: JSONValue = None
+    multiply: float | None = Field(default=None, gt=0)
+    add: float | None = None
+
+    @model_validator(mode="after")
+    def _check(self) -> "_Factor":
+        if (self.multiply is None) == (self.add is None):
+            raise ValueError("factor needs exactly one of 'multiply' or 'add'")
+        if self.op == "in" and not isinstance(self.value, list):
+            raise ValueError("'in' factors need a list value")
+        if self.op in {"gte", "lte"} and (
+            isinstance(self.value, bool) or not isinstance(self.value, int | float)
+        ):
+            raise ValueError(f"'{self.op}' factors need a numeric value")
+        return self
+
+
+class _PolicyDocument(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    name: str = "custom"
+    floor: int = Field(default=1, ge=0, le=10)
+    cap: int = Field(default=10, ge=1, le=10)
+    severity_weights: dict[int, float] = Field(default_factory=dict)
+    factors: list[_Factor] = Field(default_factory=list, max_length=MAX_POLICY_FACTORS)
+    domains: dict[str, FindingDomain] = Field(default_factory=dict)
+    default_domain: FindingDomain = FindingDomain.OTHER
+    categories: dict[FindingDomain, str] = Field(default_factory=dict)
+    default_category: str = "Security Operations"
+
+    @model_validator(mode="after")
+    def _check(self) -> "_PolicyDocument":
+        if self.floor > self.cap:
+            raise ValueError("'floor' must not exceed 'cap'")
+        unknown = sorted(set(self.severity_weights) - set(range(1, 6)))
+        if unknown:
+            raise ValueError(f"severity_weights keys must be 1-5, got {unknown}")
+        return self
+
+
+def compile_policy(document: Mapping[str, Any]) -> RiskPolicy:
+    try:
+        spec = _PolicyDocument.model_validate(document)
+    except ValidationError as error:
+        raise PolicyError(f"Invalid risk policy: {error}") from error
+
+    canonical = json.dumps(document, sort_keys=True, separators=(",", ":"), default=str)
+    domains = {source.lower(): domain for source, domain in spec.domains.items()}
+    categories = dict(spec.categories)
+    default_domain = spec.default_domain
+    default_category = spec.default_category
+
+    def source_domain(source: str) -> FindingDomain:
+        return domains.get(source.lower(), default_domain)
+
+    def category_name(domain: FindingDomain) -> str:
+        return categories.get(domain, default_category)
+
+    return RiskPolicy(
+        name=spec.name,
+        digest=sha256(canonical.encode()).hexdigest()[:16],
+        document=json.loads(canonical),
+        score=_compile_scorer(spec),
+        source_domain=source_domain,
+        category_name=category_name,
+    )
+
+
+def load_policy(path: Path) -> RiskPolicy:
+    try:
+        text = path.read_text()
+    except OSError as error:
+        raise PolicyError(f"Cannot read risk policy {path}: {error}") from error
+    if path.suffix.lower() in {".yaml", ".yml"}:
+        if yaml is None:
+            raise PolicyError("YAML risk policies need PyYAML (pip install saastesa[policy])")
+        try:
+            document = yaml.safe_load(text)
+        except yaml.YAMLError as error:
+            raise PolicyError(f"Invalid YAML in {path}: {error}") from error
+    else:
+        try:
+            document = json.loads(text)
+        except json.JSONDecodeError as error:
+            raise PolicyError(f"Invalid JSON in {path}: {error}") from error
+    if not isinstance(document, dict):
+        raise PolicyError(f"Risk policy {path} must be a mapping")
+    return compile_policy(document)
+
+
+class PolicyReloader:
+    def __init__(self, path: Path, check_interval_seconds: float = 5.0) -> None:
+        self.path = path
+        self.check_interval_seconds = check_interval_seconds
+        self._lock = Lock()
+        self._signature = self._stat()
+        self._policy = load_policy(path)
+        self._checked_at = time.monotonic()
+        self._reloads = 0
+        self._failures = 0
+        self._last_error: str | None = None
+
+    def current(self) -> RiskPolicy:
+        if time.monotonic() - self._checked_at < self.check_interval_seconds:
+            return self._policy
+        with self._lock:
+            if time.monotonic() - self._checked_at >= self.check_interval_seconds:
+                self._checked_at = time.monotonic()
+                self._reload_if_changed()
+            return self._policy
+
+    def stats(self) -> PolicyReloadStats:
+        with self._lock:
+            return PolicyReloadStats(
+                path=str(self.path),
+                policy_name=self._policy.name,
+                policy_digest=self._policy.digest,
+                reloads=self._reloads,
+                failures=self._failures,
+                last_error=self._last_error,
+            )
+
+    def _reload_if_changed(self) -> None:
+        try:
+            signature = self._stat()
+            if signature == self._signature:
+                return
+            self._signature = signature
+            policy = load_policy(self.path)
+        except (OSError, PolicyError) as error:
+            self._failures += 1
+            self._last_error = str(error)
+            logger.warning("Keeping risk policy %s: %s", self._policy.digest, error)
+            return
+        self._policy = policy
+        self._reloads += 1
+        self._last_error = None
+        logger.info("Reloaded risk policy %s (%s)", policy.name, policy.digest)
+
+    def _stat(self) -> tuple[int, int]:
+        stat = self.path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+
+def _compile_scorer(spec: _PolicyDocument) -> Callable[[int, Mapping[str, JSONValue]], int]:
+    width = len(spec.factors)
+    table: list[int] = []
+    for severity in range(6):
+        base = spec.severity_weights.get(severity, float(severity))
+        for mask in range(1 << width):
+            raw = base
+            for bit, factor in enumerate(spec.factors):
+                if not mask & (1 << (width - 1 - bit)):
+                    continue
+                if factor.multiply is not None:
+                    raw *= factor.multiply
+                else:
+                    raw += factor.add or 0.0
+            table.append(min(max(round(raw), spec.floor), spec.cap))
+    scores = tuple(table)
+
+    if width == 0:
+        return lambda severity_id, _: scores[severity_id]
+
+    predicates = tuple(_compile_predicate(factor) for factor in spec.factors)
+    if width == 1:
+        (only,) = predicates
+        return lambda severity_id, metadata: scores[severity_id << 1 | only(metadata)]
+    if width == 2:
+        first, second = predicates
+        return lambda severity_id, metadata: scores[
+            severity_id << 2 | first(metadata) << 1 | second(metadata)
+        ]
+
+    def score(severity_id: int, metadata: Mapping[str, JSONValue]) -> int:
+        index = severity_id
+        for predicate in predicates:
+            index = index << 1 | predicate(metadata)
+        return scores[index]
+
+    return score
+
+
+def _compile_predicate(factor: _Factor) -> Predicate:
+    field = factor.field
+    value = factor.value
+    if factor.op == "truthy":
+        return lambda metadata: bool(metadata.get(field))
+    if factor.op == "equals":
+        return lambda metadata: metadata.get(field) == value
+    if factor.op == "in":
+        choices = tuple(value)
+        return lambda metadata: metadata.get(field) in choices
+    bound = float(value)
+    if factor.op == "gte":
+        return lambda metadata: _number(metadata.get(field)) >= bound
+    return lambda metadata: _number(metadata.get(field)) <= bound
+
+
+def _number(value: JSONValue) -> float:
+    if isinstance(value, bool) or not isinstance(value, int | float):
+        return float("nan")
+    return float(value)
+
+
+DEFAULT_POLICY = compile_policy(DEFAULT_POLICY_DOCUMENT)
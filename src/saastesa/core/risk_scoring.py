@@ -1,4 +1,5 @@
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
+from typing import TypeAlias
 from uuid import NAMESPACE_URL, uuid5
 
 from saastesa.core.contracts import (
@@ -11,47 +12,44 @@ from saastesa.core.contracts import (
     FindingStatus,
 )
 from saastesa.core.models import FindingReferences, FindingResource, SecurityFinding, ThreatSignal
+from saastesa.core.policy import DEFAULT_POLICY, RiskPolicy
 
+RISK_BAND_UPPER_BOUNDS: tuple[tuple[str, int], ...] = (("low", 30), ("medium", 60), ("high", 80))
+CRITICAL_RISK_BAND = "critical"
+RISK_BANDS: tuple[str, ...] = (
+    *(band for band, _ in RISK_BAND_UPPER_BOUNDS),
+    CRITICAL_RISK_BAND,
+)
 
-def compute_risk_score(signal: ThreatSignal) -> int:
-    severity = max(1, min(signal.severity, 5))
-    exposure_factor = 2 if signal.metadata.get("internet_exposed") else 1
-    privileged_factor = 2 if signal.metadata.get("privileged_access") else 1
-    raw_score = severity * exposure_factor * privileged_factor
-    return min(raw_score, 10)
+DomainKey: TypeAlias = tuple[str, str]
+# finding_uid, severity_id, risk_score, status, domain, type_name
+FindingScore: TypeAlias = tuple[str, int, int, FindingStatus, FindingDomain, str]
+
+_MIN_SEVERITY = 1
+_MAX_SEVERITY = 5
+_SEVERITY_LABELS: dict[int, FindingSeverity] = {
+    1: FindingSeverity.INFORMATIONAL,
+    2: FindingSeverity.LOW,
+    3: FindingSeverity.MEDIUM,
+    4: FindingSeverity.HIGH,
+    5: FindingSeverity.CRITICAL,
+}
+_DEFAULT_DESCRIPTION = "Derived finding from normalized threat signal and context risk factors."
 
 
-def _severity_label(severity_id: int) -> FindingSeverity:
-    mapping = {1: "informational", 2: "low", 3: "medium", 4: "high", 5: "critical"}
-    resolved = mapping.get(severity_id, FindingSeverity.INFORMATIONAL.value)
-    return FindingSeverity(resolved)
+def compute_risk_score(signal: ThreatSignal, policy: RiskPolicy = DEFAULT_POLICY) -> int:
+    severity = max(1, min(signal.severity, 5))
+    return policy.score(severity, signal.metadata)
 
 
-def _domain(signal: ThreatSignal) -> FindingDomain:
-    explicit_domain = str(signal.metadata.get("domain", "")).strip().lower()
+def _resolve_domain(explicit_value: str, source: str, policy: RiskPolicy) -> FindingDomain:
+    explicit_domain = explicit_value.strip().lower()
     if explicit_domain:
         try:
             return FindingDomain(explicit_domain)
         except ValueError:
             return FindingDomain.OTHER
-
-    source = signal.source.lower()
-    if source in {"sast", "dast", "sca", "cicd", "code"}:
-        return FindingDomain.APPLICATION
-    if source in {"iam", "cloud", "cspm", "k8s", "host", "network"}:
-        return FindingDomain.INFRASTRUCTURE
-    return FindingDomain.OTHER
-
-
-def _category_name(domain: FindingDomain) -> str:
-    mapping = {
-        FindingDomain.APPLICATION: "Application Security",
-        FindingDomain.INFRASTRUCTURE: "Infrastructure Security",
-        FindingDomain.IDENTITY: "Identity Security",
-        FindingDomain.CLOUD: "Cloud Security",
-        FindingDomain.CONTAINER: "Container Security",
-    }
-    return mapping.get(domain, "Security Operations")
+    return policy.source_domain(source)
 
 
 def _status(value: object) -> FindingStatus:
@@ -62,63 +60,122 @@ def _status(value: object) -> FindingStatus:
         return FindingStatus.OPEN
 
 
-def build_finding(signal: ThreatSignal) -> SecurityFinding:
-    score_10 = compute_risk_score(signal)
-    severity_id = max(1, min(signal.severity, 5))
-    domain = _domain(signal)
-    finding_uid = str(
-        uuid5(NAMESPACE_URL, f"{signal.source}:{signal.signal_type}:{signal.detected_at.isoformat()}")
-    )
-
-    resource = FindingResource(
-        uid=str(signal.metadata.get("asset_id", signal.source)),
-        name=str(signal.metadata.get("asset_name", signal.source)),
-        type=str(signal.metadata.get("asset_type", "service")),
-        platform=str(signal.metadata.get("platform", "saas")),
-    )
-    references = FindingReferences(
-        cve=tuple(signal.metadata.get("cve", [])),
-        cwe=tuple(signal.metadata.get("cwe", [])),
-        owasp=tuple(signal.metadata.get("owasp", [])),
-        mitre_attack=tuple(signal.metadata.get("mitre_attack", [])),
-    )
-
-    return SecurityFinding(
-        finding_uid=finding_uid,
-        standard=FindingStandard.OCSF,
-        schema_version=CURRENT_FINDING_SCHEMA_VERSION,
-        status=_status(signal.metadata.get("status", FindingStatus.OPEN.value)),
-        severity_id=severity_id,
-        severity=_severity_label(severity_id),
-        risk_score=score_10 * 10,
-        title=str(signal.metadata.get("title", f"{signal.source}:{signal.signal_type}")),
-        description=str(
-            signal.metadata.get(
-                "description", "Derived finding from normalized threat signal and context risk factors."
+def build_finding(signal: ThreatSignal, policy: RiskPolicy = DEFAULT_POLICY) -> SecurityFinding:
+    return build_findings([signal], policy)[0]
+
+
+def score_signals(
+    signals: Iterable[ThreatSignal], policy: RiskPolicy = DEFAULT_POLICY
+) -> list[FindingScore]:
+    domains: dict[DomainKey, FindingDomain] = {}
+    statuses: dict[str, FindingStatus] = {}
+    type_names: dict[str, str] = {}
+    score = policy.score
+    open_status = FindingStatus.OPEN.value
+    scores: list[FindingScore] = []
+    append = scores.append
+    for signal in signals:
+        metadata = signal.metadata
+        source = signal.source
+        signal_type = signal.signal_type
+        severity_id = signal.severity
+        if severity_id < _MIN_SEVERITY:
+            severity_id = _MIN_SEVERITY
+        elif severity_id > _MAX_SEVERITY:
+            severity_id = _MAX_SEVERITY
+
+        domain_key = (str(metadata.get("domain", "")), source)
+        domain = domains.get(domain_key)
+        if domain is None:
+            domain = domains[domain_key] = _resolve_domain(*domain_key, policy)
+        status_value = str(metadata.get("status", open_status))
+        status = statuses.get(status_value)
+        if status is None:
+            status = statuses[status_value] = _status(status_value)
+        if "type_name" in metadata:
+            type_name = str(metadata["type_name"])
+        elif signal_type in type_names:
+            type_name = type_names[signal_type]
+        else:
+            type_name = type_names[signal_type] = signal_type.replace("_", " ").title()
+
+        detection = f"{source}:{signal_type}:{signal.detected_at.isoformat()}"
+        append(
+            (
+                str(uuid5(NAMESPACE_URL, detection)),
+                severity_id,
+                score(severity_id, metadata) * 10,
+                status,
+                domain,
+                type_name,
+            )
+        )
+    return scores
+
+
+def build_findings(
+    signals: Sequence[ThreatSignal],
+    policy: RiskPolicy = DEFAULT_POLICY,
+    scores: Sequence[FindingScore] | None = None,
+) -> list[SecurityFinding]:
+    if scores is None:
+        scores = score_signals(signals, policy)
+    category_name = policy.category_name
+    standard = FindingStandard.OCSF
+    finding_class = FindingClass.SECURITY_FINDING
+    activity = FindingActivity.CREATE
+    findings: list[SecurityFinding] = []
+    append = findings.append
+    for signal, (finding_uid, severity_id, risk_score, status, domain, type_name) in zip(
+        signals, scores, strict=True
+    ):
+        metadata = signal.metadata
+        source = signal.source
+        append(
+            SecurityFinding(
+                finding_uid=finding_uid,
+                standard=standard,
+                schema_version=CURRENT_FINDING_SCHEMA_VERSION,
+                status=status,
+                severity_id=severity_id,
+                severity=_SEVERITY_LABELS[severity_id],
+                risk_score=risk_score,
+                title=str(metadata.get("title", f"{source}:{signal.signal_type}")),
+                description=str(metadata.get("description", _DEFAULT_DESCRIPTION)),
+                category_name=category_name(domain),
+                class_name=finding_class,
+                type_name=type_name,
+                domain=domain,
+                activity_name=activity,
+                time=signal.detected_at,
+                source=source,
+                resource=FindingResource(
+                    uid=str(metadata.get("asset_id", source)),
+                    name=str(metadata.get("asset_name", source)),
+                    type=str(metadata.get("asset_type", "service")),
+                    platform=str(metadata.get("platform", "saas")),
+                ),
+                references=FindingReferences(
+                    cve=tuple(metadata.get("cve", [])),
+                    cwe=tuple(metadata.get("cwe", [])),
+                    owasp=tuple(metadata.get("owasp", [])),
+                    mitre_attack=tuple(metadata.get("mitre_attack", [])),
+                ),
+                raw_data=metadata,
             )
-        ),
-        category_name=_category_name(domain),
-        class_name=FindingClass.SECURITY_FINDING,
-        type_name=str(signal.metadata.get("type_name", signal.signal_type.replace("_", " ").title())),
-        domain=domain,
-        activity_name=FindingActivity.CREATE,
-        time=signal.detected_at,
-        source=signal.source,
-        resource=resource,
-        references=references,
-        raw_data=signal.metadata,
-    )
+        )
+    return findings
+
+
+def risk_band(risk_score: int) -> str:
+    for band, upper_bound in RISK_BAND_UPPER_BOUNDS:
+        if risk_score <= upper_bound:
+            return band
+    return CRITICAL_RISK_BAND
 
 
 def summarize_scores(findings: Iterable[SecurityFinding]) -> dict[str, int]:
-    buckets = {"low": 0, "medium": 0, "high": 0, "critical": 0}
+    buckets = dict.fromkeys(RISK_BANDS, 0)
     for finding in findings:
-        if finding.risk_score <= 30:
-            buckets["low"] += 1
-        elif finding.risk_score <= 60:
-            buckets["medium"] += 1
-        elif finding.risk_score <= 80:
-            buckets["high"] += 1
-        else:
-            buckets["critical"] += 1
+        buckets[risk_band(finding.risk_score)] += 1
     return buckets
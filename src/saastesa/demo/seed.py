@@ -1,5 +1,6 @@
-from datetime import UTC, datetime, timedelta
 import random
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
 from typing import Any
 from uuid import uuid4
 
@@ -16,8 +17,11 @@ STATUSES = ["open", "open", "open", "in_progress", "resolved"]
 
 
 def generate_demo_findings(count: int = 200, days: int = 30) -> list[dict[str, Any]]:
+    return list(iter_demo_findings(count, days))
+
+
+def iter_demo_findings(count: int = 200, days: int = 30) -> Iterator[dict[str, Any]]:
     now = datetime.now(tz=UTC)
-    findings: list[dict[str, Any]] = []
 
     for _ in range(max(count, 1)):
         domain = random.choice(list(DOMAIN_TYPES.keys()))
@@ -37,44 +41,41 @@ def generate_demo_findings(count: int = 200, days: int = 30) -> list[dict[str, A
             f"{type_name} indicates elevated {domain} exposure and requires triage."
         )
 
-        findings.append(
-            {
-                "finding_uid": finding_uid,
-                "standard": "OCSF",
-                "schema_version": "1.1.0",
-                "status": random.choice(STATUSES),
-                "severity_id": severity_id,
-                "severity": _severity_label(severity_id),
-                "risk_score": risk_score,
-                "title": title,
-                "description": description,
-                "category_name": _category_name(domain),
-                "class_name": "Security Finding",
-                "type_name": type_name,
-                "domain": domain,
-                "activity_name": "Create",
-                "time": observed.isoformat(),
-                "source": source,
-                "resource": {
-                    "uid": f"asset-{random.randint(1000, 9999)}",
-                    "name": f"{domain}-service-{random.randint(1, 50)}",
-                    "type": _resource_type(domain),
-                    "platform": random.choice(["aws", "gcp", "azure", "saas"]),
-                },
-                "references": {
-                    "cve": ["CVE-2024-12345"] if random.random() > 0.7 else [],
-                    "cwe": ["CWE-79"] if domain == "application" else [],
-                    "owasp": ["A05:2021"] if domain == "application" else [],
-                    "mitre_attack": ["T1190"] if random.random() > 0.6 else [],
-                },
-                "raw_data": {
-                    "generated": True,
-                    "demo": True,
-                    "owner": random.choice(["platform", "appsec", "sre", "infra"]),
-                },
-            }
-        )
-    return findings
+        yield {
+            "finding_uid": finding_uid,
+            "standard": "OCSF",
+            "schema_version": "1.1.0",
+            "status": random.choice(STATUSES),
+            "severity_id": severity_id,
+            "severity": _severity_label(severity_id),
+            "risk_score": risk_score,
+            "title": title,
+            "description": description,
+            "category_name": _category_name(domain),
+            "class_name": "Security Finding",
+            "type_name": type_name,
+            "domain": domain,
+            "activity_name": "Create",
+            "time": observed.isoformat(),
+            "source": source,
+            "resource": {
+                "uid": f"asset-{random.randint(1000, 9999)}",
+                "name": f"{domain}-service-{random.randint(1, 50)}",
+                "type": _resource_type(domain),
+                "platform": random.choice(["aws", "gcp", "azure", "saas"]),
+            },
+            "references": {
+                "cve": ["CVE-2024-12345"] if random.random() > 0.7 else [],
+                "cwe": ["CWE-79"] if domain == "application" else [],
+                "owasp": ["A05:2021"] if domain == "application" else [],
+                "mitre_attack": ["T1190"] if random.random() > 0.6 else [],
+            },
+            "raw_data": {
+                "generated": True,
+                "demo": True,
+                "owner": random.choice(["platform", "appsec", "sre", "infra"]),
+            },
+        }
 
 
 def _severity_label(severity_id: int) -> str:
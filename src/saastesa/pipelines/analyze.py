@@ -1,6 +1,116 @@
+import multiprocessing
+import os
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from pathlib import Path
+from threading import Lock
+
 from saastesa.core.models import SecurityFinding, ThreatSignal
-from saastesa.core.risk_scoring import build_finding
+from saastesa.core.policy import DEFAULT_POLICY, PolicyReloader, RiskPolicy
+from saastesa.core.risk_scoring import build_findings, score_signals
+
+# Workers are never forked from a threaded server process.
+_POOL_START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+
+@dataclass(frozen=True)
+class AnalysisOptions:
+    workers: int = 1
+    chunk_size: int = 20_000
+    parallel_threshold: int = 50_000
+    policy: RiskPolicy = DEFAULT_POLICY
+
+
+def load_analysis_options() -> AnalysisOptions:
+    workers = int(os.getenv("TESA_ANALYZE_WORKERS", "1"))
+    cpus = os.cpu_count() or 1
+    return AnalysisOptions(
+        # Extra processes on a single core only add pickling to a CPU-bound pass.
+        workers=min(workers, cpus) if workers > 0 else cpus,
+        chunk_size=max(1, int(os.getenv("TESA_ANALYZE_CHUNK_SIZE", "20000"))),
+        parallel_threshold=int(os.getenv("TESA_ANALYZE_PARALLEL_THRESHOLD", "50000")),
+        policy=current_policy(),
+    )
+
+
+def current_policy() -> RiskPolicy:
+    reloader = policy_reloader()
+    return DEFAULT_POLICY if reloader is None else reloader.current()
+
+
+def policy_reloader() -> PolicyReloader | None:
+    path = os.getenv("TESA_RISK_POLICY_PATH", "").strip()
+    if not path:
+        return None
+    return _policy_reloader(path, float(os.getenv("TESA_RISK_POLICY_RELOAD_SECONDS", "5")))
+
+
+@lru_cache(maxsize=4)
+def _policy_reloader(path: str, check_interval_seconds: float) -> PolicyReloader:
+    return PolicyReloader(Path(path), check_interval_seconds)
+
+
+class SignalAnalyzer:
+    def __init__(
+        self,
+        options: AnalysisOptions | None = None,
+        policy: Callable[[], RiskPolicy] | None = None,
+    ) -> None:
+        self.options = load_analysis_options() if options is None else options
+        self._policy = policy
+        self._pool: ProcessPoolExecutor | None = None
+        self._lock = Lock()
+
+    def __enter__(self) -> "SignalAnalyzer":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def start(self) -> ProcessPoolExecutor | None:
+        with self._lock:
+            if self._pool is None and self.options.workers > 1:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.options.workers,
+                    mp_context=multiprocessing.get_context(_POOL_START_METHOD),
+                )
+            return self._pool
+
+    def close(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def analyze(self, signals: Sequence[ThreatSignal]) -> list[SecurityFinding]:
+        options = self.options
+        policy = options.policy if self._policy is None else self._policy()
+        pool = None
+        if len(signals) > options.chunk_size and len(signals) >= options.parallel_threshold:
+            pool = self.start()
+        if pool is None:
+            return build_findings(signals, policy)
+
+        chunks = [
+            signals[start : start + options.chunk_size]
+            for start in range(0, len(signals), options.chunk_size)
+        ]
+        # Workers return only the derived fields; unpickling whole findings costs more than
+        # building them here.
+        findings: list[SecurityFinding] = []
+        for chunk, scores in zip(
+            chunks, pool.map(partial(score_signals, policy=policy), chunks), strict=True
+        ):
+            findings.extend(build_findings(chunk, policy, scores))
+        return findings
 
 
-def analyze_signals(signals: list[ThreatSignal]) -> list[SecurityFinding]:
-    return [build_finding(signal) for signal in signals]
+def analyze_signals(
+    signals: Sequence[ThreatSignal], options: AnalysisOptions | None = None
+) -> list[SecurityFinding]:
+    with SignalAnalyzer(options) as analyzer:
+        return analyzer.analyze(signals)
@@ -0,0 +1,153 @@
+import os
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import TypeAlias
+
+from saastesa.core.models import ThreatSignal
+
+DedupKey: TypeAlias = tuple[str, str, str]
+
+OCCURRENCE_COUNT_KEY = "occurrence_count"
+FIRST_SEEN_KEY = "first_seen"
+LAST_SEEN_KEY = "last_seen"
+
+
+@dataclass(frozen=True)
+class DedupStats:
+    window_seconds: float
+    refresh_seconds: float
+    tracked_keys: int
+    capacity: int
+    received: int
+    collapsed: int
+    emitted: int
+    evicted: int
+
+
+@dataclass
+class _Occurrence:
+    signal: ThreatSignal
+    first_seen: datetime
+    last_seen: datetime
+    reported_at: datetime
+    count: int = 1
+    reported_count: int = 0
+    pending: bool = False
+
+
+class SignalDeduplicator:
+    def __init__(
+        self, window_seconds: float, refresh_seconds: float | None = None, max_keys: int = 100_000
+    ) -> None:
+        self.window_seconds = window_seconds
+        self.refresh_seconds = window_seconds / 12 if refresh_seconds is None else refresh_seconds
+        self.max_keys = max_keys
+        self._window = timedelta(seconds=window_seconds)
+        self._refresh = timedelta(seconds=self.refresh_seconds)
+        self._entries: OrderedDict[DedupKey, _Occurrence] = OrderedDict()
+        self._clock: datetime | None = None
+        self._lock = Lock()
+        self._received = 0
+        self._collapsed = 0
+        self._emitted = 0
+        self._evicted = 0
+
+    def collapse(self, signals: Iterable[ThreatSignal]) -> list[ThreatSignal]:
+        with self._lock:
+            pending: list[_Occurrence] = []
+            for signal in signals:
+                self._received += 1
+                moment = signal.detected_at
+                if self._clock is None or moment > self._clock:
+                    self._clock = moment
+                key = dedup_key(signal)
+                entry = self._entries.get(key)
+                if entry is None or abs(moment - entry.first_seen) >= self._window:
+                    if entry is not None:
+                        self._queue(entry, pending)
+                    entry = _Occurrence(
+                        signal=signal, first_seen=moment, last_seen=moment, reported_at=moment
+                    )
+                    self._entries[key] = entry
+                    self._entries.move_to_end(key)
+                    self._queue(entry, pending)
+                    continue
+
+                self._collapsed += 1
+                entry.count += 1
+                if moment >= entry.last_seen:
+                    entry.last_seen = moment
+                    entry.signal = signal
+                self._entries.move_to_end(key)
+                if entry.last_seen - entry.reported_at >= self._refresh:
+                    self._queue(entry, pending)
+
+            self._expire(pending)
+            emitted = [self._emit(entry) for entry in pending]
+            self._emitted += len(emitted)
+            return emitted
+
+    def stats(self) -> DedupStats:
+        with self._lock:
+            return DedupStats(
+                window_seconds=self.window_seconds,
+                refresh_seconds=self.refresh_seconds,
+                tracked_keys=len(self._entries),
+                capacity=self.max_keys,
+                received=self._received,
+                collapsed=self._collapsed,
+                emitted=self._emitted,
+                evicted=self._evicted,
+            )
+
+    def _queue(self, entry: _Occurrence, pending: list[_Occurrence]) -> None:
+        if not entry.pending and entry.count > entry.reported_count:
+            entry.pending = True
+            pending.append(entry)
+
+    def _expire(self, pending: list[_Occurrence]) -> None:
+        while self._entries:
+            key, entry = next(iter(self._entries.items()))
+            expired = self._clock is not None and self._clock - entry.first_seen >= self._window
+            if not expired and len(self._entries) <= self.max_keys:
+                return
+            del self._entries[key]
+            self._evicted += 1
+            self._queue(entry, pending)
+
+    def _emit(self, entry: _Occurrence) -> ThreatSignal:
+        entry.pending = False
+        entry.reported_count = entry.count
+        entry.reported_at = entry.last_seen
+        latest = entry.signal
+        return ThreatSignal(
+            source=latest.source,
+            signal_type=latest.signal_type,
+            severity=latest.severity,
+            detected_at=entry.first_seen,
+            metadata={
+                **latest.metadata,
+                OCCURRENCE_COUNT_KEY: entry.count,
+                FIRST_SEEN_KEY: entry.first_seen.isoformat(),
+                LAST_SEEN_KEY: entry.last_seen.isoformat(),
+            },
+        )
+
+
+def dedup_key(signal: ThreatSignal) -> DedupKey:
+    return signal.source, signal.signal_type, str(signal.metadata.get("asset_id", ""))
+
+
+def create_signal_deduplicator() -> SignalDeduplicator | None:
+    window_seconds = float(os.getenv("TESA_SIGNAL_DEDUP_WINDOW_SECONDS", "0"))
+    if window_seconds <= 0:
+        return None
+    refresh = os.getenv("TESA_SIGNAL_DEDUP_REFRESH_SECONDS", "").strip()
+    return SignalDeduplicator(
+        window_seconds,
+        refresh_seconds=float(refresh) if refresh else None,
+        max_keys=int(os.getenv("TESA_SIGNAL_DEDUP_MAX_KEYS", "100000")),
+    )
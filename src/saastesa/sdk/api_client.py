@@ -1,42 +1,199 @@
-from collections.abc import Iterable
-from dataclasses import asdict
-from datetime import datetime
-from typing import cast
-from typing import Any
+import time
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass
+from itertools import islice
+from types import TracebackType
+from typing import Any, cast
 
 import httpx
 
+from saastesa.core.compression import ContentEncoding, compress_body
 from saastesa.core.models import ThreatSignal
+from saastesa.core.serialization import dumps_json
+
+
+@dataclass(frozen=True)
+class ChunkError:
+    chunk: int
+    offset: int
+    size: int
+    error: str
+
+
+@dataclass(frozen=True)
+class BulkUploadResult:
+    submitted: int
+    ingested: int
+    accepted: int
+    chunks: int
+    errors: tuple[ChunkError, ...]
+    batch_ids: tuple[str, ...]
+    elapsed_seconds: float
+
+    @property
+    def failed(self) -> int:
+        return sum(error.size for error in self.errors)
+
+    @property
+    def per_second(self) -> float:
+        delivered = self.ingested + self.accepted
+        return delivered / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
 
 
 class TESAApiClient:
-    def __init__(self, base_url: str, timeout: float = 10.0) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        timeout: float = 10.0,
+        http2: bool = False,
+        compression: ContentEncoding = ContentEncoding.IDENTITY,
+        compress_min_bytes: int = 1024,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 5,
+        keepalive_expiry: float = 60.0,
+        chunk_size: int = 5000,
+        max_in_flight: int = 4,
+        verify: bool | str = True,
+        transport: httpx.BaseTransport | None = None,
+    ) -> None:
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        self.compression = ContentEncoding(compression)
+        self.compress_min_bytes = compress_min_bytes
+        self.chunk_size = chunk_size
+        self.max_in_flight = max_in_flight
+        self._validated: dict[str, tuple[str, Any]] = {}
+        self._client = httpx.Client(
+            base_url=self.base_url,
+            timeout=timeout,
+            http2=http2,
+            verify=verify,
+            transport=transport,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+        )
 
-    def _serialize_signal(self, signal: ThreatSignal) -> dict[str, Any]:
-        payload = asdict(signal)
-        detected_at = payload.get("detected_at")
-        if isinstance(detected_at, datetime):
-            payload["detected_at"] = detected_at.isoformat()
-        return payload
+    def __enter__(self) -> "TESAApiClient":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._client.close()
 
     def send_signals(self, signals: Iterable[ThreatSignal]) -> dict[str, Any]:
-        payload = {"signals": [self._serialize_signal(signal) for signal in signals]}
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.post(f"{self.base_url}/api/v1/signals", json=payload)
-            response.raise_for_status()
-            return cast(dict[str, Any], response.json())
-
-    def send_findings(self, findings: Iterable[dict[str, Any]]) -> dict[str, Any]:
-        payload = {"findings": list(findings)}
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.post(f"{self.base_url}/api/v1/findings", json=payload)
-            response.raise_for_status()
-            return cast(dict[str, Any], response.json())
+        return self.send_serialized_signals([dumps_json(asdict(signal)) for signal in signals])
+
+    def send_signals_chunked(
+        self,
+        signals: Iterable[ThreatSignal],
+        chunk_size: int | None = None,
+        max_in_flight: int | None = None,
+    ) -> BulkUploadResult:
+        documents = (dumps_json(asdict(signal)) for signal in signals)
+        return self._upload("/api/v1/signals", "signals", documents, chunk_size, max_in_flight)
+
+    def send_serialized_signals(self, documents: Sequence[bytes]) -> dict[str, Any]:
+        return cast(dict[str, Any], self._post_documents("/api/v1/signals", "signals", documents))
+
+    def send_findings(self, findings: Iterable[Mapping[str, Any]]) -> dict[str, Any]:
+        documents = [dumps_json(finding) for finding in findings]
+        return cast(dict[str, Any], self._post_documents("/api/v1/findings", "findings", documents))
+
+    def send_findings_chunked(
+        self,
+        findings: Iterable[Mapping[str, Any]],
+        chunk_size: int | None = None,
+        max_in_flight: int | None = None,
+    ) -> BulkUploadResult:
+        documents = (dumps_json(finding) for finding in findings)
+        return self._upload("/api/v1/findings", "findings", documents, chunk_size, max_in_flight)
 
     def get_summary(self) -> dict[str, Any]:
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.get(f"{self.base_url}/api/v1/summary")
-            response.raise_for_status()
-            return cast(dict[str, Any], response.json())
+        return cast(dict[str, Any], self._get_json("/api/v1/summary"))
+
+    def _upload(
+        self,
+        path: str,
+        key: str,
+        documents: Iterator[bytes],
+        chunk_size: int | None,
+        max_in_flight: int | None,
+    ) -> BulkUploadResult:
+        size = max(chunk_size or self.chunk_size, 1)
+        limit = max(max_in_flight or self.max_in_flight, 1)
+        started = time.perf_counter()
+        responses: list[Any] = []
+        errors: list[ChunkError] = []
+        pending: dict[Future[Any], tuple[int, int, int]] = {}
+
+        def collect(done: Iterable[Future[Any]]) -> None:
+            for future in done:
+                chunk, offset, count = pending.pop(future)
+                try:
+                    response = future.result()
+                    if not isinstance(response, dict):
+                        raise TypeError(f"unexpected response body: {response!r:.80}")
+                except Exception as error:
+                    errors.append(ChunkError(chunk, offset, count, str(error) or repr(error)))
+                else:
+                    responses.append(response)
+
+        submitted = chunks = 0
+        with ThreadPoolExecutor(limit, thread_name_prefix="tesa-upload") as pool:
+            while chunk_documents := list(islice(documents, size)):
+                if len(pending) >= limit:
+                    collect(wait(pending, return_when=FIRST_COMPLETED).done)
+                future = pool.submit(self._post_documents, path, key, chunk_documents)
+                pending[future] = (chunks, submitted, len(chunk_documents))
+                submitted += len(chunk_documents)
+                chunks += 1
+            collect(wait(pending).done)
+
+        batch_ids = [response["batch_id"] for response in responses if "batch_id" in response]
+        return BulkUploadResult(
+            submitted=submitted,
+            ingested=sum(int(response.get("ingested", 0)) for response in responses),
+            accepted=sum(int(response.get("accepted", 0)) for response in responses),
+            chunks=chunks,
+            errors=tuple(sorted(errors, key=lambda error: error.chunk)),
+            batch_ids=tuple(str(batch_id) for batch_id in batch_ids),
+            elapsed_seconds=time.perf_counter() - started,
+        )
+
+    def _post_documents(self, path: str, key: str, documents: Sequence[bytes]) -> Any:
+        body = b'{"' + key.encode() + b'":[' + b",".join(documents) + b"]}"
+        return self._post_body(path, body)
+
+    def _post_body(self, path: str, body: bytes) -> Any:
+        headers = {"Content-Type": "application/json"}
+        encoding = self.compression
+        if encoding is not ContentEncoding.IDENTITY and len(body) >= self.compress_min_bytes:
+            body = compress_body(body, encoding)
+            headers["Content-Encoding"] = encoding.value
+        response = self._client.post(path, content=body, headers=headers)
+        response.raise_for_status()
+        return response.json()
+
+    def _get_json(self, path: str) -> Any:
+        cached = self._validated.get(path)
+        headers = {"If-None-Match": cached[0]} if cached is not None else {}
+        response = self._client.get(path, headers=headers)
+        if response.status_code == httpx.codes.NOT_MODIFIED and cached is not None:
+            return cached[1]
+        response.raise_for_status()
+        payload = response.json()
+        etag = response.headers.get("ETag")
+        if etag is not None:
+            self._validated[path] = (etag, payload)
+        return payload
@@ -1,13 +1,23 @@
 from saastesa.connectors.base import ThreatSignalProvider
 from saastesa.core.models import SecurityFinding
-from saastesa.pipelines.analyze import analyze_signals
+from saastesa.pipelines.analyze import AnalysisOptions, analyze_signals
+from saastesa.pipelines.dedup import SignalDeduplicator
 from saastesa.pipelines.ingest import ingest_signals
 
 
 class TESAService:
-    def __init__(self, provider: ThreatSignalProvider) -> None:
+    def __init__(
+        self,
+        provider: ThreatSignalProvider,
+        analysis: AnalysisOptions | None = None,
+        deduplicator: SignalDeduplicator | None = None,
+    ) -> None:
         self.provider = provider
+        self.analysis = analysis
+        self.deduplicator = deduplicator
 
     def run_once(self) -> list[SecurityFinding]:
         signals = ingest_signals(self.provider)
-        return analyze_signals(signals)
+        if self.deduplicator is not None:
+            signals = self.deduplicator.collapse(signals)
+        return analyze_signals(signals, self.analysis)
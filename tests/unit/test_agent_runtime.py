@@ -0,0 +1,278 @@
+import asyncio
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator, Sequence
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import ClassVar, Literal
+
+import pytest
+
+from saastesa.agent.runtime import AgentRuntime, Connector, parse_connector
+from saastesa.agent.spool import SignalSpool, SpoolSender
+from saastesa.connectors.base import Checkpoint, SignalItem
+from saastesa.connectors.mock import MockThreatSignalProvider
+from saastesa.core.models import ThreatSignal
+
+
+class _RecordingClient:
+    def __init__(self) -> None:
+        self.batches: list[Sequence[bytes]] = []
+
+    def send_serialized_signals(self, documents: Sequence[bytes]) -> object:
+        self.batches.append(documents)
+        return {"ingested": len(documents)}
+
+
+class _SlowAsyncProvider:
+    def __init__(self, source: str, delay: float) -> None:
+        self.source = source
+        self.delay = delay
+        self.polls = 0
+
+    async def fetch_signals(self) -> list[ThreatSignal]:
+        self.polls += 1
+        await asyncio.sleep(self.delay)
+        return [ThreatSignal(self.source, "probe", 3, datetime.now(tz=UTC), {})]
+
+
+class _CountingProvider:
+    def __init__(self) -> None:
+        self.polls = 0
+
+    def fetch_signals(self) -> list[ThreatSignal]:
+        self.polls += 1
+        return [ThreatSignal("counting", "probe", 2, datetime.now(tz=UTC), {})]
+
+
+class _HungProvider:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.release = threading.Event()
+
+    def fetch_signals(self) -> list[ThreatSignal]:
+        self.calls += 1
+        self.release.wait()
+        return []
+
+
+class _StalledClient:
+    def __init__(self) -> None:
+        self.release = threading.Event()
+
+    def send_serialized_signals(self, documents: Sequence[bytes]) -> object:
+        self.release.wait()
+        return {"ingested": len(documents)}
+
+
+class _CrashingOnceClient(_RecordingClient):
+    def __init__(self) -> None:
+        super().__init__()
+        self.crashed = False
+
+    def send_serialized_signals(self, documents: Sequence[bytes]) -> object:
+        if not self.crashed:
+            self.crashed = True
+            raise RuntimeError("encoder bug")
+        return super().send_serialized_signals(documents)
+
+
+class _BrokenProvider:
+    def fetch_signals(self) -> list[ThreatSignal]:
+        raise ConnectionError("upstream down")
+
+
+class _PagedProvider:
+    incremental: ClassVar[Literal[True]] = True
+
+    def __init__(self, page_size: int) -> None:
+        self.records: list[int] = []
+        self.page_size = page_size
+        self.requested: list[str | None] = []
+
+    def fetch_signals(self, checkpoint: str | None) -> Iterator[SignalItem]:
+        self.requested.append(checkpoint)
+        newer = [record for record in self.records if record > int(checkpoint or 0)]
+        for start in range(0, len(newer), self.page_size):
+            page = newer[start : start + self.page_size]
+            for record in page:
+                yield ThreatSignal("audit", f"event-{record}", 2, datetime.now(tz=UTC), {})
+            yield Checkpoint(str(page[-1]))
+
+
+class _FlakyStream:
+    incremental: ClassVar[Literal[True]] = True
+
+    def __init__(self) -> None:
+        self.requested: list[str | None] = []
+
+    async def fetch_signals(self, checkpoint: str | None) -> AsyncIterator[SignalItem]:
+        self.requested.append(checkpoint)
+        yield ThreatSignal("edr", "beacon", 4, datetime.now(tz=UTC), {})
+        yield Checkpoint("page-1")
+        raise ConnectionError("stream reset")
+
+
+class _OptionalArgumentProvider:
+    def __init__(self) -> None:
+        self.limits: list[int] = []
+
+    def fetch_signals(self, limit: int = 5) -> list[ThreatSignal]:
+        self.limits.append(limit)
+        return [ThreatSignal("vendor", "probe", 2, datetime.now(tz=UTC), {})] * limit
+
+
+def _runtime(tmp_path: Path, connectors: list[Connector], **options: int) -> AgentRuntime:
+    sender = SpoolSender(SignalSpool(tmp_path / "spool.db"), _RecordingClient(), max_wait_seconds=0)
+    return AgentRuntime(connectors, sender, **options)
+
+
+def test_run_once_polls_connectors_concurrently_and_isolates_failures(tmp_path: Path) -> None:
+    connectors = [
+        Connector("alpha", _SlowAsyncProvider("alpha", 0.2), 30),
+        Connector("beta", _SlowAsyncProvider("beta", 0.2), 30),
+        Connector("mock", MockThreatSignalProvider(), 30),
+        Connector("broken", _BrokenProvider(), 30),
+        Connector("hung", _SlowAsyncProvider("hung", 5), 30, timeout_seconds=0.1),
+    ]
+    runtime = _runtime(tmp_path, connectors, max_concurrency=5)
+
+    started = time.monotonic()
+    assert asyncio.run(runtime.run_once()) == 0
+    assert time.monotonic() - started < 1.0
+    runtime.close()
+
+    stats = {item.name: item for item in runtime.stats()}
+    assert stats["alpha"].signals == stats["beta"].signals == 1
+    assert stats["mock"].signals == 2
+    assert stats["broken"].failures == 1 and stats["broken"].last_error == "upstream down"
+    assert stats["hung"].timeouts == 1 and stats["hung"].signals == 0
+    assert runtime.sender.stats().sent == 4
+
+
+def test_connectors_follow_their_own_intervals(tmp_path: Path) -> None:
+    fast = _SlowAsyncProvider("fast", 0)
+    slow = _SlowAsyncProvider("slow", 0)
+    runtime = _runtime(
+        tmp_path, [Connector("fast", fast, 0.05), Connector("slow", slow, 60)], max_concurrency=1
+    )
+
+    async def run_briefly() -> None:
+        stop = asyncio.Event()
+        asyncio.get_running_loop().call_later(0.4, stop.set)
+        await runtime.run(stop)
+
+    asyncio.run(run_briefly())
+    runtime.close()
+
+    assert fast.polls >= 4
+    assert slow.polls == 1
+    assert runtime.sender.stats().sent + runtime.sender.spool.depth == fast.polls + slow.polls
+
+
+def _run_for(runtime: AgentRuntime, seconds: float) -> None:
+    async def run_briefly() -> None:
+        stop = asyncio.Event()
+        asyncio.get_running_loop().call_later(seconds, stop.set)
+        await runtime.run(stop)
+
+    asyncio.run(run_briefly())
+
+
+def test_hung_connector_is_skipped_while_its_fetch_is_still_running(tmp_path: Path) -> None:
+    hung = _HungProvider()
+    healthy = _CountingProvider()
+    connectors = [
+        Connector("hung", hung, 0.05, timeout_seconds=0.1),
+        Connector("healthy", healthy, 0.05),
+    ]
+    runtime = _runtime(tmp_path, connectors, max_concurrency=2)
+
+    _run_for(runtime, 0.6)
+    hung.release.set()
+    runtime.close()
+
+    stats = {item.name: item for item in runtime.stats()}
+    assert hung.calls == 1
+    assert stats["hung"].timeouts == 1 and stats["hung"].skipped >= 3
+    assert healthy.polls >= 6 and stats["healthy"].failures == 0
+
+
+def test_connectors_keep_spooling_while_the_uplink_is_stalled(tmp_path: Path) -> None:
+    client = _StalledClient()
+    fast = _SlowAsyncProvider("fast", 0)
+    sender = SpoolSender(SignalSpool(tmp_path / "spool.db"), client, max_wait_seconds=0)
+    runtime = AgentRuntime([Connector("fast", fast, 0.05)], sender)
+
+    _run_for(runtime, 0.5)
+    spooled = sender.spool.depth
+    client.release.set()
+    runtime.close()
+
+    assert fast.polls >= 5
+    assert spooled == fast.polls
+
+
+def test_uplink_keeps_draining_after_an_unexpected_error(tmp_path: Path) -> None:
+    client = _CrashingOnceClient()
+    fast = _SlowAsyncProvider("fast", 0)
+    sender = SpoolSender(SignalSpool(tmp_path / "spool.db"), client, max_wait_seconds=0)
+    runtime = AgentRuntime([Connector("fast", fast, 0.05)], sender, max_idle_seconds=0.05)
+
+    _run_for(runtime, 0.5)
+    runtime.close()
+
+    assert client.crashed
+    assert len(client.batches) >= 2
+    assert sum(len(batch) for batch in client.batches) + sender.spool.depth == fast.polls
+
+
+def test_parse_connector_specs(tmp_path: Path) -> None:
+    builtin = parse_connector("mock@5", 30, 10)
+    assert (builtin.name, builtin.interval_seconds, builtin.timeout_seconds) == ("mock", 5, 10)
+    imported = parse_connector("saastesa.connectors.mock:MockThreatSignalProvider", 30, 10)
+    assert isinstance(imported.provider, MockThreatSignalProvider)
+    assert imported.interval_seconds == 30
+    with pytest.raises(ValueError, match="Unknown connector"):
+        parse_connector("nope", 30, 10)
+    with pytest.raises(ValueError, match="unique"):
+        _runtime(tmp_path, [builtin, builtin])
+
+
+def test_incremental_connectors_resume_from_persisted_checkpoints(tmp_path: Path) -> None:
+    paged = _PagedProvider(page_size=2)
+    paged.records = [1, 2, 3]
+    flaky = _FlakyStream()
+    connectors = [Connector("audit", paged, 30), Connector("edr", flaky, 30)]
+    runtime = _runtime(tmp_path, connectors)
+
+    async def poll_twice() -> list[int]:
+        first = await runtime.poll(connectors[0])
+        paged.records += [4, 5]
+        await runtime.poll(connectors[1])
+        return [first, await runtime.poll(connectors[0]), await runtime.poll(connectors[1])]
+
+    assert asyncio.run(poll_twice()) == [3, 2, 1]
+    runtime.close()
+    assert paged.requested == [None, "3"]
+    assert flaky.requested == [None, "page-1"]
+    stats = {item.name: item for item in runtime.stats()}
+    assert stats["audit"].checkpoint == "5"
+    assert stats["edr"].failures == 2 and stats["edr"].checkpoint == "page-1"
+    runtime.sender.spool.close()
+
+    restarted = _runtime(tmp_path, [Connector("audit", paged, 30)])
+    assert restarted.sender.spool.depth == 7
+    assert asyncio.run(restarted.poll(restarted.connectors[0])) == 0
+    restarted.close()
+    assert paged.requested[-1] == "5"
+
+
+def test_only_opted_in_providers_receive_a_checkpoint(tmp_path: Path) -> None:
+    provider = _OptionalArgumentProvider()
+    runtime = _runtime(tmp_path, [Connector("vendor", provider, 30)])
+
+    assert asyncio.run(runtime.poll(runtime.connectors[0])) == 5
+    runtime.close()
+    assert provider.limits == [5]
+    assert runtime.stats()[0].checkpoint is None
@@ -0,0 +1,167 @@
+import json
+import logging
+import sqlite3
+from contextlib import closing
+from datetime import UTC, datetime
+from pathlib import Path
+
+import httpx
+import pytest
+
+from saastesa.agent.spool import SignalSpool, SpoolSender
+from saastesa.api.schemas import IngestSignalsRequest
+from saastesa.connectors.mock import MockThreatSignalProvider
+from saastesa.core.models import ThreatSignal
+from saastesa.sdk.api_client import TESAApiClient
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _client(statuses: list[int], bodies: list[bytes]) -> TESAApiClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(request.content)
+        status = statuses.pop(0) if statuses else 200
+        return httpx.Response(status, json={"ingested": 0})
+
+    return TESAApiClient("http://tesa.test", transport=httpx.MockTransport(handler))
+
+
+def test_spool_survives_restart_and_drops_oldest_over_cap(tmp_path: Path) -> None:
+    path = tmp_path / "spool.db"
+    signals = MockThreatSignalProvider().fetch_signals()
+    spool = SignalSpool(path)
+    spool.append(signals)
+    spool.close()
+
+    reopened = SignalSpool(path)
+    assert reopened.depth == len(signals)
+    batch = reopened.peek(max_signals=100, max_bytes=1)
+    assert batch is not None and len(batch.documents) == 1
+    assert json.loads(batch.documents[0])["source"] == signals[0].source
+
+    reopened.max_bytes = reopened.size_bytes
+    reopened.append(signals[:1])
+    assert reopened.dropped == 1
+    assert reopened.depth == len(signals)
+    assert reopened.size_bytes <= reopened.max_bytes
+    first = reopened.peek(max_signals=1, max_bytes=1 << 20)
+    assert first is not None and json.loads(first.documents[0])["source"] == signals[1].source
+
+
+def test_dropping_checkpointed_signals_is_logged_with_the_checkpoint(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    detected_at = datetime(2026, 1, 1, tzinfo=UTC)
+    signals = [ThreatSignal("audit", f"event_{index}", 2, detected_at, {}) for index in range(4)]
+    spool = SignalSpool(tmp_path / "spool.db")
+    spool.append(signals[:2], "audit", "cursor-7")
+    spool.append(signals[2:3])
+
+    with caplog.at_level(logging.WARNING, logger="saastesa.agent.spool"):
+        spool.max_bytes = spool.size_bytes
+        spool.append(signals[3:4], "audit", "cursor-8")
+        SpoolSender(spool, _client([422], []), batch_signals=2).drain(force=True)
+
+    messages = [record.getMessage() for record in caplog.records]
+    dropped = [message for message in messages if message.startswith("Dropping")]
+    assert [message.split(" from ")[0] for message in dropped] == ["Dropping 1 signals"] * 2
+    assert all("connector audit" in message for message in dropped)
+    assert all("'cursor-8'" in message for message in dropped)
+
+
+def test_spool_adds_the_connector_column_to_an_existing_file(tmp_path: Path) -> None:
+    path = tmp_path / "spool.db"
+    with closing(sqlite3.connect(path)) as connection:
+        connection.execute(
+            "CREATE TABLE spooled_signals (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "enqueued_at REAL NOT NULL, payload BLOB NOT NULL)"
+        )
+        connection.execute("INSERT INTO spooled_signals (enqueued_at, payload) VALUES (1, x'7b7d')")
+        connection.commit()
+
+    spool = SignalSpool(path)
+    assert spool.append(MockThreatSignalProvider().fetch_signals(), "mock", "1") == 2
+    assert spool.depth == 3
+
+
+def test_sender_batches_and_backs_off_until_acknowledged(tmp_path: Path) -> None:
+    clock = _Clock()
+    bodies: list[bytes] = []
+    spool = SignalSpool(tmp_path / "spool.db", clock=clock)
+    sender = SpoolSender(
+        spool,
+        _client([503, 200], bodies),
+        batch_signals=2,
+        max_wait_seconds=5,
+        backoff_initial_seconds=4,
+        clock=clock,
+        jitter=lambda low, high: high,
+    )
+    signals = MockThreatSignalProvider().fetch_signals()
+
+    spool.append(signals[:1])
+    assert sender.drain() == 0 and not bodies
+    assert sender.seconds_until_ready() == 5
+
+    spool.append(signals[1:])
+    assert sender.drain() == 0
+    assert len(bodies) == 1 and spool.depth == len(signals)
+    assert sender.stats().next_attempt_in_seconds == 4
+
+    clock.now += 4
+    assert sender.drain() == len(signals)
+    assert spool.depth == 0
+    request = IngestSignalsRequest.model_validate_json(bodies[1])
+    assert [signal.source for signal in request.signals] == [signals[0].source, signals[1].source]
+    assert sender.stats().consecutive_failures == 0
+
+
+def test_undecodable_success_response_is_retried(tmp_path: Path) -> None:
+    clock = _Clock()
+    replies = [httpx.Response(200, text="<html>proxy</html>"), httpx.Response(200, json={})]
+    client = TESAApiClient(
+        "http://tesa.test", transport=httpx.MockTransport(lambda request: replies.pop(0))
+    )
+    spool = SignalSpool(tmp_path / "spool.db", clock=clock)
+    sender = SpoolSender(
+        spool, client, backoff_initial_seconds=2, clock=clock, jitter=lambda low, high: high
+    )
+    signals = MockThreatSignalProvider().fetch_signals()
+    spool.append(signals)
+
+    assert sender.drain(force=True) == 0
+    assert spool.depth == len(signals)
+    assert sender.stats().next_attempt_in_seconds == 2
+
+    clock.now += 2
+    assert sender.drain(force=True) == len(signals)
+    assert spool.depth == 0
+
+
+def test_rejected_batch_is_dropped_instead_of_retried(tmp_path: Path) -> None:
+    bodies: list[bytes] = []
+    spool = SignalSpool(tmp_path / "spool.db")
+    sender = SpoolSender(spool, _client([422], bodies), batch_signals=1)
+    signals = MockThreatSignalProvider().fetch_signals()
+    spool.append(signals)
+
+    assert sender.drain(force=True) == len(signals) - 1
+    assert spool.depth == 0
+    assert sender.stats().rejected == 1
+
+
+def test_drain_stops_after_max_batches(tmp_path: Path) -> None:
+    bodies: list[bytes] = []
+    spool = SignalSpool(tmp_path / "spool.db")
+    sender = SpoolSender(spool, _client([], bodies), batch_signals=1)
+    signals = MockThreatSignalProvider().fetch_signals()
+    spool.append(signals)
+
+    assert sender.drain(force=True, max_batches=1) == 1
+    assert len(bodies) == 1 and spool.depth == len(signals) - 1
@@ -0,0 +1,95 @@
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+
+from saastesa.core.models import ThreatSignal
+from saastesa.core.policy import DEFAULT_POLICY, DEFAULT_POLICY_DOCUMENT, RiskPolicy, compile_policy
+from saastesa.core.risk_scoring import build_findings
+from saastesa.pipelines import analyze
+from saastesa.pipelines.analyze import (
+    AnalysisOptions,
+    SignalAnalyzer,
+    analyze_signals,
+    load_analysis_options,
+)
+
+
+def _signals(count: int) -> list[ThreatSignal]:
+    start = datetime(2026, 3, 1, tzinfo=UTC)
+    return [
+        ThreatSignal(
+            source=("iam", "cspm", "sast")[index % 3],
+            signal_type=f"parallel_{index}",
+            severity=index % 5 + 1,
+            detected_at=start + timedelta(minutes=index),
+            metadata={"asset_id": f"asset-{index % 4}", "internet_exposed": index % 2 == 0},
+        )
+        for index in range(count)
+    ]
+
+
+def test_parallel_analysis_preserves_input_order() -> None:
+    signals = _signals(53)
+    options = AnalysisOptions(workers=2, chunk_size=7, parallel_threshold=0)
+
+    assert analyze_signals(signals, options) == build_findings(signals)
+
+
+def test_analyzer_keeps_one_pool_that_never_forks(monkeypatch: pytest.MonkeyPatch) -> None:
+    start_methods: list[str] = []
+    process_pool = analyze.ProcessPoolExecutor
+
+    def _recording_pool(**kwargs: Any) -> Any:
+        start_methods.append(kwargs["mp_context"].get_start_method())
+        return process_pool(**kwargs)
+
+    monkeypatch.setattr(analyze, "ProcessPoolExecutor", _recording_pool)
+    policies = [DEFAULT_POLICY, compile_policy({**DEFAULT_POLICY_DOCUMENT, "floor": 9})]
+    served: list[RiskPolicy] = []
+
+    def _current_policy() -> RiskPolicy:
+        served.append(policies[len(served) % 2])
+        return served[-1]
+
+    signals = _signals(30)
+    options = AnalysisOptions(workers=2, chunk_size=10, parallel_threshold=0)
+    with SignalAnalyzer(options, _current_policy) as analyzer:
+        analyzer.start()
+        first = analyzer.analyze(signals)
+        second = analyzer.analyze(signals)
+
+    assert len(start_methods) == 1 and start_methods[0] in {"forkserver", "spawn"}
+    assert first == build_findings(signals, policies[0])
+    assert second == build_findings(signals, policies[1]) != first
+
+
+def test_small_batches_are_analyzed_serially(monkeypatch: pytest.MonkeyPatch) -> None:
+    def _no_pool(*_: object, **__: object) -> None:
+        raise AssertionError("process pool used for a small batch")
+
+    monkeypatch.setattr(analyze, "ProcessPoolExecutor", _no_pool)
+    signals = _signals(40)
+
+    assert analyze_signals(signals, AnalysisOptions(workers=4, chunk_size=10)) == build_findings(
+        signals
+    )
+    assert analyze_signals(signals, AnalysisOptions(workers=4, chunk_size=40, parallel_threshold=0))
+
+
+def test_analysis_options_from_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("TESA_ANALYZE_WORKERS", "3")
+    monkeypatch.setenv("TESA_ANALYZE_CHUNK_SIZE", "500")
+    monkeypatch.setenv("TESA_ANALYZE_PARALLEL_THRESHOLD", "1000")
+    monkeypatch.setattr("os.cpu_count", lambda: 4)
+
+    assert load_analysis_options() == AnalysisOptions(
+        workers=3, chunk_size=500, parallel_threshold=1000
+    )
+
+
+def test_analysis_workers_are_capped_at_available_cpus(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("TESA_ANALYZE_WORKERS", "8")
+    monkeypatch.setattr("os.cpu_count", lambda: 1)
+
+    assert load_analysis_options().workers == 1
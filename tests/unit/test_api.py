@@ -1,7 +1,17 @@
-from datetime import UTC, datetime
+import csv
+import gzip
+import io
+import json
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime, parsedate_to_datetime
+from pathlib import Path
 
+import httpx
+import pytest
 from fastapi.testclient import TestClient
 
+from saastesa.api import compression
 from saastesa.api.main import create_app
 
 
@@ -44,6 +54,10 @@ def test_ingest_and_query_endpoints() -> None:
     assert summary.status_code == 200
     assert summary.json()["critical"] >= 1
 
+    metrics = client.get("/api/v1/metrics")
+    assert metrics.json()["resource_cache"]["size"] == 1
+    assert metrics.json()["database_pool"]["pool_class"] == "StaticPool"
+
 
 def test_direct_standardized_finding_ingest() -> None:
     client = TestClient(create_app())
@@ -87,3 +101,397 @@ def test_direct_standardized_finding_ingest() -> None:
     response = client.post("/api/v1/findings", json=payload)
     assert response.status_code == 200
     assert response.json()["ingested"] == 1
+
+
+def test_findings_endpoint_pages_with_cursor_header() -> None:
+    client = TestClient(create_app())
+    signals = [
+        {
+            "source": "cspm",
+            "signal_type": f"public_bucket_{index}",
+            "severity": 3,
+            "detected_at": datetime(2026, 1, 1, index, tzinfo=UTC).isoformat(),
+            "metadata": {},
+        }
+        for index in range(5)
+    ]
+    client.post("/api/v1/signals", json={"signals": signals})
+
+    first = client.get("/api/v1/findings", params={"limit": 3})
+    assert [finding["title"] for finding in first.json()] == [
+        "cspm:public_bucket_2",
+        "cspm:public_bucket_3",
+        "cspm:public_bucket_4",
+    ]
+    cursor = first.headers["X-Next-Cursor"]
+
+    second = client.get("/api/v1/findings", params={"limit": 3, "cursor": cursor})
+    assert len(second.json()) == 2
+    assert "X-Next-Cursor" not in second.headers
+
+    filtered = client.get("/api/v1/findings", params={"source": "iam"})
+    assert filtered.json() == []
+    assert client.get("/api/v1/findings", params={"cursor": "not-a-cursor"}).status_code == 400
+
+
+def test_analytics_endpoints_aggregate_server_side() -> None:
+    client = TestClient(create_app())
+    signals = [
+        {
+            "source": source,
+            "signal_type": f"signal_{index}",
+            "severity": 3,
+            "detected_at": datetime(2026, 1, 1 + index % 2, 8, tzinfo=UTC).isoformat(),
+            "metadata": {},
+        }
+        for index, source in enumerate(["iam", "iam", "sast"])
+    ]
+    client.post("/api/v1/signals", json={"signals": signals})
+
+    counts = client.get("/api/v1/analytics/counts", params={"group_by": "source"})
+    assert counts.json() == [{"key": "iam", "count": 2}, {"key": "sast", "count": 1}]
+
+    histogram = client.get(
+        "/api/v1/analytics/histogram",
+        params={"interval": "day", "since": "2026-01-01T00:00:00Z"},
+    )
+    assert [bucket["count"] for bucket in histogram.json()] == [2, 1]
+    assert client.get("/api/v1/analytics/counts", params={"group_by": "title"}).status_code == 422
+
+
+def test_ndjson_ingest_streams_chunks_and_reports_bad_lines(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("TESA_NDJSON_CHUNK_SIZE", "2")
+    client = TestClient(create_app())
+    seed = client.post(
+        "/api/v1/signals",
+        json={
+            "signals": [
+                {
+                    "source": "cspm",
+                    "signal_type": f"public_bucket_{index}",
+                    "severity": 4,
+                    "detected_at": datetime.now(tz=UTC).isoformat(),
+                    "metadata": {"asset_id": f"bucket-{index}"},
+                }
+                for index in range(3)
+            ]
+        },
+    ).json()["findings"]
+    lines = [
+        json.dumps({**finding, "finding_uid": f"ndjson-{finding['finding_uid']}"})
+        for finding in seed
+    ]
+    lines[1:1] = ["", "{not json", json.dumps({"finding_uid": "partial"})]
+    body = ("\n".join(lines) + "\n").encode()
+
+    def body_chunks() -> Iterator[bytes]:
+        for start in range(0, len(body), 37):
+            yield body[start : start + 37]
+
+    response = client.post(
+        "/api/v1/findings/ndjson",
+        content=body_chunks(),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 200
+    result = response.json()
+    assert (result["ingested"], result["rejected"]) == (3, 2)
+    assert [error["line"] for error in result["errors"]] == [3, 4]
+    assert "title: Field required" in result["errors"][1]["error"]
+    uids = {finding["finding_uid"] for finding in client.get("/api/v1/findings").json()}
+    assert {f"ndjson-{finding['finding_uid']}" for finding in seed} <= uids
+
+
+def test_ndjson_ingest_skips_overlong_lines_after_committed_chunks(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("TESA_NDJSON_CHUNK_SIZE", "1")
+    client = TestClient(create_app())
+    seed = client.post(
+        "/api/v1/signals",
+        json={
+            "signals": [
+                {
+                    "source": "cspm",
+                    "signal_type": f"open_port_{index}",
+                    "severity": 3,
+                    "detected_at": datetime.now(tz=UTC).isoformat(),
+                    "metadata": {"asset_id": f"vm-{index}"},
+                }
+                for index in range(3)
+            ]
+        },
+    ).json()["findings"]
+    lines = [
+        json.dumps({**finding, "finding_uid": f"long-{finding['finding_uid']}"})
+        for finding in seed
+    ]
+    oversized = {**seed[0], "finding_uid": "oversized", "description": "x" * 1_100_000}
+    lines[2:2] = [json.dumps(oversized)]
+    body = ("\n".join(lines) + "\n").encode()
+
+    def body_chunks() -> Iterator[bytes]:
+        for start in range(0, len(body), 65_536):
+            yield body[start : start + 65_536]
+
+    response = client.post(
+        "/api/v1/findings/ndjson",
+        content=body_chunks(),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 200
+    result = response.json()
+    assert (result["ingested"], result["rejected"]) == (3, 1)
+    assert result["errors"][0]["line"] == 3
+    assert "exceeds" in result["errors"][0]["error"]
+    uids = {finding["finding_uid"] for finding in client.get("/api/v1/findings").json()}
+    assert {f"long-{finding['finding_uid']}" for finding in seed} <= uids
+    assert "oversized" not in uids
+
+
+def test_export_streams_ndjson_and_csv() -> None:
+    client = TestClient(create_app())
+    client.post(
+        "/api/v1/signals",
+        json={
+            "signals": [
+                {
+                    "source": source,
+                    "signal_type": f"export_check_{index}",
+                    "severity": 3,
+                    "detected_at": datetime.now(tz=UTC).isoformat(),
+                    "metadata": {"asset_id": f"asset-{index}"},
+                }
+                for index, source in enumerate(["iam", "iam", "cspm"])
+            ]
+        },
+    )
+
+    ndjson = client.get("/api/v1/findings/export", params={"source": "iam"})
+    assert ndjson.status_code == 200
+    assert ndjson.headers["content-type"].startswith("application/x-ndjson")
+    documents = [json.loads(line) for line in ndjson.text.splitlines()]
+    assert len(documents) == 2
+    assert {document["source"] for document in documents} == {"iam"}
+
+    exported = client.get("/api/v1/findings/export", params={"format": "csv"})
+    assert exported.headers["content-disposition"] == 'attachment; filename="findings.csv"'
+    rows = list(csv.DictReader(io.StringIO(exported.text)))
+    assert len(rows) == 3
+    assert {row["resource_uid"] for row in rows} >= {"asset-0", "asset-2"}
+
+
+def test_read_endpoints_answer_conditional_requests() -> None:
+    client = TestClient(create_app())
+    first = client.get("/api/v1/summary")
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == "no-cache"
+
+    cached = client.get("/api/v1/summary", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert client.get("/api/v1/findings", headers={"If-None-Match": etag}).status_code == 200
+
+    page = client.get("/api/v1/findings", params={"limit": 5, "source": "iam"})
+    page_etag = page.headers["etag"]
+    reordered = client.get(
+        "/api/v1/findings?source=iam&limit=5", headers={"If-None-Match": page_etag}
+    )
+    assert reordered.status_code == 304
+    other_query = client.get(
+        "/api/v1/findings?source=iam&limit=6", headers={"If-None-Match": page_etag}
+    )
+    assert other_query.status_code == 200
+
+    last_modified = parsedate_to_datetime(first.headers["last-modified"])
+    counts = "/api/v1/analytics/counts?group_by=domain"
+    same_second = client.get(counts, headers={"If-Modified-Since": first.headers["last-modified"]})
+    assert same_second.status_code == 200
+    later = format_datetime(last_modified + timedelta(seconds=1), usegmt=True)
+    assert client.get(counts, headers={"If-Modified-Since": later}).status_code == 304
+
+    client.post(
+        "/api/v1/signals",
+        json={
+            "signals": [
+                {
+                    "source": "iam",
+                    "signal_type": "stale_admin_credential",
+                    "severity": 5,
+                    "detected_at": datetime.now(tz=UTC).isoformat(),
+                    "metadata": {},
+                }
+            ]
+        },
+    )
+    refreshed = client.get("/api/v1/summary", headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert refreshed.headers["etag"] != etag
+    assert sum(refreshed.json().values()) == 1
+
+
+def test_async_database_url_serves_routes_on_async_engine() -> None:
+    pytest.importorskip("aiosqlite")
+    with TestClient(create_app("sqlite+aiosqlite:///:memory:")) as client:
+        ingest = client.post(
+            "/api/v1/signals",
+            json={
+                "signals": [
+                    {
+                        "source": "iam",
+                        "signal_type": f"async_check_{index}",
+                        "severity": 5,
+                        "detected_at": datetime.now(tz=UTC).isoformat(),
+                        "metadata": {"asset_id": f"asset-{index}"},
+                    }
+                    for index in range(3)
+                ]
+            },
+        )
+        assert ingest.status_code == 200
+
+        findings = client.get("/api/v1/findings", params={"limit": 2})
+        assert len(findings.json()) == 2
+        assert "x-next-cursor" in findings.headers
+        assert sum(client.get("/api/v1/summary").json().values()) == 3
+        exported = client.get("/api/v1/findings/export")
+        assert len(exported.text.splitlines()) == 3
+        assert client.get("/api/v1/metrics").json()["database_pool"]["pool_class"] == "StaticPool"
+
+
+def test_signals_are_scored_by_configured_risk_policy(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    policy_path = tmp_path / "policy.json"
+    policy_path.write_text(
+        json.dumps(
+            {
+                "name": "api-policy",
+                "factors": [
+                    {
+                        "name": "mfa",
+                        "field": "mfa_enabled",
+                        "op": "equals",
+                        "value": False,
+                        "add": 4,
+                    }
+                ],
+                "domains": {"okta": "identity"},
+            }
+        )
+    )
+    monkeypatch.setenv("TESA_RISK_POLICY_PATH", str(policy_path))
+    client = TestClient(create_app())
+
+    ingest = client.post(
+        "/api/v1/signals",
+        json={
+            "signals": [
+                {
+                    "source": "okta",
+                    "signal_type": "mfa_disabled",
+                    "severity": 2,
+                    "detected_at": datetime.now(tz=UTC).isoformat(),
+                    "metadata": {"mfa_enabled": False},
+                }
+            ]
+        },
+    )
+    finding = ingest.json()["findings"][0]
+    assert (finding["risk_score"], finding["domain"]) == (60, "identity")
+    assert finding["category_name"] == "Security Operations"
+    metrics = client.get("/api/v1/metrics").json()["risk_policy"]
+    assert (metrics["policy_name"], metrics["reloads"]) == ("api-policy", 0)
+
+
+def test_repeated_signals_are_deduplicated_before_persistence(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("TESA_SIGNAL_DEDUP_WINDOW_SECONDS", "3600")
+    client = TestClient(create_app())
+    started = datetime.now(tz=UTC)
+
+    for poll in range(4):
+        response = client.post(
+            "/api/v1/signals",
+            json={
+                "signals": [
+                    {
+                        "source": "iam",
+                        "signal_type": "stale_admin_credential",
+                        "severity": 5,
+                        "detected_at": (started + timedelta(seconds=30 * poll)).isoformat(),
+                        "metadata": {"asset_id": "admin-7"},
+                    }
+                ]
+            },
+        )
+        assert response.json()["ingested"] == 1
+        assert len(response.json()["findings"]) == (1 if poll == 0 else 0)
+
+    findings = client.get("/api/v1/findings").json()
+    assert len(findings) == 1
+    assert findings[0]["raw_data"]["occurrence_count"] == 1
+    dedup = client.get("/api/v1/metrics").json()["signal_dedup"]
+    assert (dedup["received"], dedup["collapsed"], dedup["emitted"]) == (4, 3, 1)
+
+
+def test_compressed_request_bodies_are_decoded(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("TESA_MAX_DECOMPRESSED_BODY_BYTES", "100000")
+    client = TestClient(create_app())
+    body = json.dumps(
+        {
+            "signals": [
+                {
+                    "source": "sast",
+                    "signal_type": "sql_injection",
+                    "severity": 4,
+                    "detected_at": datetime.now(tz=UTC).isoformat(),
+                }
+            ]
+        }
+    ).encode()
+
+    def post(content: bytes, encoding: str) -> httpx.Response:
+        response: httpx.Response = client.post(
+            "/api/v1/signals",
+            content=content,
+            headers={"Content-Encoding": encoding, "Content-Type": "application/json"},
+        )
+        return response
+
+    assert post(gzip.compress(body), "gzip").json()["ingested"] == 1
+    assert post(body, "br").status_code == 415
+    truncated = post(gzip.compress(body)[:-4], "gzip")
+    assert truncated.status_code == 400
+    assert truncated.json()["detail"] == "Invalid gzip request body: truncated stream"
+    assert post(gzip.compress(b" " * 200_000), "gzip").status_code == 413
+
+
+def test_zstd_bomb_is_rejected_without_inflating_it(monkeypatch: pytest.MonkeyPatch) -> None:
+    zstandard = pytest.importorskip("zstandard")
+    monkeypatch.setenv("TESA_MAX_DECOMPRESSED_BODY_BYTES", "100000")
+    client = TestClient(create_app())
+    bomb = zstandard.ZstdCompressor(level=19).compress(b" " * 256 * 1024 * 1024)
+
+    response = client.post(
+        "/api/v1/signals",
+        content=bomb,
+        headers={"Content-Encoding": "zstd", "Content-Type": "application/json"},
+    )
+    assert response.status_code == 413
+
+    decompressor = compression._decompressor("zstd")
+    assert decompressor is not None
+    assert len(decompressor.decompress(bomb, 100_001)) <= 100_001 + 128 * 1024
+
+    ndjson = client.post(
+        "/api/v1/findings/ndjson",
+        content=gzip.compress(b'{"finding_uid": "broken"}\n'),
+        headers={"Content-Encoding": "gzip"},
+    )
+    assert ndjson.json()["rejected"] == 1
@@ -0,0 +1,91 @@
+import gzip
+import json
+import subprocess
+import sys
+
+import httpx
+import pytest
+
+from saastesa.connectors.mock import MockThreatSignalProvider
+from saastesa.core.compression import ContentEncoding, compress_body
+from saastesa.sdk.api_client import TESAApiClient
+
+
+def _recording_transport(requests: list[httpx.Request]) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.method == "GET":
+            if request.headers.get("If-None-Match") == 'W/"7"':
+                return httpx.Response(304)
+            return httpx.Response(200, json={"critical": 1}, headers={"ETag": 'W/"7"'})
+        return httpx.Response(200, json={"ingested": 2, "findings": []})
+
+    return httpx.MockTransport(handler)
+
+
+def test_client_reuses_one_session_and_compresses_large_bodies() -> None:
+    requests: list[httpx.Request] = []
+    findings = [{"finding_uid": f"uid-{index}", "title": "x" * 40} for index in range(100)]
+
+    with TESAApiClient(
+        "http://tesa.test/",
+        compression=ContentEncoding.GZIP,
+        transport=_recording_transport(requests),
+    ) as client:
+        session = client._client
+        assert client.send_signals(MockThreatSignalProvider().fetch_signals())["ingested"] == 2
+        assert client.send_findings(findings)["ingested"] == 2
+        assert client.get_summary() == client.get_summary() == {"critical": 1}
+        assert client._client is session
+    assert session.is_closed
+
+    small, large, first_get, second_get = requests
+    assert "Content-Encoding" not in small.headers
+    assert json.loads(small.content)["signals"][0]["source"] == "cicd"
+    assert large.headers["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(large.content)) == {"findings": findings}
+    assert str(large.url) == "http://tesa.test/api/v1/findings"
+    assert "If-None-Match" not in first_get.headers
+    assert second_get.headers["If-None-Match"] == 'W/"7"'
+
+
+def test_send_findings_chunked_uploads_concurrently_and_reports_failures() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        findings = json.loads(request.content)["findings"]
+        if findings[0]["finding_uid"] == "uid-10":
+            return httpx.Response(503, json={"detail": "busy"})
+        if findings[0]["finding_uid"] == "uid-20":
+            return httpx.Response(200, text="<html>gateway</html>")
+        return httpx.Response(200, json={"ingested": len(findings)})
+
+    findings = ({"finding_uid": f"uid-{index}"} for index in range(35))
+    with TESAApiClient("http://tesa.test", transport=httpx.MockTransport(handler)) as client:
+        result = client.send_findings_chunked(findings, chunk_size=10, max_in_flight=3)
+
+    assert (result.submitted, result.chunks, result.ingested, result.failed) == (35, 4, 15, 20)
+    busy, undecodable = result.errors
+    assert (busy.chunk, busy.offset, busy.size) == (1, 10, 10)
+    assert "503" in busy.error
+    assert (undecodable.chunk, undecodable.offset, undecodable.size) == (2, 20, 10)
+    assert result.per_second > 0
+
+
+def test_zstd_round_trip() -> None:
+    zstandard = pytest.importorskip("zstandard")
+    body = b'{"signals":[]}' * 200
+
+    compressed = compress_body(body, ContentEncoding.ZSTD)
+    assert len(compressed) < len(body)
+    assert zstandard.ZstdDecompressor().decompress(compressed) == body
+
+
+def test_sdk_and_agent_do_not_import_the_server_stack() -> None:
+    probe = (
+        "import sys, saastesa.sdk.api_client, saastesa.agent.runner\n"
+        "print(sorted(name for name in sys.modules if name.split('.')[0] in "
+        "{'fastapi', 'starlette', 'sqlalchemy'} or name.startswith('saastesa.api')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", probe], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
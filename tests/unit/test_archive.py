@@ -0,0 +1,191 @@
+import gzip
+import io
+import json
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from saastesa.api.archive import ArchiveJob, ArchiveRotation, archive_findings, restore_archive
+from saastesa.api.db import create_db_engine
+from saastesa.api.export import finding_document
+from saastesa.api.repository import SQLAlchemyFindingStore
+from saastesa.core.models import SecurityFinding, ThreatSignal
+from saastesa.core.risk_scoring import build_finding, summarize_scores
+from saastesa.core.serialization import dumps_json
+
+_START = datetime(2026, 1, 30, 12, tzinfo=UTC)
+
+
+def _store() -> SQLAlchemyFindingStore:
+    store = SQLAlchemyFindingStore(create_db_engine("sqlite+pysqlite:///:memory:"))
+    store.init()
+    return store
+
+
+def _findings(count: int) -> list[SecurityFinding]:
+    return [
+        build_finding(
+            ThreatSignal(
+                source="cspm",
+                signal_type=f"archive_{index}",
+                severity=index % 5 + 1,
+                detected_at=_START + timedelta(hours=8 * index),
+                metadata={"asset_id": f"asset-{index % 3}", "cve": [f"CVE-2026-{index:04d}"]},
+            )
+        )
+        for index in range(count)
+    ]
+
+
+def _periods(paths: tuple[Path, ...]) -> list[str]:
+    assert all(path.name.endswith(".ndjson.gz") for path in paths)
+    return [path.name.partition(".")[0] for path in paths]
+
+
+def _document_lines(findings: list[SecurityFinding]) -> bytes:
+    return b"".join(dumps_json(finding_document(finding)) + b"\n" for finding in findings)
+
+
+def test_archive_moves_old_findings_into_rotated_files(tmp_path: Path) -> None:
+    store = _store()
+    findings = _findings(12)
+    store.add(findings)
+    version = store.data_version().version
+    cutoff = _START + timedelta(days=2)
+
+    result = archive_findings(store, cutoff, tmp_path, ArchiveRotation.DAY, batch_size=2)
+
+    old = [finding for finding in findings if finding.time < cutoff]
+    assert result.archived == len(old) == 6
+    assert _periods(result.files) == [
+        "findings-2026-01-30",
+        "findings-2026-01-31",
+        "findings-2026-02-01",
+    ]
+    assert sorted(tmp_path.iterdir()) == sorted(result.files)
+    with gzip.open(result.files[1], "rt") as handle:
+        documents = [json.loads(line) for line in handle]
+    assert [document["time"][:10] for document in documents] == ["2026-01-31"] * 3
+    assert documents[0]["references"]["cve"] == ["CVE-2026-0002"]
+    assert documents[0]["resource"]["uid"] == "asset-2"
+
+    remaining = store.list(limit=100)
+    assert {finding.finding_uid for finding in remaining} == {
+        finding.finding_uid for finding in findings if finding.time >= cutoff
+    }
+    assert store.summary() == summarize_scores(remaining)
+    assert store.data_version().version > version
+
+
+def test_restore_reingests_archive_through_bulk_path(tmp_path: Path) -> None:
+    store = _store()
+    findings = _findings(6)
+    store.add(findings)
+    expected = store.list(limit=100)
+    expected_summary = store.summary()
+    result = archive_findings(store, _START + timedelta(days=30), tmp_path, ArchiveRotation.MONTH)
+    assert _periods(result.files) == ["findings-2026-01", "findings-2026-02"]
+    assert store.list(limit=100) == []
+
+    assert restore_archive(store, result.files, batch_size=4) == 6
+    assert store.list(limit=100) == expected
+    assert store.summary() == expected_summary
+    assert restore_archive(store, result.files) == 6
+    assert len(store.list(limit=100)) == 6
+
+
+class _RefreshingStore(SQLAlchemyFindingStore):
+    refresh: list[SecurityFinding] = []
+
+    def archive_candidates(self, cutoff: datetime, limit: int) -> list[SecurityFinding]:
+        batch = list(super().archive_candidates(cutoff, limit))
+        if self.refresh:
+            self.add(self.refresh)
+            self.refresh = []
+        return batch
+
+
+def test_archive_skips_findings_refreshed_after_they_were_read(tmp_path: Path) -> None:
+    store = _RefreshingStore(create_db_engine("sqlite+pysqlite:///:memory:"))
+    store.init()
+    findings = _findings(4)
+    store.add(findings)
+    cutoff = _START + timedelta(days=2)
+    refreshed = replace(findings[1], time=cutoff + timedelta(days=1), risk_score=100)
+    store.refresh = [refreshed]
+
+    result = archive_findings(store, cutoff, tmp_path, ArchiveRotation.MONTH)
+
+    archived_uids = {finding.finding_uid for finding in findings if finding is not findings[1]}
+    assert result.archived == 3
+    with gzip.open(result.files[0], "rt") as handle:
+        assert {json.loads(line)["finding_uid"] for line in handle} == archived_uids
+    assert restore_archive(store, result.files) == 3
+    (live,) = [f for f in store.list(limit=10) if f.finding_uid == refreshed.finding_uid]
+    assert live.risk_score == 100
+    assert store.summary() == summarize_scores(store.list(limit=10))
+
+
+def test_delete_findings_only_removes_rows_older_than_the_cutoff() -> None:
+    store = _store()
+    findings = _findings(4)
+    store.add(findings)
+    uids = [finding.finding_uid for finding in findings]
+
+    assert store.delete_findings(uids, _START + timedelta(hours=12)) == uids[:2]
+    assert {finding.finding_uid for finding in store.list(limit=10)} == set(uids[2:])
+    assert store.summary() == summarize_scores(findings[2:])
+
+
+def test_restore_skips_a_truncated_trailing_member(tmp_path: Path) -> None:
+    findings = _findings(5)
+    interrupted = io.BytesIO()
+    writer = gzip.GzipFile(fileobj=interrupted, mode="wb")
+    writer.write(_document_lines(findings[3:]) + b'{"finding_uid": "half-writ')
+    writer.flush()
+    path = tmp_path / "findings-2026-01.ndjson.gz"
+    path.write_bytes(gzip.compress(_document_lines(findings[:3])) + interrupted.getvalue())
+
+    store = _store()
+    assert restore_archive(store, [path]) == 5
+    assert len(store.list(limit=10)) == 5
+
+
+def test_archive_publishes_parts_staged_by_an_interrupted_run(tmp_path: Path) -> None:
+    findings = _findings(4)
+    staged = tmp_path / ".findings-2026-01.20260301T000000000000Z.ndjson.gz.tmp"
+    complete = gzip.compress(_document_lines(findings[:2]))
+    staged.write_bytes(complete + gzip.compress(_document_lines(findings[2:]))[:-12])
+
+    store = _store()
+    result = archive_findings(store, _START, tmp_path, ArchiveRotation.MONTH)
+
+    assert result.archived == 0
+    published = tmp_path / "findings-2026-01.20260301T000000000000Z.ndjson.gz"
+    assert list(tmp_path.iterdir()) == [published]
+    assert restore_archive(store, [published]) >= 2
+    assert {finding.finding_uid for finding in findings[:2]} <= {
+        finding.finding_uid for finding in store.list(limit=10)
+    }
+
+
+def test_restore_reports_the_bad_line(tmp_path: Path) -> None:
+    path = tmp_path / "findings-2026-01.ndjson.gz"
+    with gzip.open(path, "wb") as handle:
+        handle.write(b'{"finding_uid": "broken"}\n')
+
+    with pytest.raises(ValueError, match=r"findings-2026-01\.ndjson\.gz:1"):
+        restore_archive(_store(), [path])
+
+
+def test_archive_job_run_records_stats(tmp_path: Path) -> None:
+    store = _store()
+    store.add(_findings(3))
+    job = ArchiveJob(store, tmp_path, retain_days=0)
+
+    assert job.run_once().archived == 3
+    stats = job.stats()
+    assert (stats.runs, stats.findings_archived, stats.last_error) == (1, 3, None)
+    assert store.list(limit=10) == []
@@ -0,0 +1,62 @@
+from datetime import UTC, datetime, timedelta
+
+from saastesa.core.models import ThreatSignal
+from saastesa.core.risk_scoring import build_finding
+from saastesa.pipelines.dedup import SignalDeduplicator
+
+_START = datetime(2026, 5, 1, tzinfo=UTC)
+
+
+def _poll(offset_seconds: int, assets: int = 3, severity: int = 3) -> list[ThreatSignal]:
+    return [
+        ThreatSignal(
+            source="cspm",
+            signal_type="public_bucket",
+            severity=severity,
+            detected_at=_START + timedelta(seconds=offset_seconds),
+            metadata={"asset_id": f"bucket-{index}"},
+        )
+        for index in range(assets)
+    ]
+
+
+def test_repeated_polls_collapse_into_counted_refreshes() -> None:
+    dedup = SignalDeduplicator(window_seconds=3600, refresh_seconds=300)
+
+    first = dedup.collapse(_poll(0) + _poll(5))
+    assert len(first) == 3
+    assert [signal.metadata["occurrence_count"] for signal in first] == [2, 2, 2]
+    assert all(signal.detected_at == _START for signal in first)
+    assert first[0].metadata["last_seen"] == (_START + timedelta(seconds=5)).isoformat()
+
+    assert sum(len(dedup.collapse(_poll(offset))) for offset in range(30, 300, 30)) == 0
+
+    refreshed = dedup.collapse(_poll(305, severity=4))
+    assert [signal.metadata["occurrence_count"] for signal in refreshed] == [12, 12, 12]
+    assert refreshed[0].severity == 4
+    assert build_finding(refreshed[0]).finding_uid == build_finding(first[0]).finding_uid
+
+    stats = dedup.stats()
+    assert (stats.received, stats.collapsed, stats.emitted) == (36, 33, 6)
+
+
+def test_expired_window_flushes_final_counts_and_starts_a_new_finding() -> None:
+    dedup = SignalDeduplicator(window_seconds=600, refresh_seconds=600)
+    dedup.collapse(_poll(0, assets=1))
+    assert dedup.collapse(_poll(60, assets=1)) == []
+
+    emitted = dedup.collapse(_poll(600, assets=1))
+    assert [(signal.detected_at, signal.metadata["occurrence_count"]) for signal in emitted] == [
+        (_START, 2),
+        (_START + timedelta(seconds=600), 1),
+    ]
+    assert dedup.stats().tracked_keys == 1
+
+
+def test_tracked_keys_are_bounded() -> None:
+    dedup = SignalDeduplicator(window_seconds=3600, max_keys=5)
+
+    assert len(dedup.collapse(_poll(0, assets=12))) == 12
+    stats = dedup.stats()
+    assert (stats.tracked_keys, stats.evicted) == (5, 7)
+    assert len(dedup.collapse(_poll(1, assets=12))) == 7
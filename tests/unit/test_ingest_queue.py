@@ -0,0 +1,109 @@
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+from saastesa.api.ingest_queue import BatchState, IngestQueueFullError, WriteBehindIngestor
+from saastesa.api.main import create_app
+from saastesa.core.models import SecurityFinding, ThreatSignal
+
+
+class RecordingStore:
+    def __init__(self, poison_source: str | None = None) -> None:
+        self.calls: list[list[SecurityFinding]] = []
+        self.poison_source = poison_source
+
+    def add(self, findings: list[SecurityFinding]) -> None:
+        if any(finding.source == self.poison_source for finding in findings):
+            raise RuntimeError("poisoned batch")
+        self.calls.append(findings)
+
+
+def _signal(source: str, index: int) -> ThreatSignal:
+    return ThreatSignal(source, f"signal_{index}", 3, datetime(2026, 1, 1, tzinfo=UTC), {})
+
+
+def _wait_for(predicate: Callable[[], bool], timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return
+        time.sleep(0.01)
+    raise AssertionError("condition not met in time")
+
+
+def test_queued_batches_are_group_committed() -> None:
+    store = RecordingStore()
+    ingestor = WriteBehindIngestor(store, max_group_wait_seconds=0.2)
+    statuses = [ingestor.submit_signals([_signal("iam", index)]) for index in range(3)]
+    assert ingestor.stats().depth == 3
+
+    ingestor.start()
+    ingestor.stop()
+
+    assert len(store.calls) == 1
+    assert len(store.calls[0]) == 3
+    for status in statuses:
+        current = ingestor.status(status.batch_id)
+        assert current is not None and current.state == BatchState.COMMITTED
+    assert ingestor.stats().group_commits == 1
+
+
+def test_failed_group_is_retried_per_batch() -> None:
+    store = RecordingStore(poison_source="bad")
+    ingestor = WriteBehindIngestor(store, max_group_wait_seconds=0.2)
+    good = ingestor.submit_signals([_signal("iam", 1)])
+    bad = ingestor.submit_signals([_signal("bad", 2)])
+
+    ingestor.start()
+    ingestor.stop()
+
+    committed = ingestor.status(good.batch_id)
+    assert committed is not None and committed.state == BatchState.COMMITTED
+    failed = ingestor.status(bad.batch_id)
+    assert failed is not None and failed.state == BatchState.FAILED
+    assert failed.error == "poisoned batch"
+    assert ingestor.stats().batches_failed == 1
+
+
+def test_full_queue_rejects_new_batches() -> None:
+    ingestor = WriteBehindIngestor(RecordingStore(), max_queued_batches=1)
+    ingestor.submit_signals([_signal("iam", 1)])
+
+    with pytest.raises(IngestQueueFullError):
+        ingestor.submit_signals([_signal("iam", 2)])
+
+
+@pytest.mark.parametrize("database_url", [None, "sqlite+aiosqlite:///:memory:"])
+def test_async_ingest_mode_returns_accepted_batch(
+    monkeypatch: pytest.MonkeyPatch, database_url: str | None
+) -> None:
+    if database_url is not None:
+        pytest.importorskip("aiosqlite")
+    monkeypatch.setenv("TESA_INGEST_MODE", "async")
+    with TestClient(create_app(database_url)) as client:
+        payload = {
+            "signals": [
+                {
+                    "source": "iam",
+                    "signal_type": "stale_admin_credential",
+                    "severity": 5,
+                    "detected_at": datetime.now(tz=UTC).isoformat(),
+                    "metadata": {},
+                }
+            ]
+        }
+        response = client.post("/api/v1/signals", json=payload)
+        assert response.status_code == 202
+        batch_id = response.json()["batch_id"]
+
+        def committed() -> bool:
+            status = client.get(f"/api/v1/ingest/batches/{batch_id}").json()
+            return bool(status["status"] == "committed")
+
+        _wait_for(committed)
+        assert len(client.get("/api/v1/findings").json()) == 1
+        assert client.get("/api/v1/metrics").json()["ingest_queue"]["batches_committed"] == 1
+        assert client.get("/api/v1/ingest/batches/unknown").status_code == 404
@@ -0,0 +1,118 @@
+import json
+import os
+import pickle
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from saastesa.core.contracts import FindingDomain, JSONValue
+from saastesa.core.models import ThreatSignal
+from saastesa.core.policy import (
+    DEFAULT_POLICY,
+    PolicyError,
+    PolicyReloader,
+    compile_policy,
+    load_policy,
+)
+from saastesa.core.risk_scoring import build_finding, build_findings
+from saastesa.pipelines.analyze import AnalysisOptions, analyze_signals
+
+_POLICY_YAML = """
+name: crown-jewels
+cap: 9
+severity_weights: {1: 2}
+factors:
+  - {name: exposed, field: internet_exposed, multiply: 2}
+  - {name: tier, field: asset_tier, op: in, value: [crown_jewel, regulated], add: 3}
+  - {name: cvss, field: cvss, op: gte, value: 9.0, add: 1}
+domains:
+  Okta: identity
+categories:
+  identity: Workforce Identity
+default_category: Other Security
+"""
+
+
+def _signal(source: str, severity: int, metadata: dict[str, JSONValue]) -> ThreatSignal:
+    return ThreatSignal(
+        source=source,
+        signal_type="policy_check",
+        severity=severity,
+        detected_at=datetime(2026, 4, 1, tzinfo=UTC),
+        metadata=metadata,
+    )
+
+
+def test_default_policy_keeps_the_builtin_formula() -> None:
+    for severity in range(1, 6):
+        for exposed in (False, True):
+            for privileged in (False, True):
+                metadata: dict[str, JSONValue] = {
+                    "internet_exposed": exposed,
+                    "privileged_access": privileged,
+                }
+                expected = min(severity * (2 if exposed else 1) * (2 if privileged else 1), 10)
+                assert DEFAULT_POLICY.score(severity, metadata) == expected
+
+
+def test_yaml_policy_drives_scores_domains_and_categories(tmp_path: Path) -> None:
+    path = tmp_path / "policy.yaml"
+    path.write_text(_POLICY_YAML)
+    policy = load_policy(path)
+
+    identity = build_finding(_signal("okta", 1, {"internet_exposed": True}), policy)
+    assert (identity.risk_score, identity.domain) == (40, FindingDomain.IDENTITY)
+    assert identity.category_name == "Workforce Identity"
+
+    jewel = _signal("cspm", 3, {"asset_tier": "crown_jewel", "cvss": 9.8})
+    capped = _signal("cspm", 4, {"internet_exposed": True, "asset_tier": "regulated"})
+    untouched = _signal("cspm", 2, {"cvss": "9.8", "asset_tier": "internal"})
+    findings = build_findings([jewel, capped, untouched], policy)
+    assert [finding.risk_score for finding in findings] == [70, 90, 20]
+    assert findings[0].domain == FindingDomain.OTHER
+    assert findings[0].category_name == "Other Security"
+    assert findings == [build_finding(signal, policy) for signal in (jewel, capped, untouched)]
+
+
+def test_invalid_policy_is_rejected() -> None:
+    with pytest.raises(PolicyError, match="exactly one of 'multiply' or 'add'"):
+        compile_policy({"factors": [{"name": "x", "field": "x", "multiply": 2, "add": 1}]})
+    with pytest.raises(PolicyError, match="floor"):
+        compile_policy({"floor": 8, "cap": 5})
+    with pytest.raises(PolicyError, match="unknown_key"):
+        compile_policy({"unknown_key": 1})
+
+
+def test_policy_survives_pickling_for_worker_processes() -> None:
+    policy = compile_policy({"name": "flat", "factors": [{"name": "x", "field": "x", "add": 4}]})
+    restored = pickle.loads(pickle.dumps(policy))
+
+    assert (restored.name, restored.digest) == (policy.name, policy.digest)
+    assert restored.score(3, {"x": True}) == policy.score(3, {"x": True}) == 7
+    signals = [_signal("sast", index % 5 + 1, {"x": index % 2 == 0}) for index in range(30)]
+    options = AnalysisOptions(workers=2, chunk_size=8, parallel_threshold=0, policy=policy)
+    assert analyze_signals(signals, options) == build_findings(signals, policy)
+
+
+def test_reloader_swaps_policy_and_keeps_last_good_one(tmp_path: Path) -> None:
+    path = tmp_path / "policy.json"
+    path.write_text(json.dumps({"name": "v1", "cap": 4}))
+    reloader = PolicyReloader(path, check_interval_seconds=0)
+    assert reloader.current().name == "v1"
+
+    _rewrite(path, json.dumps({"name": "v2", "cap": 6}))
+    assert reloader.current().name == "v2"
+    assert reloader.current().score(5, {}) == 5
+
+    _rewrite(path, "{not json")
+    assert reloader.current().name == "v2"
+    stats = reloader.stats()
+    assert (stats.reloads, stats.failures) == (1, 1)
+    assert stats.last_error is not None and "Invalid JSON" in stats.last_error
+
+
+def _rewrite(path: Path, text: str) -> None:
+    before = path.stat().st_mtime_ns
+    path.write_text(text)
+    os.utime(path, ns=(before + 1_000_000_000, before + 1_000_000_000))
@@ -0,0 +1,365 @@
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, replace
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy import func, select, update
+from sqlalchemy.exc import IntegrityError
+
+from saastesa.api.db import create_async_db_engine, create_db_engine
+from saastesa.api.db_models import (
+    FindingReferenceItemRecord,
+    FindingResourceRecord,
+    FindingSummaryCounterRecord,
+    SecurityFindingRecord,
+)
+from saastesa.api.queries import AnalyticsDimension, FindingFilters, TimeBucket
+from saastesa.api.repository import AsyncSQLAlchemyFindingStore, SQLAlchemyFindingStore
+from saastesa.api.schemas import SecurityFindingOut
+from saastesa.core import serialization
+from saastesa.core.contracts import FindingDomain, FindingSeverity, FindingStatus
+from saastesa.core.models import FindingReferences, SecurityFinding, ThreatSignal
+from saastesa.core.risk_scoring import build_finding, summarize_scores
+from saastesa.core.serialization import dumps_json
+
+
+def _store() -> SQLAlchemyFindingStore:
+    store = SQLAlchemyFindingStore(create_db_engine("sqlite+pysqlite:///:memory:"))
+    store.init()
+    return store
+
+
+def _finding(index: int, asset: int = 0, severity: int = 3, **metadata: object) -> SecurityFinding:
+    signal = ThreatSignal(
+        source="cspm",
+        signal_type=f"signal_{index}",
+        severity=severity,
+        detected_at=datetime(2026, 1, 1, tzinfo=UTC) + timedelta(minutes=index),
+        metadata={"asset_id": f"asset-{asset}", **metadata},
+    )
+    return build_finding(signal)
+
+
+def _count(store: SQLAlchemyFindingStore, model: type) -> int:
+    with store.engine.connect() as connection:
+        return int(connection.scalar(select(func.count()).select_from(model)) or 0)
+
+
+def test_bulk_add_shares_resources_across_batch() -> None:
+    store = _store()
+    findings = [_finding(index, asset=index % 3, cve=["CVE-2026-0001"]) for index in range(1200)]
+
+    store.add(findings)
+
+    assert _count(store, SecurityFindingRecord) == 1200
+    assert _count(store, FindingResourceRecord) == 3
+    assert _count(store, FindingReferenceItemRecord) == 1200
+    assert len(store.list(limit=5000)) == 1200
+
+
+def test_bulk_add_upserts_existing_findings() -> None:
+    store = _store()
+    original = _finding(1, severity=2, cwe=["CWE-79", "CWE-89"])
+    store.add([original])
+
+    updated = replace(
+        original,
+        risk_score=90,
+        references=FindingReferences(
+            cve=("CVE-2026-0002",), cwe=("CWE-89",), owasp=(), mitre_attack=()
+        ),
+    )
+    store.add([updated, _finding(2, asset=1)])
+
+    assert _count(store, SecurityFindingRecord) == 2
+    stored = {finding.finding_uid: finding for finding in store.list(limit=10)}
+    assert stored[original.finding_uid].risk_score == 90
+    assert stored[original.finding_uid].references.cve == ("CVE-2026-0002",)
+    assert stored[original.finding_uid].references.cwe == ("CWE-89",)
+
+
+def test_bulk_add_keeps_last_duplicate_in_batch() -> None:
+    store = _store()
+    first = _finding(1)
+    store.add([first, replace(first, title="second report")])
+
+    findings = store.list(limit=10)
+    assert len(findings) == 1
+    assert findings[0].title == "second report"
+
+
+def test_summary_aggregates_in_sql_with_shared_thresholds() -> None:
+    store = _store()
+    findings = [
+        replace(_finding(index), risk_score=score)
+        for index, score in enumerate([10, 30, 31, 60, 61, 80, 81, 100, 100])
+    ]
+    store.add(findings)
+
+    assert store.summary() == summarize_scores(findings)
+    assert store.summary() == {"low": 2, "medium": 2, "high": 2, "critical": 3}
+
+
+def _counters(store: SQLAlchemyFindingStore) -> dict[tuple[str, str, str], int]:
+    statement = select(
+        FindingSummaryCounterRecord.risk_band,
+        FindingSummaryCounterRecord.domain,
+        FindingSummaryCounterRecord.status,
+        FindingSummaryCounterRecord.finding_count,
+    ).where(FindingSummaryCounterRecord.finding_count != 0)
+    with store.engine.connect() as connection:
+        rows = connection.execute(statement)
+        return {(band, domain, status): count for band, domain, status, count in rows}
+
+
+def test_summary_counters_follow_upserts_between_bands() -> None:
+    store = _store()
+    finding = replace(_finding(1), risk_score=20)
+    store.add([finding, replace(_finding(2), risk_score=95)])
+    assert store.summary() == {"low": 1, "medium": 0, "high": 0, "critical": 1}
+
+    store.add([replace(finding, risk_score=70, status=FindingStatus.RESOLVED)])
+
+    assert store.summary() == {"low": 0, "medium": 0, "high": 1, "critical": 1}
+    assert store.summary(status=FindingStatus.RESOLVED)["high"] == 1
+    assert store.summary(status=FindingStatus.OPEN)["critical"] == 1
+    assert sum(store.summary(domain=FindingDomain.APPLICATION).values()) == 0
+
+
+def test_rebuild_summary_counters_repairs_drift() -> None:
+    store = _store()
+    findings = [replace(_finding(index), risk_score=index * 10) for index in range(1, 11)]
+    store.add(findings)
+    with store.engine.begin() as connection:
+        connection.execute(update(FindingSummaryCounterRecord).values(finding_count=0))
+    assert sum(store.summary().values()) == 0
+
+    assert store.rebuild_summary_counters() == 10
+    assert store.summary() == summarize_scores(findings)
+
+
+def test_summary_counters_match_group_by_after_overlapping_writes(tmp_path: Path) -> None:
+    store = SQLAlchemyFindingStore(create_db_engine(f"sqlite+pysqlite:///{tmp_path / 'race.db'}"))
+    store.init()
+    findings = [_finding(index) for index in range(40)]
+    writers = 6
+    start = threading.Barrier(writers)
+
+    def write(worker: int) -> None:
+        start.wait()
+        for offset in range(0, len(findings), 5):
+            chunk = findings[offset : offset + 5]
+            store.add([replace(finding, risk_score=(worker * 17) % 100) for finding in chunk])
+
+    with ThreadPoolExecutor(writers) as pool:
+        list(pool.map(write, range(writers)))
+
+    counters = _counters(store)
+    assert sum(counters.values()) == _count(store, SecurityFindingRecord) == len(findings)
+    store.rebuild_summary_counters()
+    assert counters == _counters(store)
+
+
+def test_list_page_walks_history_with_keyset_cursor() -> None:
+    store = _store()
+    shared_time = datetime(2026, 2, 1, tzinfo=UTC)
+    findings = [replace(_finding(index), time=shared_time) for index in range(5)]
+    findings += [_finding(index) for index in range(5, 12)]
+    store.add(findings)
+
+    seen: list[str] = []
+    page = store.list_page(limit=5)
+    while True:
+        seen.extend(finding.finding_uid for finding in reversed(page.findings))
+        if page.next_cursor is None:
+            break
+        page = store.list_page(limit=5, cursor=page.next_cursor)
+
+    assert len(seen) == len(set(seen)) == 12
+    assert set(seen) == {finding.finding_uid for finding in findings}
+
+
+def test_list_page_applies_filters() -> None:
+    store = _store()
+    store.add(
+        [_finding(index, severity=5 if index % 2 else 2, status="resolved") for index in range(10)]
+        + [_finding(index) for index in range(10, 14)]
+    )
+
+    resolved = store.list(limit=100, filters=FindingFilters(status=FindingStatus.RESOLVED))
+    assert len(resolved) == 10
+    critical = store.list(limit=100, filters=FindingFilters(severity=FindingSeverity.CRITICAL))
+    assert len(critical) == 5
+
+    window = FindingFilters(
+        since=datetime(2026, 1, 1, 0, 2, tzinfo=UTC),
+        until=datetime(2026, 1, 1, 0, 6, tzinfo=UTC),
+    )
+    windowed = store.list(limit=100, filters=window)
+    assert [finding.time.minute for finding in windowed] == [2, 3, 4, 5]
+    assert store.list(limit=100, filters=FindingFilters(source="iam")) == []
+
+
+def test_count_by_groups_whole_table() -> None:
+    store = _store()
+    store.add(
+        [_finding(index, domain="cloud") for index in range(3)]
+        + [_finding(index, domain="identity") for index in range(3, 8)]
+    )
+
+    assert store.count_by(AnalyticsDimension.DOMAIN) == [("identity", 5), ("cloud", 3)]
+    assert store.count_by(AnalyticsDimension.SOURCE) == [("cspm", 8)]
+    cloud_only = FindingFilters(domain=FindingDomain.CLOUD)
+    assert store.count_by(AnalyticsDimension.SEVERITY, cloud_only) == [("medium", 3)]
+
+
+def test_histogram_buckets_by_hour_day_and_week() -> None:
+    store = _store()
+    monday = datetime(2026, 3, 2, 10, 30, tzinfo=UTC)
+    offsets = [
+        timedelta(0),
+        timedelta(minutes=20),
+        timedelta(hours=2),
+        timedelta(days=6),
+        timedelta(days=7),
+    ]
+    store.add(
+        [replace(_finding(index), time=monday + offset) for index, offset in enumerate(offsets)]
+    )
+
+    hourly = store.histogram(TimeBucket.HOUR)
+    assert hourly[0] == (datetime(2026, 3, 2, 10, tzinfo=UTC), 2)
+    assert len(hourly) == 4
+
+    daily = store.histogram(TimeBucket.DAY, FindingFilters(until=monday + timedelta(days=1)))
+    assert daily == [(datetime(2026, 3, 2, tzinfo=UTC), 3)]
+
+    weekly = store.histogram(TimeBucket.WEEK)
+    assert weekly == [
+        (datetime(2026, 3, 2, tzinfo=UTC), 4),
+        (datetime(2026, 3, 9, tzinfo=UTC), 1),
+    ]
+
+
+def test_resource_cache_skips_lookups_and_forgets_failed_batches() -> None:
+    store = SQLAlchemyFindingStore(
+        create_db_engine("sqlite+pysqlite:///:memory:"), resource_cache_size=2
+    )
+    store.init()
+    store.add([_finding(index, asset=index % 3) for index in range(6)])
+    stats = store.resource_cache_stats()
+    assert (stats.size, stats.misses, stats.hits, stats.evictions) == (2, 3, 0, 1)
+
+    store.add([_finding(10, asset=1), _finding(11, asset=2)])
+    assert store.resource_cache_stats().hits == 2
+
+    broken = replace(_finding(12, asset=2), title=None)  # type: ignore[arg-type]
+    with pytest.raises(IntegrityError):
+        store.add([broken])
+    assert store.resource_cache_stats().size == 1
+
+
+def test_reingest_diffs_reference_items_instead_of_rewriting() -> None:
+    store = _store()
+    finding = _finding(1, cve=["CVE-2026-0001"], cwe=["CWE-79"], mitre_attack=["T1190"])
+    store.add([finding])
+
+    def item_ids() -> dict[str, int]:
+        with store.engine.connect() as connection:
+            rows = connection.execute(
+                select(FindingReferenceItemRecord.reference_value, FindingReferenceItemRecord.id)
+            )
+            return {value: item_id for value, item_id in rows}
+
+    before = item_ids()
+    store.add([finding])
+    assert item_ids() == before
+
+    store.add(
+        [
+            replace(
+                finding,
+                references=replace(finding.references, cwe=(), owasp=("A03:2021",)),
+            )
+        ]
+    )
+    after = item_ids()
+    assert set(after) == {"CVE-2026-0001", "T1190", "A03:2021"}
+    assert after["CVE-2026-0001"] == before["CVE-2026-0001"]
+    assert after["T1190"] == before["T1190"]
+
+
+def test_iter_findings_streams_every_match_in_time_order() -> None:
+    store = _store()
+    store.add([_finding(index, asset=index % 4, cve=["CVE-2026-0001"]) for index in range(25)])
+
+    streamed = list(store.iter_findings(batch_size=4))
+    assert [finding.time.minute for finding in streamed] == list(range(25))
+    assert all(finding.references.cve == ("CVE-2026-0001",) for finding in streamed)
+
+    window = FindingFilters(until=datetime(2026, 1, 1, 0, 10, tzinfo=UTC))
+    assert len(list(store.iter_findings(window, batch_size=3))) == 10
+
+
+def test_document_page_matches_model_serialization(monkeypatch: pytest.MonkeyPatch) -> None:
+    store = _store()
+    store.add(
+        [_finding(index, asset=index % 2, cve=["CVE-2026-0001"], note="café") for index in range(6)]
+    )
+
+    page = store.list_documents_page(limit=4)
+    encoded = dumps_json(page.documents)
+    expected = [
+        SecurityFindingOut.model_validate(asdict(finding)).model_dump(mode="json")
+        for finding in store.list_page(limit=4).findings
+    ]
+    assert json.loads(encoded) == expected
+    assert page.next_cursor == store.list_page(limit=4).next_cursor
+
+    monkeypatch.setattr(serialization, "orjson", None)
+    assert dumps_json(page.documents) == encoded
+
+
+def test_data_version_advances_on_every_write() -> None:
+    store = _store()
+    initial = store.data_version()
+    assert initial.version == 0
+    assert initial.updated_at.tzinfo is not None
+
+    store.add([_finding(1)])
+    store.add([])
+    assert store.data_version().version == 1
+
+    store.rebuild_summary_counters()
+    assert store.data_version().version == 2
+
+
+def test_async_store_matches_sync_store() -> None:
+    pytest.importorskip("aiosqlite")
+    findings = [_finding(index, asset=index % 3, cve=["CVE-2026-0001"]) for index in range(12)]
+    sync_store = _store()
+    sync_store.add(findings)
+
+    async def exercise() -> None:
+        store = AsyncSQLAlchemyFindingStore(create_async_db_engine("sqlite+aiosqlite:///:memory:"))
+        await store.init()
+        await store.add(findings)
+        try:
+            assert await store.summary() == sync_store.summary()
+            assert (await store.list_page(limit=5)) == sync_store.list_page(limit=5)
+            page = await store.list_documents_page(limit=5)
+            assert page.documents == sync_store.list_documents_page(limit=5).documents
+            dimension = AnalyticsDimension.SEVERITY
+            assert await store.count_by(dimension) == sync_store.count_by(dimension)
+            assert (await store.data_version()).version == 1
+            streamed = [finding async for finding in store.iter_findings(batch_size=4)]
+            assert streamed == list(sync_store.iter_findings(batch_size=4))
+            assert store.resource_cache_stats().size == 3
+        finally:
+            await store.close()
+
+    asyncio.run(exercise())
@@ -1,7 +1,92 @@
-from datetime import UTC, datetime
+import random
+from datetime import UTC, datetime, timedelta
+from uuid import NAMESPACE_URL, uuid5
 
-from saastesa.core.models import ThreatSignal
-from saastesa.core.risk_scoring import build_finding, compute_risk_score, summarize_scores
+from saastesa.core.contracts import (
+    CURRENT_FINDING_SCHEMA_VERSION,
+    FindingActivity,
+    FindingClass,
+    FindingDomain,
+    FindingSeverity,
+    FindingStandard,
+    FindingStatus,
+    JSONValue,
+)
+from saastesa.core.models import FindingReferences, FindingResource, SecurityFinding, ThreatSignal
+from saastesa.core.risk_scoring import (
+    build_finding,
+    build_findings,
+    compute_risk_score,
+    summarize_scores,
+)
+
+
+def _reference_finding(signal: ThreatSignal) -> SecurityFinding:
+    metadata = signal.metadata
+    severity_id = max(1, min(signal.severity, 5))
+    exposure = 2 if metadata.get("internet_exposed") else 1
+    privileged = 2 if metadata.get("privileged_access") else 1
+    explicit_domain = str(metadata.get("domain", "")).strip().lower()
+    if explicit_domain:
+        try:
+            domain = FindingDomain(explicit_domain)
+        except ValueError:
+            domain = FindingDomain.OTHER
+    elif signal.source.lower() in {"sast", "dast", "sca", "cicd", "code"}:
+        domain = FindingDomain.APPLICATION
+    elif signal.source.lower() in {"iam", "cloud", "cspm", "k8s", "host", "network"}:
+        domain = FindingDomain.INFRASTRUCTURE
+    else:
+        domain = FindingDomain.OTHER
+    try:
+        status = FindingStatus(str(metadata.get("status", "open")).strip().lower())
+    except ValueError:
+        status = FindingStatus.OPEN
+    categories = {
+        FindingDomain.APPLICATION: "Application Security",
+        FindingDomain.INFRASTRUCTURE: "Infrastructure Security",
+        FindingDomain.IDENTITY: "Identity Security",
+        FindingDomain.CLOUD: "Cloud Security",
+        FindingDomain.CONTAINER: "Container Security",
+    }
+    labels = ["informational", "low", "medium", "high", "critical"]
+    detected = f"{signal.source}:{signal.signal_type}:{signal.detected_at.isoformat()}"
+    return SecurityFinding(
+        finding_uid=str(uuid5(NAMESPACE_URL, detected)),
+        standard=FindingStandard.OCSF,
+        schema_version=CURRENT_FINDING_SCHEMA_VERSION,
+        status=status,
+        severity_id=severity_id,
+        severity=FindingSeverity(labels[severity_id - 1]),
+        risk_score=min(severity_id * exposure * privileged, 10) * 10,
+        title=str(metadata.get("title", f"{signal.source}:{signal.signal_type}")),
+        description=str(
+            metadata.get(
+                "description",
+                "Derived finding from normalized threat signal and context risk factors.",
+            )
+        ),
+        category_name=categories.get(domain, "Security Operations"),
+        class_name=FindingClass.SECURITY_FINDING,
+        type_name=str(metadata.get("type_name", signal.signal_type.replace("_", " ").title())),
+        domain=domain,
+        activity_name=FindingActivity.CREATE,
+        time=signal.detected_at,
+        source=signal.source,
+        resource=FindingResource(
+            uid=str(metadata.get("asset_id", signal.source)),
+            name=str(metadata.get("asset_name", signal.source)),
+            type=str(metadata.get("asset_type", "service")),
+            platform=str(metadata.get("platform", "saas")),
+        ),
+        references=FindingReferences(
+            cve=tuple(metadata.get("cve", [])),
+            cwe=tuple(metadata.get("cwe", [])),
+            owasp=tuple(metadata.get("owasp", [])),
+            mitre_attack=tuple(metadata.get("mitre_attack", [])),
+        ),
+        raw_data=metadata,
+    )
 
 
 def test_compute_risk_score_caps_at_ten() -> None:
@@ -45,3 +130,61 @@ def test_build_finding_is_ocsf_aligned() -> None:
     assert finding.domain == "application"
     assert finding.risk_score > 0
     assert "CWE-89" in finding.references.cwe
+
+
+def test_build_findings_matches_the_per_signal_formula() -> None:
+    rng = random.Random(17)
+    sources = ["iam", "SAST", "cspm", "k8s", "vendor", "code", "network"]
+    domains: list[JSONValue] = ["", "Application", " identity ", "bogus", ["cloud"], 3, "OTHER"]
+    statuses: list[JSONValue] = ["open", "Resolved", " suppressed ", "unknown", None, 2]
+    start = datetime(2026, 1, 1, tzinfo=UTC)
+    signals: list[ThreatSignal] = []
+    for index in range(2000):
+        metadata: dict[str, JSONValue] = {
+            "internet_exposed": rng.choice([True, False, 1, 0, "yes", "", None]),
+            "privileged_access": rng.choice([True, False, 1, None]),
+        }
+        if rng.random() < 0.6:
+            metadata["domain"] = rng.choice(domains)
+        if rng.random() < 0.5:
+            metadata["status"] = rng.choice(statuses)
+        if rng.random() < 0.3:
+            metadata.update(asset_id=f"asset-{index % 7}", cve=["CVE-2026-0001"], title="t")
+        signals.append(
+            ThreatSignal(
+                source=rng.choice(sources),
+                signal_type=f"signal_{index % 50}",
+                severity=rng.randint(-1, 7),
+                detected_at=start + timedelta(seconds=index),
+                metadata=metadata,
+            )
+        )
+
+    expected = [_reference_finding(signal) for signal in signals]
+    assert build_findings(signals) == expected
+    assert [build_finding(signal) for signal in signals[:50]] == expected[:50]
+
+
+def test_build_findings_matches_the_per_signal_formula_on_metadata_edge_cases() -> None:
+    detected_at = datetime(2026, 1, 1, tzinfo=UTC)
+    edge_cases: list[dict[str, JSONValue]] = [
+        {"type_name": None, "title": None, "status": None, "domain": None},
+        {},
+        {"type_name": 7, "title": 3.5, "asset_id": 42, "status": ["open"], "domain": ["cloud"]},
+        {"type_name": "Custom", "status": " Resolved ", "domain": " Identity "},
+    ]
+    signals = [
+        ThreatSignal("iam", "stale_key", 3, detected_at, metadata) for metadata in edge_cases
+    ]
+
+    findings = build_findings(signals)
+
+    assert findings == [_reference_finding(signal) for signal in signals]
+    assert [finding.type_name for finding in findings] == ["None", "Stale Key", "7", "Custom"]
+    titles = ["None", "iam:stale_key", "3.5", "iam:stale_key"]
+    assert [finding.title for finding in findings] == titles
+    assert findings[2].resource.uid == "42"
+    assert [finding.status for finding in findings] == ["open", "open", "open", "resolved"]
+    domains = ["other", "infrastructure", "other", "identity"]
+    assert [finding.domain for finding in findings] == domains
+    assert len({finding.finding_uid for finding in findings}) == 1
@@ -1,10 +1,18 @@
 import json
-from datetime import UTC, datetime
+from datetime import UTC, date, datetime
+from pathlib import Path
 
-from sqlalchemy import inspect, text
+import pytest
+from sqlalchemy import inspect, select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateTable
 
 from saastesa.api.db import create_db_engine
+from saastesa.api.db_models import FindingReferenceItemRecord
+from saastesa.api.migrations import _expired_months, _partitioned_tables, month_start
 from saastesa.api.repository import SQLAlchemyFindingStore
+from saastesa.core.models import ThreatSignal
+from saastesa.core.risk_scoring import build_finding
 
 
 def test_migrates_legacy_security_findings_schema(tmp_path) -> None:
@@ -96,7 +104,8 @@ def test_migrates_legacy_security_findings_schema(tmp_path) -> None:
     assert "security_findings_legacy" not in inspector.get_table_names()
     assert "finding_resources" in inspector.get_table_names()
     assert "finding_reference_items" in inspector.get_table_names()
-    assert "resource_id" in {column["name"] for column in inspector.get_columns("security_findings")}
+    finding_columns = inspector.get_columns("security_findings")
+    assert "resource_id" in {column["name"] for column in finding_columns}
 
     findings = store.list(limit=10)
     assert len(findings) == 1
@@ -106,3 +115,65 @@ def test_migrates_legacy_security_findings_schema(tmp_path) -> None:
     assert finding.resource.uid == "res-1"
     assert finding.references.cve == ("CVE-2026-0001",)
     assert finding.references.cwe == ("CWE-269",)
+    assert store.summary() == {"low": 0, "medium": 0, "high": 0, "critical": 1}
+
+
+def test_adds_finding_time_to_existing_reference_items(tmp_path: Path) -> None:
+    engine = create_db_engine(f"sqlite+pysqlite:///{tmp_path / 'references.db'}")
+    store = SQLAlchemyFindingStore(engine)
+    store.init()
+    detected_at = datetime(2026, 2, 3, 4, 5, tzinfo=UTC)
+    store.add(
+        [
+            build_finding(
+                ThreatSignal(
+                    source="cspm",
+                    signal_type="public_bucket",
+                    severity=4,
+                    detected_at=detected_at,
+                    metadata={"cve": ["CVE-2026-0001"]},
+                )
+            )
+        ]
+    )
+    with engine.begin() as connection:
+        connection.execute(text("ALTER TABLE finding_reference_items DROP COLUMN finding_time"))
+
+    store.init()
+
+    with engine.connect() as connection:
+        stored = connection.scalars(select(FindingReferenceItemRecord.finding_time)).all()
+    assert [value.replace(tzinfo=UTC) for value in stored if value is not None] == [detected_at]
+
+
+def test_partitioned_layout_keys_include_partition_column() -> None:
+    findings, references = _partitioned_tables("_staging")
+    findings_ddl = str(CreateTable(findings).compile(dialect=postgresql.dialect()))
+    references_ddl = str(CreateTable(references).compile(dialect=postgresql.dialect()))
+
+    assert "PARTITION BY RANGE (time)" in findings_ddl
+    assert "PRIMARY KEY (id, time)" in findings_ddl
+    assert "UNIQUE (finding_uid, time)" in findings_ddl
+    assert "id SERIAL NOT NULL" in findings_ddl
+    assert "PARTITION BY RANGE (finding_time)" in references_ddl
+    assert "REFERENCES security_findings_staging (id, time) ON DELETE CASCADE" in references_ddl
+    assert {index.name for index in findings.indexes} >= {
+        "ix_security_findings_part_time",
+        "ix_security_findings_part_finding_uid",
+    }
+
+
+def test_retention_only_expires_whole_months() -> None:
+    months = [date(2025, 11, 1), date(2025, 12, 1), date(2026, 1, 1)]
+
+    assert _expired_months(months, datetime(2026, 1, 1, tzinfo=UTC)) == months[:2]
+    assert _expired_months(months, datetime(2025, 12, 31, 23, tzinfo=UTC)) == months[:1]
+    assert month_start(datetime(2026, 3, 31, 23, 30, tzinfo=UTC)) == date(2026, 3, 1)
+
+
+def test_partition_retention_requires_partitioned_layout() -> None:
+    store = SQLAlchemyFindingStore(create_db_engine("sqlite+pysqlite:///:memory:"))
+    store.init()
+
+    with pytest.raises(RuntimeError, match="TESA_DB_PARTITIONING"):
+        store.drop_expired_partitions(datetime.now(tz=UTC))